@@ -1,6 +1,15 @@
 import typer
 
-from commands import default_energy_costs, marketers, rate_type, rates, token, user
+from commands import (
+    benchmarks,
+    default_energy_costs,
+    marketers,
+    rate_type,
+    rates,
+    sips,
+    token,
+    user,
+)
 
 app = typer.Typer(help="Awesome CLI command manager.")
 
@@ -13,4 +22,6 @@ if __name__ == "__main__":
     app.add_typer(marketers.app, name="marketer")
     app.add_typer(rates.app, name="rate")
     app.add_typer(default_energy_costs.app, name="default_energy_costs")
+    app.add_typer(sips.app, name="sips")
+    app.add_typer(benchmarks.app, name="benchmark")
     app()
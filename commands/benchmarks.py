@@ -0,0 +1,290 @@
+import asyncio
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Callable, Iterator, List
+
+import httpx
+import typer
+import uvicorn
+from fastapi_pagination import Params
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from config.settings import settings
+from src.infrastructure.cache.tokens import token_cache
+from src.infrastructure.sqlalchemy.database import engine
+from src.infrastructure.sqlalchemy.pagination import Explain
+from src.infrastructure.sqlalchemy.sips import delete_sips_cache_entries
+from src.infrastructure.sqlalchemy.supply_points import delete_supply_point_consumptions
+from src.modules.clients.models import Client
+from src.modules.clients.schemas import ClientFilter
+from src.modules.rates.models import Rate
+from src.modules.rates.schemas import RateUpdateDetailListResponse
+from src.modules.saving_studies.models import SavingStudy, SuggestedRate
+from src.modules.saving_studies.schemas import SavingStudyOutput, SuggestedRateResponse
+from src.modules.sips.models import SipsCacheEntry
+from src.modules.users.models import Token, User
+from src.services.common import create_page_response
+from src.services.sips import fill_study_with_sips
+from src.sips.emulator import PATH, SIPSFixtures, create_app
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import ReaderException, SIPSTypes
+from src.sips.refresh import split_in_chunks
+
+app = typer.Typer(help="Benchmark commands.")
+
+
+def report(name: str, timings: List[float]) -> None:
+    """
+    Print the latency mean and percentiles of the timings in ms.
+    """
+    timings = sorted(timings)
+    p95 = timings[min(len(timings) - 1, int(len(timings) * 0.95))]
+    typer.echo(
+        f"{name}: {len(timings)} runs, mean {statistics.mean(timings) * 1000:.1f} ms, "
+        f"p50 {statistics.median(timings) * 1000:.1f} ms, p95 {p95 * 1000:.1f} ms"
+    )
+
+
+def measure(function: Callable, *args) -> float:
+    started_at = time.perf_counter()
+    function(*args)
+    return time.perf_counter() - started_at
+
+
+def random_cups(count: int) -> List[str]:
+    return [f"ES0000{random.randint(0, 10 ** 12 - 1):012d}BM" for _ in range(count)]
+
+
+@contextmanager
+def sips_emulator(port: int, **options) -> Iterator[str]:
+    """
+    Serve the SIPS emulator in a background thread and point the SIPS readers to it.
+    """
+    server = uvicorn.Server(
+        uvicorn.Config(
+            create_app(SIPSFixtures(), **options), port=port, log_level="warning"
+        )
+    )
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.01)
+
+    base_url = settings.SIPS_BASE_URL
+    settings.SIPS_BASE_URL = f"http://127.0.0.1:{port}{PATH.split('{')[0]}"
+    try:
+        yield settings.SIPS_BASE_URL
+    finally:
+        settings.SIPS_BASE_URL = base_url
+        server.should_exit = True
+        thread.join()
+
+
+@app.command(help="Measure SIPS lookups against the local SIPS emulator.")
+def sips(
+    studies: int = typer.Option(20, help="fill_study_with_sips calls per round."),
+    cups: int = typer.Option(1_000, help="Cups of the bulk lookup."),
+    request_size: int = typer.Option(50, help="Cups sent in every SIPS request."),
+    workers: int = typer.Option(4, help="Concurrent SIPS requests."),
+    latency: float = typer.Option(0.2, help="Emulated SIPS latency in seconds."),
+    jitter: float = typer.Option(0.1, help="Emulated random extra latency."),
+    error_rate: float = 0,
+    port: int = 8001,
+):
+    """
+    Example: docker compose -f local.yml run --rm fastapi python cli.py benchmark
+    sips --latency 0.3 --workers 8
+    """
+    settings.SIPS_CONSUMER_KEY = settings.SIPS_CONSUMER_KEY or "benchmark"
+    settings.SIPS_CONSUMER_SECRET = settings.SIPS_CONSUMER_SECRET or "benchmark"
+    study_cups = random_cups(studies)
+
+    with sips_emulator(
+        port, latency=latency, jitter=jitter, error_rate=error_rate
+    ), sessionmaker(autocommit=False, autoflush=True, bind=engine)() as session:
+        # Cold round goes to the emulator, warm round is served by cache and history
+        for round_name in ("cold", "warm"):
+            timings = [
+                measure(fill_study_with_sips, session, SavingStudy(cups=cup))
+                for cup in study_cups
+            ]
+            report(f"fill_study_with_sips ({round_name})", timings)
+
+        reader = PsElectricityReader()
+        reader.set_credentials(
+            settings.SIPS_CONSUMER_KEY, settings.SIPS_CONSUMER_SECRET
+        )
+        reader.set_base_url(settings.SIPS_BASE_URL)
+        lookup_cups = random_cups(cups)
+        chunks = split_in_chunks(lookup_cups, request_size)
+        errors = []
+
+        def lookup(chunk: List[str]) -> None:
+            try:
+                list(reader.fetch(SIPSTypes.PS_ELECTRICIDAD, chunk))
+            except ReaderException:
+                errors.append(chunk)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            started_at = time.perf_counter()
+            timings = list(executor.map(lambda chunk: measure(lookup, chunk), chunks))
+            elapsed = time.perf_counter() - started_at
+        report("bulk lookup requests", timings)
+        typer.echo(
+            f"bulk lookup: {len(lookup_cups) / elapsed:.1f} CUPS/s, "
+            f"{len(errors)} failed requests"
+        )
+
+        delete_sips_cache_entries(session, SipsCacheEntry.cups.in_(study_cups))
+        delete_supply_point_consumptions(session, study_cups)
+
+
+async def run_concurrently(
+    client: httpx.AsyncClient, path: str, headers: dict, requests: int, concurrency: int
+) -> List[float]:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def request() -> float:
+        async with semaphore:
+            started_at = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            response.raise_for_status()
+            return time.perf_counter() - started_at
+
+    return await asyncio.gather(*[request() for _ in range(requests)])
+
+
+@app.command(help="Measure authenticated requests under many parallel clients.")
+def auth(
+    requests: int = typer.Option(2_000, help="Requests per round."),
+    concurrency: int = typer.Option(100, help="Requests in flight."),
+    path: str = "/api/users/me",
+    token: str = typer.Option(None, help="Defaults to the first stored token."),
+):
+    """
+    Example: docker compose -f local.yml run --rm fastapi python cli.py benchmark
+    auth --concurrency 200
+    """
+    from main import app as api
+
+    if token is None:
+        with sessionmaker(bind=engine)() as session:
+            token = session.query(Token.token).limit(1).scalar()
+    if token is None:
+        raise typer.BadParameter("There are no tokens, log in first or pass --token")
+
+    headers = {"Authorization": f"token {token}"}
+    max_size = token_cache.max_size
+
+    async def run_round() -> float:
+        async with httpx.AsyncClient(app=api, base_url="http://benchmark") as client:
+            started_at = time.perf_counter()
+            timings = await run_concurrently(
+                client, path, headers, requests, concurrency
+            )
+            report(f"GET {path}", timings)
+            return time.perf_counter() - started_at
+
+    # Without cache every request looks the token up in the database
+    for round_name, cache_size in (
+        ("token cache disabled", 0),
+        ("token cache", max_size),
+    ):
+        token_cache.clear()
+        token_cache.max_size = cache_size
+        elapsed = asyncio.run(run_round())
+        typer.echo(f"{round_name}: {requests / elapsed:.1f} requests/s")
+    token_cache.max_size = max_size
+
+
+@app.command(help="Measure the unaccent filters with and without trigram indexes.")
+def text_search(
+    rows: int = typer.Option(1_000_000, help="Clients generated for the benchmark."),
+    runs: int = typer.Option(20, help="Filtered queries per round."),
+):
+    """
+    The clients are generated in a transaction that is rolled back at the end.
+    Example: docker compose -f local.yml run --rm fastapi python cli.py benchmark
+    text-search --rows 1000000
+    """
+    terms = [f"{random.randint(0, 16 ** 4 - 1):04x}" for _ in range(runs)]
+
+    with sessionmaker(bind=engine)() as session:
+        user_id = session.query(User.id).limit(1).scalar()
+        if user_id is None:
+            raise typer.BadParameter("There are no users, create one first")
+
+        session.execute(
+            text(
+                "INSERT INTO client (alias, client_type, fiscal_name, user_id, "
+                "invoice_notification_type, is_active, is_renewable, create_at) "
+                "SELECT 'Benchmark ' || i, 'company', 'Compañía ' || md5(i::text), "
+                ":user_id, 'email', true, false, now() "
+                "FROM generate_series(1, :rows) AS i"
+            ),
+            {"user_id": user_id, "rows": rows},
+        )
+        session.execute(text("ANALYZE client"))
+
+        def filter_clients(term: str):
+            return ClientFilter(fiscal_name__unaccent=term).filter(
+                session.query(Client.id)
+            )
+
+        # GIN indexes are only read through bitmap scans
+        for round_name, bitmap_scan in (("sequential scan", "off"), ("index", "on")):
+            session.execute(text(f"SET LOCAL enable_bitmapscan = {bitmap_scan}"))
+            plan = session.execute(Explain(filter_clients(terms[0]).statement)).scalar()
+            timings = [
+                measure(lambda term: filter_clients(term).count(), term)
+                for term in terms
+            ]
+            report(
+                f"fiscal_name__unaccent, {round_name} ({plan[0]['Plan']['Node Type']})",
+                timings,
+            )
+
+        session.rollback()
+
+
+@app.command(help="Measure the serialization of the heaviest lists.")
+def serialization(
+    size: int = typer.Option(500, help="Items per page."),
+    runs: int = typer.Option(20, help="Pages serialized per round."),
+):
+    """
+    Serializes pages of the first stored rates, saving studies and suggested rates
+    with pydantic and with the compiled serializers and orjson.
+    Example: docker compose -f local.yml run --rm fastapi python cli.py benchmark
+    serialization --size 500
+    """
+    params = Params.construct(page=1, size=size)
+    fast_json_responses = settings.FAST_JSON_RESPONSES
+
+    with sessionmaker(bind=engine)() as session:
+        lists = [
+            ("rates", RateUpdateDetailListResponse, session.query(Rate)),
+            ("saving studies", SavingStudyOutput, session.query(SavingStudy)),
+            ("suggested rates", SuggestedRateResponse, session.query(SuggestedRate)),
+        ]
+        for name, schema, query in lists:
+            items = query.limit(size).all()
+            if not items:
+                typer.echo(f"{name}: there are no rows, skipped")
+                continue
+
+            def serialize():
+                return create_page_response(items, params, len(items), schema).body
+
+            # The first page loads the relationships, the rounds only serialize
+            serialize()
+            for round_name, fast in (("pydantic", False), ("orjson", True)):
+                settings.FAST_JSON_RESPONSES = fast
+                timings = [measure(serialize) for _ in range(runs)]
+                report(f"{name}, {len(items)} items, {round_name}", timings)
+    settings.FAST_JSON_RESPONSES = fast_json_responses
@@ -0,0 +1,118 @@
+import gzip
+from datetime import datetime
+from pathlib import Path
+
+import typer
+import uvicorn
+from sqlalchemy.orm import sessionmaker
+
+from config.settings import settings
+from src.infrastructure.sqlalchemy.database import engine
+from src.sips.cache import SIPSCache
+from src.sips.dump import SIPSDumpImporter
+from src.sips.emulator import SIPSFixtures, create_app
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import SIPSTypes
+from src.sips.refresh import SupplyPointRefresher
+
+app = typer.Typer(help="SIPS data manager commands.")
+
+
+@app.command(help="Import a CNMC SIPS CSV extract.", name="import-dump")
+def import_dump(
+    path: Path,
+    sips_type: SIPSTypes,
+    since: datetime = typer.Option(
+        None, formats=["%Y-%m-%d"], help="Skip rows older than this date."
+    ),
+    full: bool = typer.Option(
+        False, help="Import every row instead of the ones newer than the last import."
+    ),
+    chunk_size: int = 50_000,
+    delimiter: str = ",",
+):
+    """
+    Example: docker compose -f local.yml run --rm fastapi python cli.py sips import-dump
+    /data/SIPS2_CONSUMOS_ELECTRICIDAD.csv.gz SIPS2_CONSUMOS_ELECTRICIDAD
+    """
+    open_file = gzip.open if path.suffix == ".gz" else open
+    with sessionmaker(autocommit=False, autoflush=True, bind=engine)() as session:
+        importer = SIPSDumpImporter(session, sips_type, chunk_size)
+        since_date = since.date() if since else None
+        if since_date is None and not full:
+            since_date = importer.get_last_record_date()
+        with open_file(path, "rt", newline="", encoding="utf-8") as file:
+            imported = importer.import_file(file, since_date, delimiter)
+    # success message
+    typer.echo(
+        f"{imported} {sips_type.value} rows imported from {path} (since {since_date})."
+    )
+
+
+@app.command(
+    help="Refresh the technical data of the active supply points from SIPS.",
+    name="refresh-supply-points",
+)
+def refresh_supply_points(
+    batch_size: int = 1_000,
+    request_size: int = typer.Option(50, help="Cups sent in every SIPS request."),
+    workers: int = typer.Option(4, help="Concurrent SIPS requests."),
+    checkpoint: Path = typer.Option(
+        Path(".sips_refresh_checkpoint.json"),
+        help="File where the progress is saved to resume an interrupted run.",
+    ),
+    restart: bool = typer.Option(False, help="Ignore the saved checkpoint."),
+):
+    """
+    Example: docker compose -f local.yml run --rm fastapi python cli.py sips
+    refresh-supply-points --workers 8
+    """
+    reader = PsElectricityReader()
+    reader.set_credentials(settings.SIPS_CONSUMER_KEY, settings.SIPS_CONSUMER_SECRET)
+    reader.set_base_url(settings.SIPS_BASE_URL)
+    with sessionmaker(autocommit=False, autoflush=True, bind=engine)() as session:
+        refresher = SupplyPointRefresher(
+            session,
+            reader,
+            batch_size=batch_size,
+            request_size=request_size,
+            workers=workers,
+            checkpoint=checkpoint,
+            cache=SIPSCache(session) if settings.SIPS_CACHE_ENABLED else None,
+        )
+        if not restart:
+            refresher.load_checkpoint()
+        stats = refresher.run()
+    # success message
+    typer.echo(
+        f"{stats['processed']} supply points processed, {stats['updated']} updated, "
+        f"{stats['failed']} failed."
+    )
+
+
+@app.command(help="Serve a local emulator of the CNMC SIPS API.")
+def emulator(
+    host: str = "0.0.0.0",
+    port: int = 8001,
+    fixtures_dir: Path = typer.Option(
+        None, help="Directory with recorded <SIPS type>.csv files."
+    ),
+    months: int = typer.Option(12, help="Generated consumption rows per cups."),
+    generate: bool = typer.Option(
+        True, help="Generate rows for cups without recorded ones."
+    ),
+    latency: float = typer.Option(0, help="Seconds added to every response."),
+    jitter: float = typer.Option(0, help="Random extra seconds, up to this value."),
+    error_rate: float = typer.Option(0, help="Fraction of requests failing with 500."),
+    seed: int = 0,
+):
+    """
+    Example: docker compose -f local.yml run --rm -p 8001:8001 fastapi python cli.py
+    sips emulator --latency 0.3 --error-rate 0.01
+    """
+    fixtures = SIPSFixtures(fixtures_dir, months=months, generate=generate, seed=seed)
+    uvicorn.run(
+        create_app(fixtures, latency=latency, jitter=jitter, error_rate=error_rate),
+        host=host,
+        port=port,
+    )
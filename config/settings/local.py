@@ -4,6 +4,7 @@ from config.settings.base import TestBaseSettings
 class Settings(TestBaseSettings):
     DEBUG: bool = True
     SECRET_KEY: str = "Dummy-Secret-KEY"
+    QUERY_STATS_HEADERS: bool = True
     # Email settings
     EMAIL_MODE = "SNMP"
     EMAIL_CONFIG_USERNAME: str = ""
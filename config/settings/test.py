@@ -4,6 +4,8 @@ from config.settings.base import TestBaseSettings
 class Settings(TestBaseSettings):
     DEBUG: bool = True
     SECRET_KEY: str = "Dummy-Secret-KEY"
+    QUERY_STATS_HEADERS: bool = True
+    PASSWORD_HASHING_WORKERS: int = 0
     # Mail settings
     EMAIL_MODE = "SNMP"
     EMAIL_CONFIG_USERNAME: str = ""
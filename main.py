@@ -10,9 +10,16 @@ from fastapi.security import HTTPBasic, HTTPBasicCredentials
 from starlette.exceptions import HTTPException as StarletteHTTPException
 from starlette.middleware.cors import CORSMiddleware
 from starlette.requests import Request
-from starlette.responses import HTMLResponse, JSONResponse
+from starlette.responses import HTMLResponse, JSONResponse, Response
 
 from config.settings import settings
+from src.infrastructure.cache.catalogs import (
+    listen_invalidations as listen_catalog_invalidations,
+)
+from src.infrastructure.cache.tokens import listen_invalidations
+from src.infrastructure.hashing import hashing_executor
+from src.infrastructure.sqlalchemy.ordering import refresh_table_rows
+from src.infrastructure.sqlalchemy.replica import listen_recent_writers
 from src.modules.clients.routers import router as clients_router
 from src.modules.commissions.routers import router as commissions_router
 from src.modules.contacts.routers import router as contacts_router
@@ -23,6 +30,7 @@ from src.modules.margins.routers import router as margins_router
 from src.modules.marketers.routers import router as marketers_router
 from src.modules.rates.routers import router as rates_router
 from src.modules.saving_studies.routers import router as saving_studies_router
+from src.modules.search.routers import router as search_router
 from src.modules.supply_points.routers import router as supply_points_router
 from src.modules.users.routers import router as users_router
 from src.services.exceptions import custom_exception, request_validation_error_handler
@@ -108,6 +116,36 @@ async def get_swagger_documentation(
 
 add_middlewares(app)
 
+
+@app.on_event("startup")
+def start_token_cache_invalidations():
+    if settings.TOKEN_CACHE_BROADCAST:
+        listen_invalidations()
+
+
+@app.on_event("startup")
+def start_catalog_cache_invalidations():
+    if settings.CATALOG_CACHE_BROADCAST:
+        listen_catalog_invalidations()
+
+
+@app.on_event("startup")
+def start_replica_recent_writers():
+    if settings.DATABASE_REPLICA_URL and settings.DATABASE_REPLICA_BROADCAST:
+        listen_recent_writers()
+
+
+@app.on_event("startup")
+def start_table_rows_refresh():
+    if settings.UNINDEXED_ORDERING_ROWS is not None:
+        refresh_table_rows()
+
+
+@app.on_event("shutdown")
+def stop_hashing_executor():
+    hashing_executor.shutdown()
+
+
 app.include_router(healthcheck_router)
 app.include_router(users_router)
 app.include_router(rates_router)
@@ -120,6 +158,7 @@ app.include_router(clients_router)
 app.include_router(contacts_router)
 app.include_router(supply_points_router)
 app.include_router(contracts_router)
+app.include_router(search_router)
 
 
 @app.exception_handler(RequestValidationError)
@@ -132,5 +171,5 @@ async def validation_exception_handler(
 @app.exception_handler(StarletteHTTPException)
 async def custom_exception_handler(
     request: Request, exc: StarletteHTTPException
-) -> JSONResponse:
+) -> Response:
     return custom_exception(exc)
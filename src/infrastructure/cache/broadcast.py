@@ -0,0 +1,75 @@
+import logging
+import os
+import select
+import threading
+from typing import Callable
+
+import psycopg2
+from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import text
+
+from src.infrastructure.sqlalchemy.database import SQLALCHEMY_DATABASE_URL, engine
+
+logger = logging.getLogger(__name__)
+
+
+class PostgresBroadcast:
+    """
+    Lightweight broadcast between API workers over Postgres LISTEN/NOTIFY. Messages
+    are plain strings; every worker listening to the channel, the publisher included,
+    receives them.
+    """
+
+    def __init__(self, channel: str):
+        self.channel = channel
+        self._thread = None
+        self._stop = threading.Event()
+
+    def publish(self, message: str) -> None:
+        try:
+            with engine.connect() as connection:
+                connection.execute(
+                    text("SELECT pg_notify(:channel, :message)"),
+                    {"channel": self.channel, "message": message},
+                )
+                connection.commit()
+        except Exception:
+            logger.exception("[channel=%s] Broadcast failed", self.channel)
+
+    def listen(self, callback: Callable[[str], None]) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._listen, args=(callback,), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _listen(self, callback: Callable[[str], None]) -> None:
+        while not self._stop.is_set():
+            try:
+                self._listen_connection(callback)
+            except psycopg2.Error:
+                logger.exception("[channel=%s] Listener connection lost", self.channel)
+                self._stop.wait(5)
+
+    def _listen_connection(self, callback: Callable[[str], None]) -> None:
+        connection = psycopg2.connect(SQLALCHEMY_DATABASE_URL)
+        connection.set_isolation_level(ISOLATION_LEVEL_AUTOCOMMIT)
+        connection.cursor().execute(f'LISTEN "{self.channel}"')
+        logger.info("[pid=%s] Listening to %s", os.getpid(), self.channel)
+        try:
+            while not self._stop.is_set():
+                if select.select([connection], [], [], 1) == ([], [], []):
+                    continue
+                connection.poll()
+                while connection.notifies:
+                    callback(connection.notifies.pop(0).payload)
+        finally:
+            connection.close()
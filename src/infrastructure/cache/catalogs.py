@@ -0,0 +1,102 @@
+import logging
+import threading
+from collections import namedtuple
+from typing import Any, Hashable
+
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from src.infrastructure.cache.broadcast import PostgresBroadcast
+from src.infrastructure.cache.memory import TTLCache
+from src.modules.costs.models import EnergyCost
+from src.modules.marketers.models import Marketer
+from src.modules.rates.models import RateType
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "catalog_cache_invalidation"
+
+broadcast = PostgresBroadcast(BROADCAST_CHANNEL)
+
+
+class CatalogCache:
+    """
+    Read-through cache of the rows of a small, rarely written table. Rows are kept as
+    immutable snapshots of their columns, namedtuples that are never attached to a
+    session, so they are shared by every request and thread.
+
+    invalidate() increments the version of the cache and clears it. A row loaded
+    while the version changed is returned but not stored, a read racing a write
+    never caches the old row.
+    """
+
+    def __init__(self, model, max_size: int, ttl: float):
+        # The table, not the mapper, which can't be configured while the models
+        # are still being imported
+        self.model = model
+        self.name = model.__table__.name
+        self.columns = list(model.__table__.columns)
+        self.snapshot_class = namedtuple(
+            f"{model.__name__}Snapshot", [column.key for column in self.columns]
+        )
+        self.version = 0
+        self._entries = TTLCache(max_size, ttl)
+        self._lock = threading.Lock()
+
+    def get(self, db: Session, key: Hashable, *filters) -> Any:
+        """
+        Snapshot of the row of the filters, cached by key, None when there is none.
+        """
+        snapshot = self._entries.get(key)
+        if snapshot is not None:
+            return snapshot
+
+        version = self.version
+        row = db.query(*self.columns).filter(*filters).first()
+        if row is None:
+            return None
+        snapshot = self.snapshot_class(*row)
+        with self._lock:
+            if version == self.version:
+                self._entries.set(key, snapshot)
+        return snapshot
+
+    def invalidate(self) -> None:
+        """
+        Drop the cached rows, in every worker when broadcast is enabled. Called after
+        the write is committed.
+        """
+        self._invalidate_local()
+        if settings.CATALOG_CACHE_BROADCAST:
+            broadcast.publish(self.name)
+
+    def _invalidate_local(self) -> None:
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+        logger.debug("[catalog=%s] Cache invalidated", self.name)
+
+
+rate_type_cache = CatalogCache(
+    RateType, settings.CATALOG_CACHE_MAX_SIZE, settings.CATALOG_CACHE_TTL
+)
+marketer_cache = CatalogCache(
+    Marketer, settings.CATALOG_CACHE_MAX_SIZE, settings.CATALOG_CACHE_TTL
+)
+energy_cost_cache = CatalogCache(
+    EnergyCost, settings.CATALOG_CACHE_MAX_SIZE, settings.CATALOG_CACHE_TTL
+)
+
+catalog_caches = {
+    cache.name: cache for cache in (rate_type_cache, marketer_cache, energy_cost_cache)
+}
+
+
+def listen_invalidations() -> None:
+    broadcast.listen(_invalidate_local)
+
+
+def _invalidate_local(name: str) -> None:
+    cache = catalog_caches.get(name)
+    if cache is not None:
+        cache._invalidate_local()
@@ -0,0 +1,62 @@
+import logging
+from typing import Dict
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from config.settings import settings
+from src.infrastructure.cache.broadcast import PostgresBroadcast
+from src.infrastructure.cache.memory import TTLCache
+from src.modules.users.models import User
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "token_cache_invalidation"
+
+# token -> column values of its user
+token_cache = TTLCache(settings.TOKEN_CACHE_MAX_SIZE, settings.TOKEN_CACHE_TTL)
+broadcast = PostgresBroadcast(BROADCAST_CHANNEL)
+
+
+def get_user_identity(user: User) -> Dict:
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def get_cached_user(db: Session, token: str) -> User | None:
+    """
+    User of the token from the cache, attached to db without querying the database.
+    """
+    identity = token_cache.get(token)
+    if identity is None:
+        return None
+
+    user = User(**identity)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def cache_user(token: str, user: User) -> None:
+    token_cache.set(token, get_user_identity(user))
+
+
+def invalidate_users(*user_ids: int) -> None:
+    """
+    Drop the cached tokens of the users, in every worker when broadcast is enabled.
+    """
+    _invalidate_local(user_ids)
+    if settings.TOKEN_CACHE_BROADCAST and user_ids:
+        broadcast.publish(",".join(str(user_id) for user_id in user_ids))
+
+
+def listen_invalidations() -> None:
+    broadcast.listen(
+        lambda message: _invalidate_local(
+            [int(user_id) for user_id in message.split(",") if user_id]
+        )
+    )
+
+
+def _invalidate_local(user_ids) -> None:
+    user_ids = set(user_ids)
+    token_cache.delete_where(lambda identity: identity["id"] in user_ids)
+    logger.debug("Cached tokens of users %s invalidated", user_ids)
@@ -0,0 +1,173 @@
+"""
+Response compression negotiated with Accept-Encoding, brotli when the brotli package
+is installed and enabled, gzip otherwise. Bodies are compressed as they are sent, a
+streamed export is compressed chunk by chunk and never held in memory as a whole.
+"""
+import zlib
+from typing import Iterable, Set
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional, only gzip is offered without it
+    brotli = None
+
+# Bodies of these statuses are empty or must not change
+UNCOMPRESSED_STATUSES = (204, 206, 304)
+
+
+class GzipEncoder:
+    name = "gzip"
+
+    def __init__(self, level: int):
+        self.compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self.compressor.compress(data)
+        if final:
+            body += self.compressor.flush()
+        return body
+
+
+class BrotliEncoder:
+    name = "br"
+
+    def __init__(self, quality: int):
+        self.compressor = brotli.Compressor(quality=quality)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        body = self.compressor.process(data)
+        if final:
+            body += self.compressor.finish()
+        return body
+
+
+def get_accepted_encodings(accept_encoding: str) -> Set[str]:
+    """
+    Encodings of an Accept-Encoding header the client takes, q=0 excluded.
+    """
+    encodings = set()
+    for item in accept_encoding.split(","):
+        encoding, *params = [part.strip() for part in item.split(";")]
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0
+        if encoding and quality > 0:
+            encodings.add(encoding.lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Compresses the responses of content_types of at least minimum_size bytes.
+    Streamed responses are always compressed, their size is not known up front.
+    brotli_quality None disables brotli.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 1024,
+        content_types: Iterable[str] = ("application/json", "text/csv"),
+        gzip_level: int = 6,
+        brotli_quality: int | None = None,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.content_types = frozenset(content_types)
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality if brotli is not None else None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["method"] == "HEAD":
+            await self.app(scope, receive, send)
+            return
+        accepted = get_accepted_encodings(
+            Headers(scope=scope).get("accept-encoding", "")
+        )
+        responder = CompressionResponder(self, accepted, send)
+        await self.app(scope, receive, responder.send)
+
+    def get_encoder(self, accepted: Set[str]) -> GzipEncoder | BrotliEncoder | None:
+        if self.brotli_quality is not None and "br" in accepted:
+            return BrotliEncoder(self.brotli_quality)
+        if "gzip" in accepted or "*" in accepted:
+            return GzipEncoder(self.gzip_level)
+        return None
+
+    def is_compressible(self, start: Message, body: bytes, more_body: bool) -> bool:
+        headers = Headers(raw=start["headers"])
+        if start["status"] in UNCOMPRESSED_STATUSES or "content-encoding" in headers:
+            return False
+        content_type = headers.get("content-type", "").split(";")[0].strip()
+        if content_type.lower() not in self.content_types:
+            return False
+        if "content-length" in headers:
+            return int(headers["content-length"]) >= self.minimum_size
+        return more_body or len(body) >= self.minimum_size
+
+
+class CompressionResponder:
+    """
+    send of a single response. The start message is held until the first body
+    message tells whether and how to compress.
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, accepted: Set[str], send):
+        self.middleware = middleware
+        self.accepted = accepted
+        self._send = send
+        self.start: Message | None = None
+        self.encoder: GzipEncoder | BrotliEncoder | None = None
+
+    async def send(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            self.start = message
+            return
+        if message["type"] != "http.response.body":
+            # e.g. http.response.pathsend, the file is sent as it is
+            await self.send_start()
+            await self._send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        if self.start is not None:
+            if self.middleware.is_compressible(self.start, body, more_body):
+                self.encoder = self.middleware.get_encoder(self.accepted)
+                headers = MutableHeaders(raw=self.start["headers"])
+                headers.add_vary_header("Accept-Encoding")
+            if self.encoder is not None:
+                body = self.encoder.compress(body, final=not more_body)
+                self.set_encoding_headers(body, more_body)
+            await self.send_start()
+        elif self.encoder is not None:
+            body = self.encoder.compress(body, final=not more_body)
+
+        if self.encoder is not None:
+            message = {**message, "body": body}
+        await self._send(message)
+
+    def set_encoding_headers(self, body: bytes, more_body: bool) -> None:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoder.name
+        if more_body:
+            del headers["Content-Length"]
+        else:
+            headers["Content-Length"] = str(len(body))
+        # The encoded bytes differ, only a weak ETag still holds
+        etag = headers.get("etag")
+        if etag and not etag.startswith("W/"):
+            headers["ETag"] = f"W/{etag}"
+
+    async def send_start(self) -> None:
+        if self.start is not None:
+            await self._send(self.start)
+            self.start = None
@@ -0,0 +1,143 @@
+"""
+Password hashing with bounded concurrency. argon2-cffi releases the GIL while
+hashing, but each hash still takes a core and its memory, and the request thread
+waits for it either way. Running the hashes in a small process pool caps the CPU
+a burst of logins can take from the rest of the worker, and the admission limit
+rejects the excess right away instead of holding threadpool slots for it.
+"""
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable
+
+from passlib.handlers.argon2 import argon2
+
+from config.settings import settings
+from src.infrastructure.metrics import registry
+
+
+class HashingOverloaded(Exception):
+    pass
+
+
+executors = dict()
+registry.gauge(
+    "password_hashing_pending",
+    "Hashing calls queued or running.",
+    lambda: {
+        (("executor", name),): executor.pending for name, executor in executors.items()
+    },
+)
+rejected = registry.counter(
+    "password_hashing_rejected_total",
+    "Hashing calls rejected because the executor was full or timed out.",
+)
+latency = registry.histogram(
+    "password_hashing_seconds", "Hashing call latency, waiting in the queue included."
+)
+
+
+def hash_password(password: str, salt: bytes) -> str:
+    return argon2.using(rounds=2, salt=salt).hash(password)
+
+
+def verify_password(password: str, hashed_password: str) -> bool:
+    return argon2.verify(password, hashed_password)
+
+
+class HashingExecutor:
+    """
+    Runs hashing functions in a pool of worker processes, started on first use.
+    At most max_pending calls are admitted at once, queued or running; the rest
+    fail right away with HashingOverloaded instead of piling up request threads.
+    With workers=0 the functions run inline, still with admission control.
+    """
+
+    def __init__(
+        self, workers: int, max_pending: int, timeout: float, name: str = "password"
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.name = name
+        self.pending = 0
+        self._executor = None
+        self._lock = threading.Lock()
+        executors[name] = self
+
+    def run(self, function: Callable, *args):
+        with self._lock:
+            if self.pending >= self.max_pending:
+                rejected.inc(executor=self.name)
+                raise HashingOverloaded()
+            self.pending += 1
+
+        release = self._get_release(time.perf_counter())
+        if not self.workers:
+            try:
+                return function(*args)
+            finally:
+                release()
+
+        try:
+            future = self._get_executor().submit(function, *args)
+        except BaseException:
+            release()
+            raise
+        # A call that times out keeps its slot until the worker is done with it
+        future.add_done_callback(release)
+        try:
+            result = future.result(self.timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            rejected.inc(executor=self.name)
+            raise HashingOverloaded()
+        except BrokenProcessPool:
+            # A worker died, the next call starts a new pool
+            release()
+            self.shutdown()
+            raise
+        except BaseException:
+            release()
+            raise
+        release()
+        return result
+
+    def _get_release(self, started_at: float) -> Callable:
+        """
+        Frees the slot of a call the first time it is called, from the request
+        thread or from the done callback of the future, whichever comes first.
+        """
+        released = False
+
+        def release(*_):
+            nonlocal released
+            with self._lock:
+                if released:
+                    return
+                released = True
+                self.pending -= 1
+            latency.observe(time.perf_counter() - started_at, executor=self.name)
+
+        return release
+
+    def shutdown(self) -> None:
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.workers)
+            return self._executor
+
+
+hashing_executor = HashingExecutor(
+    settings.PASSWORD_HASHING_WORKERS,
+    settings.PASSWORD_HASHING_MAX_PENDING,
+    settings.PASSWORD_HASHING_TIMEOUT,
+)
@@ -0,0 +1,142 @@
+"""
+In-process metrics rendered in the Prometheus text format by the internal
+/__status__/metrics endpoint. Every worker process exposes its own values.
+"""
+import bisect
+import threading
+from typing import Callable, Dict, Iterable, List, Tuple
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def to_labels(labels: Dict[str, str]) -> Labels:
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+
+def format_labels(labels: Labels, **extra) -> str:
+    items = list(labels) + [(name, str(value)) for name, value in extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in items) + "}"
+
+
+class Counter:
+    type = "counter"
+
+    def __init__(self, name: str, description: str):
+        self.name = name
+        self.description = description
+        self._values: Dict[Labels, float] = dict()
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = to_labels(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        return self._values.get(to_labels(labels), 0)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in list(self._values.items()):
+            yield f"{self.name}{format_labels(labels)} {value}"
+
+
+class Histogram:
+    type = "histogram"
+    # seconds
+    DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+    def __init__(self, name: str, description: str, buckets: Tuple = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [count per bucket + overflow bucket, sum]
+        self._values: Dict[Labels, List] = dict()
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels) -> None:
+        key = to_labels(labels)
+        with self._lock:
+            counts, _ = self._values.setdefault(key, [[0] * (len(self.buckets) + 1), 0])
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._values[key][1] += value
+
+    def count(self, **labels) -> int:
+        counts, _ = self._values.get(to_labels(labels), [[0], 0])
+        return sum(counts)
+
+    def sum(self, **labels) -> float:
+        return self._values.get(to_labels(labels), [None, 0])[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+
+    def samples(self) -> Iterable[str]:
+        for labels, (counts, total) in list(self._values.items()):
+            cumulative = 0
+            for bucket, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                yield f"{self.name}_bucket{format_labels(labels, le=bucket)} {cumulative}"
+            yield f"{self.name}_sum{format_labels(labels)} {total}"
+            yield f"{self.name}_count{format_labels(labels)} {cumulative}"
+
+
+class Gauge:
+    """
+    Value read when the metrics are rendered. The function returns the value of
+    every label set, e.g. {(("pool", "primary"),): 3}.
+    """
+
+    type = "gauge"
+
+    def __init__(
+        self, name: str, description: str, function: Callable[[], Dict[Labels, float]]
+    ):
+        self.name = name
+        self.description = description
+        self.function = function
+
+    def clear(self) -> None:
+        ...
+
+    def samples(self) -> Iterable[str]:
+        for labels, value in self.function().items():
+            yield f"{self.name}{format_labels(labels)} {value}"
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = dict()
+
+    def register(self, metric):
+        return self.metrics.setdefault(metric.name, metric)
+
+    def counter(self, name: str, description: str) -> Counter:
+        return self.register(Counter(name, description))
+
+    def histogram(self, name: str, description: str, **kwargs) -> Histogram:
+        return self.register(Histogram(name, description, **kwargs))
+
+    def gauge(self, name: str, description: str, function: Callable) -> Gauge:
+        return self.register(Gauge(name, description, function))
+
+    def clear(self) -> None:
+        for metric in self.metrics.values():
+            metric.clear()
+
+    def render(self) -> str:
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.type}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
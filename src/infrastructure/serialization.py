@@ -0,0 +1,92 @@
+"""
+Serializers compiled from the response schemas that read the ORM instances
+directly, without building and validating the pydantic models, and encode with
+orjson. Decimals are written as strings so no precision is lost. The validators of
+the schemas are not run, the instances come from the database and were validated
+when they were written.
+"""
+from decimal import Decimal
+from typing import Any, Callable, Dict, Type
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic.fields import (
+    SHAPE_LIST,
+    SHAPE_SEQUENCE,
+    SHAPE_SET,
+    SHAPE_SINGLETON,
+    SHAPE_TUPLE_ELLIPSIS,
+    ModelField,
+)
+
+Serializer = Callable[[Any], Dict[str, Any]]
+
+SEQUENCE_SHAPES = (SHAPE_LIST, SHAPE_SEQUENCE, SHAPE_SET, SHAPE_TUPLE_ELLIPSIS)
+
+# schema -> serializer
+serializers: Dict[Type[BaseModel], Serializer] = {}
+
+
+def default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    return jsonable_encoder(value)
+
+
+def dumps(content: Any) -> bytes:
+    return orjson.dumps(content, default=default, option=orjson.OPT_NON_STR_KEYS)
+
+
+class ORJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def compile_converter(field: ModelField) -> Callable[[Any], Any] | None:
+    """
+    Conversion of a value of the field, None when orjson encodes it as it is.
+    """
+    type_ = field.type_
+    if isinstance(type_, type) and issubclass(type_, BaseModel):
+        serializer = get_serializer(type_)
+    elif isinstance(type_, type) and issubclass(type_, Decimal):
+        serializer = str
+    else:
+        return None
+
+    if field.shape == SHAPE_SINGLETON:
+        return lambda value: None if value is None else serializer(value)
+    if field.shape in SEQUENCE_SHAPES:
+        return lambda values: (
+            None if values is None else [serializer(value) for value in values]
+        )
+    return None
+
+
+def compile_serializer(schema: Type[BaseModel]) -> Serializer:
+    fields = [
+        (field.alias, compile_converter(field)) for field in schema.__fields__.values()
+    ]
+
+    def serialize(instance: Any) -> Dict[str, Any]:
+        data = {}
+        for name, converter in fields:
+            value = getattr(instance, name, None)
+            data[name] = value if converter is None else converter(value)
+        return data
+
+    return serialize
+
+
+def get_serializer(schema: Type[BaseModel]) -> Serializer:
+    """
+    Serializer of the instances of schema, compiled once per schema.
+    """
+    serializer = serializers.get(schema)
+    if serializer is None:
+        # Registered before compiling so schemas that nest themselves resolve it
+        serializers[schema] = lambda instance: serializers[schema](instance)
+        serializer = serializers[schema] = compile_serializer(schema)
+    return serializer
@@ -6,6 +6,7 @@ from sqlalchemy import engine_from_config, pool
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 from src.infrastructure.sqlalchemy.database import SQLALCHEMY_DATABASE_URL, Base
+from src.modules.catalogs.models import Base as CatalogsBase  # noqa
 from src.modules.clients.models import Base as ClientsBase  # noqa
 from src.modules.commissions.models import Base as CommissionsBase  # noqa
 from src.modules.contacts.models import Base as ContactsBase  # noqa
@@ -15,6 +16,8 @@ from src.modules.margins.models import Base as MarginsBase  # noqa
 from src.modules.marketers.models import Base as MarketersBase  # noqa
 from src.modules.rates.models import Base as RatesBase  # noqa
 from src.modules.saving_studies.models import Base as SavingStudiesBase  # noqa
+from src.modules.search.models import Base as SearchBase  # noqa
+from src.modules.sips.models import Base as SipsBase  # noqa
 from src.modules.supply_points.models import Base as SupplyPointBase  # noqa
 from src.modules.users.models import Base as UsersBase  # noqa
 
@@ -0,0 +1,64 @@
+"""Soft delete partial indexes
+
+Revision ID: a2d4f6b8c0e1
+Revises: f1b6c3d8e5a2
+Create Date: 2026-10-18 19:02:15.604118
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a2d4f6b8c0e1"
+down_revision = "f1b6c3d8e5a2"
+branch_labels = None
+depends_on = None
+
+NOT_DELETED = "is_deleted = false"
+
+# name, table, columns, predicate
+INDEXES = [
+    (
+        "ix_rate_candidates",
+        "rate",
+        ["rate_type_id", "price_type"],
+        "is_deleted = false AND is_active = true",
+    ),
+    ("ix_marketer_create_at_not_deleted", "marketer", ["create_at"], NOT_DELETED),
+    ("ix_margin_rate_id_not_deleted", "margin", ["rate_id"], NOT_DELETED),
+    (
+        "ix_other_cost_id_mandatory",
+        "other_cost",
+        ["id"],
+        "is_deleted = false AND is_active = true AND mandatory = true",
+    ),
+    ("ix_user_table_create_at_not_deleted", "user_table", ["create_at"], NOT_DELETED),
+    (
+        "ix_commissions_rates_rate_id_commission_id",
+        "commissions_rates",
+        ["rate_id", "commission_id"],
+        None,
+    ),
+    (
+        "ix_other_costs_rates_rate_id_other_cost_id",
+        "other_costs_rates",
+        ["rate_id", "other_cost_id"],
+        None,
+    ),
+]
+
+
+def upgrade():
+    for name, table, columns, predicate in INDEXES:
+        op.create_index(
+            name,
+            table,
+            columns,
+            unique=False,
+            postgresql_where=sa.text(predicate) if predicate else None,
+        )
+
+
+def downgrade():
+    for name, table, _, _ in reversed(INDEXES):
+        op.drop_index(name, table_name=table)
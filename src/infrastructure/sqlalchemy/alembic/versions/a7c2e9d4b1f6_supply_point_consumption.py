@@ -0,0 +1,48 @@
+"""Supply point consumption
+
+Revision ID: a7c2e9d4b1f6
+Revises: f3b8d2a6c4e1
+Create Date: 2026-10-18 11:24:08.193554
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "a7c2e9d4b1f6"
+down_revision = "f3b8d2a6c4e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "supply_point_consumption",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("create_at", sa.DateTime(), nullable=False),
+        sa.Column("cups", sa.String(length=124), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("end_date", sa.Date(), nullable=False),
+        sa.Column("rate_code", sa.String(length=3), nullable=True),
+        *[
+            sa.Column(f"{name}_p{i}", sa.BigInteger(), nullable=False)
+            for name in ("active_energy", "reactive_energy", "demanded_power")
+            for i in range(1, 7)
+        ],
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cups", "start_date"),
+    )
+    op.create_index(
+        "ix_supply_point_consumption_cups_end_date",
+        "supply_point_consumption",
+        ["cups", "end_date"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index(
+        "ix_supply_point_consumption_cups_end_date",
+        table_name="supply_point_consumption",
+    )
+    op.drop_table("supply_point_consumption")
@@ -0,0 +1,88 @@
+"""Catalog versions
+
+Revision ID: b5d7e9f1a3c6
+Revises: a2d4f6b8c0e1
+Create Date: 2026-10-19 09:14:52.317046
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "b5d7e9f1a3c6"
+down_revision = "a2d4f6b8c0e1"
+branch_labels = None
+depends_on = None
+
+# table -> columns whose updates change the catalog, None for every column. The
+# password of the users is not returned by any catalog
+CATALOG_TABLES = {
+    "rate_type": None,
+    "rate": None,
+    "marketer": None,
+    "address": None,
+    "margin": None,
+    "commission": None,
+    "commissions_rates": None,
+    "energy_cost": None,
+    "user_table": [
+        "first_name",
+        "last_name",
+        "email",
+        "is_active",
+        "is_deleted",
+        "is_superadmin",
+        "create_at",
+        "responsible_id",
+        "role",
+    ],
+}
+
+BUMP_CATALOG_VERSION = """
+CREATE OR REPLACE FUNCTION bump_catalog_version() RETURNS trigger
+LANGUAGE plpgsql AS $func$
+BEGIN
+    INSERT INTO catalog_version (name, version, modified_at)
+    VALUES (TG_TABLE_NAME, 1, timezone('utc', now()))
+    ON CONFLICT (name) DO UPDATE SET
+        version = catalog_version.version + 1,
+        modified_at = EXCLUDED.modified_at;
+    RETURN NULL;
+END
+$func$;
+"""
+
+TRIGGER = """
+CREATE TRIGGER catalog_version_{table}
+AFTER INSERT OR {update} OR DELETE OR TRUNCATE ON {table}
+FOR EACH STATEMENT EXECUTE FUNCTION bump_catalog_version();
+"""
+
+
+def upgrade():
+    op.create_table(
+        "catalog_version",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("modified_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+    op.execute(sa.text(BUMP_CATALOG_VERSION))
+    for table, columns in CATALOG_TABLES.items():
+        update = f"UPDATE OF {', '.join(columns)}" if columns else "UPDATE"
+        op.execute(sa.text(TRIGGER.format(table=table, update=update)))
+        op.execute(
+            sa.text(
+                "INSERT INTO catalog_version (name, version, modified_at) "
+                f"VALUES ('{table}', 1, timezone('utc', now()));"
+            )
+        )
+
+
+def downgrade():
+    for table in CATALOG_TABLES:
+        op.execute(
+            sa.text(f"DROP TRIGGER IF EXISTS catalog_version_{table} ON {table};")
+        )
+    op.execute(sa.text("DROP FUNCTION IF EXISTS bump_catalog_version();"))
+    op.drop_table("catalog_version")
@@ -0,0 +1,38 @@
+"""Keyset pagination indexes
+
+Revision ID: c5d1e8f2a9b3
+Revises: a7c2e9d4b1f6
+Create Date: 2026-10-18 16:02:41.518237
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "c5d1e8f2a9b3"
+down_revision = "a7c2e9d4b1f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        "ix_client_create_at_id", "client", ["create_at", "id"], unique=False
+    )
+    op.create_index(
+        "ix_supply_point_create_at_id",
+        "supply_point",
+        ["create_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_suggested_rate_saving_study_id_id",
+        "suggested_rate",
+        ["saving_study_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index("ix_suggested_rate_saving_study_id_id", table_name="suggested_rate")
+    op.drop_index("ix_supply_point_create_at_id", table_name="supply_point")
+    op.drop_index("ix_client_create_at_id", table_name="client")
@@ -0,0 +1,45 @@
+"""SIPS cache
+
+Revision ID: e1a5c3d7b9f2
+Revises: 7c0b14c92043
+Create Date: 2026-10-18 09:12:41.204518
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "e1a5c3d7b9f2"
+down_revision = "7c0b14c92043"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sips_cache",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cups", sa.String(length=124), nullable=False),
+        sa.Column(
+            "sips_type",
+            sa.Enum(
+                "PS_ELECTRICIDAD",
+                "CONSUMOS_ELECTRICIDAD",
+                "PS_GAS",
+                "CONSUMOS_GAS",
+                name="sipstypes",
+            ),
+            nullable=False,
+        ),
+        sa.Column("records", postgresql.JSONB(), nullable=False),
+        sa.Column("fetched_at", sa.DateTime(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cups", "sips_type"),
+    )
+
+
+def downgrade():
+    op.drop_table("sips_cache")
+    op.execute(sa.text("DROP TYPE IF EXISTS sipstypes;"))
@@ -0,0 +1,54 @@
+"""Trigram unaccent indexes
+
+Revision ID: e3a7b9c1d2f4
+Revises: c5d1e8f2a9b3
+Create Date: 2026-10-18 17:24:09.301845
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "e3a7b9c1d2f4"
+down_revision = "c5d1e8f2a9b3"
+branch_labels = None
+depends_on = None
+
+TRIGRAM_INDEXES = [
+    ("ix_client_fiscal_name_trgm", "client", "fiscal_name"),
+    ("ix_contact_name_trgm", "contact", "name"),
+    ("ix_contact_email_trgm", "contact", "email"),
+    ("ix_contact_phone_trgm", "contact", "phone"),
+    ("ix_user_table_first_name_trgm", "user_table", "first_name"),
+    ("ix_user_table_last_name_trgm", "user_table", "last_name"),
+    ("ix_user_table_email_trgm", "user_table", "email"),
+]
+
+
+def upgrade():
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm;"))
+    # The dictionary is schema qualified so the result does not depend on the
+    # search_path, which is what makes declaring the function IMMUTABLE safe
+    op.execute(
+        sa.text(
+            "CREATE OR REPLACE FUNCTION f_unaccent(text) RETURNS text "
+            "LANGUAGE sql IMMUTABLE PARALLEL SAFE STRICT AS "
+            "$func$ SELECT public.unaccent('public.unaccent'::regdictionary, $1) "
+            "$func$;"
+        )
+    )
+    for name, table, column in TRIGRAM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [sa.text(f"f_unaccent({column}) gin_trgm_ops")],
+            unique=False,
+            postgresql_using="gin",
+        )
+
+
+def downgrade():
+    for name, table, _ in reversed(TRIGRAM_INDEXES):
+        op.drop_index(name, table_name=table)
+    op.execute(sa.text("DROP FUNCTION IF EXISTS f_unaccent(text);"))
+    op.execute(sa.text("DROP EXTENSION IF EXISTS pg_trgm;"))
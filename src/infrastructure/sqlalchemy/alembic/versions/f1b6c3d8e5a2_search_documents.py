@@ -0,0 +1,178 @@
+"""Search documents
+
+Revision ID: f1b6c3d8e5a2
+Revises: e3a7b9c1d2f4
+Create Date: 2026-10-18 18:11:37.842960
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "f1b6c3d8e5a2"
+down_revision = "e3a7b9c1d2f4"
+branch_labels = None
+depends_on = None
+
+# Expressions of every document over {row}, NEW in the triggers and the table in
+# the backfill. identifiers get weight A and names weight B; phones are also
+# indexed with digits only
+ENTITIES = {
+    "client": dict(
+        table="client",
+        title="coalesce({row}.fiscal_name, {row}.alias)",
+        subtitle="{row}.cif",
+        identifiers="{row}.cif",
+        names="concat_ws(' ', {row}.alias, {row}.fiscal_name)",
+        deleted="false",
+    ),
+    "contact": dict(
+        table="contact",
+        title="{row}.name",
+        subtitle="{row}.email",
+        identifiers=(
+            "concat_ws(' ', {row}.email, regexp_replace({row}.phone, '\\D', '', 'g'))"
+        ),
+        names="concat_ws(' ', {row}.name, {row}.phone)",
+        deleted="false",
+    ),
+    "supply_point": dict(
+        table="supply_point",
+        title="coalesce({row}.alias, {row}.cups)",
+        subtitle="{row}.cups",
+        identifiers="{row}.cups",
+        names=("concat_ws(' ', {row}.alias, {row}.supply_address, {row}.supply_city)"),
+        deleted="false",
+    ),
+    "contract": dict(
+        table="contract",
+        title="concat_ws(' ', {row}.signature_first_name, {row}.signature_last_name)",
+        subtitle="(SELECT cups FROM supply_point WHERE id = {row}.supply_point_id)",
+        identifiers=(
+            "concat_ws(' ', {row}.signature_dni, {row}.signature_email, "
+            "regexp_replace({row}.signature_phone, '\\D', '', 'g'), "
+            "(SELECT cups FROM supply_point WHERE id = {row}.supply_point_id))"
+        ),
+        names=(
+            "concat_ws(' ', {row}.signature_first_name, {row}.signature_last_name, "
+            "{row}.signature_phone)"
+        ),
+        deleted="false",
+    ),
+    "saving_study": dict(
+        table="saving_study",
+        title="coalesce({row}.client_name, {row}.cups)",
+        subtitle="{row}.cups",
+        identifiers="concat_ws(' ', {row}.cups, {row}.client_nif)",
+        names="{row}.client_name",
+        deleted="coalesce({row}.is_deleted, false)",
+    ),
+}
+
+SEARCH_DOCUMENT_VECTOR = """
+CREATE OR REPLACE FUNCTION search_document_vector(identifiers text, names text)
+RETURNS tsvector LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $func$
+    SELECT setweight(to_tsvector('simple', f_unaccent(coalesce(identifiers, ''))), 'A')
+        || setweight(to_tsvector('simple', f_unaccent(coalesce(names, ''))), 'B')
+$func$;
+"""
+
+TRIGGER_FUNCTION = """
+CREATE OR REPLACE FUNCTION search_document_{entity_type}() RETURNS trigger
+LANGUAGE plpgsql AS $func$
+BEGIN
+    IF TG_OP = 'DELETE' OR {deleted} THEN
+        DELETE FROM search_document
+        WHERE entity_type = '{entity_type}' AND entity_id = coalesce(OLD.id, NEW.id);
+        RETURN NULL;
+    END IF;
+    INSERT INTO search_document (entity_type, entity_id, title, subtitle, document)
+    VALUES (
+        '{entity_type}',
+        NEW.id,
+        left({title}, 256),
+        left({subtitle}, 256),
+        search_document_vector({identifiers}, {names})
+    )
+    ON CONFLICT (entity_type, entity_id) DO UPDATE SET
+        title = EXCLUDED.title,
+        subtitle = EXCLUDED.subtitle,
+        document = EXCLUDED.document;
+    RETURN NULL;
+END
+$func$;
+"""
+
+TRIGGER = """
+CREATE TRIGGER search_document_{entity_type}
+AFTER INSERT OR UPDATE OR DELETE ON {table}
+FOR EACH ROW EXECUTE FUNCTION search_document_{entity_type}();
+"""
+
+BACKFILL = """
+INSERT INTO search_document (entity_type, entity_id, title, subtitle, document)
+SELECT
+    '{entity_type}',
+    {table}.id,
+    left({title}, 256),
+    left({subtitle}, 256),
+    search_document_vector({identifiers}, {names})
+FROM {table}
+WHERE NOT {deleted};
+"""
+
+
+def render(template: str, entity_type: str, row: str) -> str:
+    entity = ENTITIES[entity_type]
+    expressions = {
+        name: expression.format(row=row)
+        for name, expression in entity.items()
+        if name != "table"
+    }
+    if row == "NEW":
+        # OLD is not set on INSERT, NEW is not set on DELETE
+        expressions["deleted"] = f"(TG_OP <> 'DELETE' AND {expressions['deleted']})"
+    return template.format(
+        entity_type=entity_type, table=entity["table"], **expressions
+    )
+
+
+def upgrade():
+    op.create_table(
+        "search_document",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("entity_type", sa.String(length=20), nullable=False),
+        sa.Column("entity_id", sa.Integer(), nullable=False),
+        sa.Column("title", sa.String(length=256), nullable=True),
+        sa.Column("subtitle", sa.String(length=256), nullable=True),
+        sa.Column("document", postgresql.TSVECTOR(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("entity_type", "entity_id"),
+    )
+    op.create_index(
+        "ix_search_document_document",
+        "search_document",
+        ["document"],
+        unique=False,
+        postgresql_using="gin",
+    )
+    op.execute(sa.text(SEARCH_DOCUMENT_VECTOR))
+    for entity_type, entity in ENTITIES.items():
+        op.execute(sa.text(render(TRIGGER_FUNCTION, entity_type, "NEW")))
+        op.execute(sa.text(render(TRIGGER, entity_type, "NEW")))
+        op.execute(sa.text(render(BACKFILL, entity_type, entity["table"])))
+
+
+def downgrade():
+    for entity_type, entity in ENTITIES.items():
+        op.execute(
+            sa.text(
+                f"DROP TRIGGER IF EXISTS search_document_{entity_type} "
+                f"ON {entity['table']};"
+            )
+        )
+        op.execute(sa.text(f"DROP FUNCTION IF EXISTS search_document_{entity_type}();"))
+    op.execute(sa.text("DROP FUNCTION IF EXISTS search_document_vector(text, text);"))
+    op.drop_index("ix_search_document_document", table_name="search_document")
+    op.drop_table("search_document")
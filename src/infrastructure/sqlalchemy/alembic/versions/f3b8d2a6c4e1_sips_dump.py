@@ -0,0 +1,45 @@
+"""SIPS dump
+
+Revision ID: f3b8d2a6c4e1
+Revises: e1a5c3d7b9f2
+Create Date: 2026-10-18 10:03:15.771902
+
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "f3b8d2a6c4e1"
+down_revision = "e1a5c3d7b9f2"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "sips_dump",
+        sa.Column("id", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "sips_type",
+            postgresql.ENUM(
+                "PS_ELECTRICIDAD",
+                "CONSUMOS_ELECTRICIDAD",
+                "PS_GAS",
+                "CONSUMOS_GAS",
+                name="sipstypes",
+                create_type=False,
+            ),
+            nullable=False,
+        ),
+        sa.Column("cups", sa.String(length=124), nullable=False),
+        sa.Column("record_date", sa.Date(), nullable=False),
+        sa.Column("data", postgresql.JSONB(), nullable=False),
+        sa.Column("imported_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("sips_type", "cups", "record_date"),
+    )
+
+
+def downgrade():
+    op.drop_table("sips_dump")
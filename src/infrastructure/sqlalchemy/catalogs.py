@@ -0,0 +1,21 @@
+from typing import List, Sequence
+
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from src.modules.catalogs.models import CatalogVersion
+
+
+def get_catalog_versions(db: Session, names: Sequence[str]) -> List[Row]:
+    """
+    Name, version and modified_at of the catalogs. Plain rows, not instances, so a
+    long lived session never answers with the versions it loaded before.
+    """
+    return (
+        db.query(
+            CatalogVersion.name, CatalogVersion.version, CatalogVersion.modified_at
+        )
+        .filter(CatalogVersion.name.in_(names))
+        .order_by(CatalogVersion.name)
+        .all()
+    )
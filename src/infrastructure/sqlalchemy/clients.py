@@ -1,5 +1,7 @@
 from typing import List
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.modules.clients.models import Client
@@ -23,6 +25,21 @@ def get_client_by(db: Session, *filters) -> Client:
     return db.query(Client).filter(*filters).first()
 
 
+def get_client_async_queryset(join_list: List = None, *filters) -> Select:
+    queryset = select(Client).filter(*filters)
+    if join_list:
+        queryset = queryset.join(*join_list)
+    return queryset
+
+
+async def get_client_by_async(
+    db: AsyncSession, *filters, options: List = None
+) -> Client:
+    return await db.scalar(
+        select(Client).filter(*filters).options(*(options or [])).limit(1)
+    )
+
+
 # def create_address_db(db: Session, address: Address) -> Address:
 #     db.add(address)
 #     db.commit()
@@ -1,5 +1,7 @@
 from typing import List
 
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.modules.contacts.models import Contact
@@ -21,3 +23,18 @@ def get_contact_queryset(db: Session, join_list: List = None, *filters):
 
 def get_contact_by(db: Session, *filters) -> Contact:
     return db.query(Contact).filter(*filters).first()
+
+
+def get_contact_async_queryset(join_list: List = None, *filters) -> Select:
+    queryset = select(Contact).filter(*filters)
+    if join_list:
+        queryset = queryset.join(*join_list)
+    return queryset
+
+
+async def get_contact_by_async(
+    db: AsyncSession, *filters, options: List = None
+) -> Contact:
+    return await db.scalar(
+        select(Contact).filter(*filters).options(*(options or [])).limit(1)
+    )
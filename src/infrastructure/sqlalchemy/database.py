@@ -1,16 +1,103 @@
-from sqlalchemy import create_engine
-from sqlalchemy.orm import DeclarativeBase, sessionmaker
+from sqlalchemy import Index, create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Session, sessionmaker
 from sqlalchemy.sql.functions import ReturnTypeFromArgs
 
 from config.settings import settings
+from src.infrastructure.sqlalchemy.pool import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    instrument_engine,
+)
 
 SQLALCHEMY_DATABASE_URL = (
     f"postgresql://{settings.POSTGRES_USER}:{settings.POSTGRES_PASSWORD}@"
     f"{settings.POSTGRES_HOST}:{settings.POSTGRES_PORT}/{settings.POSTGRES_DB}"
 )
 
-engine = create_engine(SQLALCHEMY_DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ASYNC_SQLALCHEMY_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace(
+    "postgresql://", "postgresql+asyncpg://", 1
+)
+
+REPLICA_DATABASE_URL = settings.DATABASE_REPLICA_URL
+
+POOL_OPTIONS = dict(
+    pool_size=settings.DATABASE_POOL_SIZE,
+    max_overflow=settings.DATABASE_MAX_OVERFLOW,
+    pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+)
+# psycopg2 doesn't use server side prepared statements, asyncpg caches them per
+# connection unless both caches are disabled
+ASYNC_CONNECT_ARGS = (
+    {"statement_cache_size": 0, "prepared_statement_cache_size": 0}
+    if settings.DATABASE_PGBOUNCER
+    else {}
+)
+
+
+class RoutingSession(Session):
+    """
+    Session bound to the primary that sends its queries to replica_bind once it is
+    set, see src.infrastructure.sqlalchemy.replica. Flushes always go to the
+    primary.
+    """
+
+    replica_bind = None
+
+    def get_bind(self, mapper=None, clause=None, **kwargs):
+        if self.replica_bind is not None and not self._flushing:
+            return self.replica_bind
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+
+engine = instrument_engine(
+    create_engine(
+        SQLALCHEMY_DATABASE_URL,
+        poolclass=InstrumentedQueuePool,
+        **POOL_OPTIONS,
+    ),
+    "primary",
+)
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, bind=engine, class_=RoutingSession
+)
+
+# Read endpoints served on the event loop, without taking a threadpool slot. Async
+# sessions can't lazy load, relationships of the responses must be loaded up front
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    poolclass=InstrumentedAsyncAdaptedQueuePool,
+    connect_args=ASYNC_CONNECT_ARGS,
+    **POOL_OPTIONS,
+)
+instrument_engine(async_engine.sync_engine, "primary_async")
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+    sync_session_class=RoutingSession,
+)
+
+replica_engine = None
+async_replica_engine = None
+if REPLICA_DATABASE_URL:
+    replica_engine = instrument_engine(
+        create_engine(
+            REPLICA_DATABASE_URL,
+            poolclass=InstrumentedQueuePool,
+            **POOL_OPTIONS,
+        ),
+        "replica",
+    )
+    async_replica_engine = create_async_engine(
+        REPLICA_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1),
+        poolclass=InstrumentedAsyncAdaptedQueuePool,
+        connect_args=ASYNC_CONNECT_ARGS,
+        **POOL_OPTIONS,
+    )
+    instrument_engine(async_replica_engine.sync_engine, "replica_async")
 
 
 class Base(DeclarativeBase):
@@ -25,5 +112,33 @@ def get_db():
         db.close()
 
 
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 class unaccent(ReturnTypeFromArgs):
     inherit_cache = True
+
+
+class f_unaccent(ReturnTypeFromArgs):
+    """
+    IMMUTABLE wrapper of unaccent, created by a migration. unaccent itself is only
+    STABLE, so it can not be used in index expressions.
+    """
+
+    inherit_cache = True
+
+
+def trigram_index(name: str, column) -> Index:
+    """
+    GIN trigram index of f_unaccent(column), used by f_unaccent(column) ILIKE
+    '%value%' filters.
+    """
+    return Index(
+        name,
+        # The label only names the expression for postgresql_ops
+        f_unaccent(column).label(name),
+        postgresql_using="gin",
+        postgresql_ops={name: "gin_trgm_ops"},
+    )
@@ -0,0 +1,54 @@
+"""
+Eager loading of the relationships the columns of a CSV export read, e.g.
+"rate.rate_type.name" or "rates:name", so exporting doesn't lazy load them row by
+row.
+"""
+from typing import Iterable, List
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm.strategy_options import Load
+
+
+def get_relationship_paths(attributes: Iterable[str]) -> List[List[str]]:
+    """
+    Attribute paths of the attributes that may be relationships, e.g. "rates" and
+    "rate.rate_type" of "rates:name" and "rate.rate_type.name".
+    """
+    paths = []
+    for attribute in attributes:
+        related_field, _, field = attribute.partition(":")
+        path = related_field.split(".")
+        if not field:
+            path = path[:-1]
+        if path and path not in paths:
+            paths.append(path)
+    return paths
+
+
+def get_export_options(model, attributes: Iterable[str]) -> List[Load]:
+    """
+    Loader options of the relationships of the attributes. Many to ones are joined
+    and collections loaded with a query per batch of rows, both are compatible with
+    yield_per. A path stops at an attribute that is not a relationship, a Python
+    property loads what it reads itself.
+    """
+    options = []
+    for path in get_relationship_paths(attributes):
+        mapper = inspect(model)
+        option, loaded = Load(model), False
+        for name in path:
+            if name not in mapper.attrs:
+                break
+            prop = mapper.attrs[name]
+            if not isinstance(prop, RelationshipProperty):
+                break
+            attribute = getattr(mapper.class_, name)
+            if prop.uselist:
+                option = option.selectinload(attribute)
+            else:
+                option = option.joinedload(attribute)
+            mapper, loaded = prop.mapper, True
+        if loaded:
+            options.append(option)
+    return options
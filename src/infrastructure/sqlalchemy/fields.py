@@ -0,0 +1,34 @@
+"""
+Column level loading of sparse fieldsets, only the columns behind the requested
+fields of a response are selected and hydrated.
+"""
+from typing import Sequence
+
+from sqlalchemy import inspect
+from sqlalchemy.orm import ColumnProperty, RelationshipProperty, load_only
+from sqlalchemy.orm.strategy_options import Load
+
+
+def get_load_only_option(model, field_names: Sequence[str]) -> Load | None:
+    """
+    load_only of the columns of the fields. Relationships keep the local columns
+    they are loaded by, e.g. the foreign key of a many to one, so they don't need
+    another query. None when a field is not mapped, a Python property may read any
+    column.
+    """
+    mapper = inspect(model)
+    columns = []
+    for field_name in field_names:
+        if field_name not in mapper.attrs:
+            return None
+        prop = mapper.attrs[field_name]
+        if isinstance(prop, ColumnProperty):
+            columns.append(getattr(model, field_name))
+        elif isinstance(prop, RelationshipProperty):
+            columns += [
+                getattr(model, mapper.get_property_by_column(column).key)
+                for column in prop.local_columns
+            ]
+        else:
+            return None
+    return load_only(*columns)
@@ -2,17 +2,21 @@
 import logging
 import unicodedata
 from collections import defaultdict
-from typing import Union
+from typing import Any, Dict, List, Tuple, Type, Union
 
+from fastapi import Depends
+from fastapi.exceptions import RequestValidationError
+from fastapi_filter import FilterDepends as WrapperFilterDepends
 from fastapi_filter.contrib.sqlalchemy import Filter as SQLAlchemyFilter
 from fastapi_filter.contrib.sqlalchemy.filter import _orm_operator_transformer
-from pydantic import validator
-from sqlalchemy import inspect, or_
+from pydantic import BaseModel, PrivateAttr, ValidationError, validator
+from sqlalchemy import and_, inspect, or_
 from sqlalchemy.orm import InstrumentedAttribute, Query, aliased
 from sqlalchemy.orm.util import AliasedClass
 from sqlalchemy.sql.selectable import Select
 
-from src.infrastructure.sqlalchemy.database import unaccent
+from src.infrastructure.sqlalchemy.database import f_unaccent
+from src.infrastructure.sqlalchemy.ordering import check_ordering, is_ordering_indexed
 
 logger = logging.getLogger(__name__)
 
@@ -21,23 +25,45 @@ _orm_operator_transformer["unaccent"] = lambda value: ("unaccent", value)
 _orm_operator_transformer["contains"] = lambda value: ("contains", value)
 
 
+def remove_accents(value: str) -> str:
+    return unicodedata.normalize("NFD", value).encode("ascii", "ignore").decode("UTF-8")
+
+
+def unaccent_contains(field, value: str):
+    """
+    Accent and case insensitive contains, f_unaccent(field) ILIKE '%value%', the
+    expression of the trigram indexes.
+    """
+    return f_unaccent(field).ilike("%" + remove_accents(value) + "%")
+
+
 class Filter(SQLAlchemyFilter):
     """
     Custom Base Filter class from fastapi_filter.contrib.sqlalchemy import Filter.
     Override the method filter due to we need add the unaccent filter.
     """
 
+    # Alias of every joined relationship path, set by filter and used by sort
+    _aliases: Dict[Tuple[str, ...], AliasedClass] = PrivateAttr(default_factory=dict)
+    _model: Any = PrivateAttr(None)
+
+    def get_model(self, model_class_without_alias=None):
+        """
+        Create the alias to the model only if it is needed
+        """
+        return (
+            self.Constants.model
+            if not inspect(self.Constants.model).class_ == model_class_without_alias
+            else model_class_without_alias
+        )
+
     def get_model_field(
         self, field_name: str, model_class_without_alias=None
     ) -> InstrumentedAttribute:
         """
         Create the alias to the field only if it is needed
         """
-        return (
-            getattr(self.Constants.model, field_name)
-            if not inspect(self.Constants.model).class_ == model_class_without_alias
-            else getattr(model_class_without_alias, field_name)
-        )
+        return getattr(self.get_model(model_class_without_alias), field_name)
 
     def get_order_by(
         self, field_name: str, model_class_without_alias=None
@@ -56,6 +82,9 @@ class Filter(SQLAlchemyFilter):
                 if filter_schema.__fields__.get(related_field) is None:
                     raise ValueError(f"{field_name} is not a valid ordering field.")
                 filter_schema = filter_schema.__fields__.get(related_field).type_
+            alias = self._aliases.get(tuple(related_list[:-1]))
+            if alias is not None:
+                return getattr(alias, related_field)
             return getattr(filter_schema.Constants.model, related_field)
         order_by_field = self.get_model_field(field_name, model_class_without_alias)
         return order_by_field
@@ -113,8 +142,36 @@ class Filter(SQLAlchemyFilter):
                 f"The following was ambiguous: {ambiguous_field_names}."
             )
 
+        # The default orderings are chosen by the application, they are only logged
+        cls.check_ordering_index(value, refuse=value != field.default)
         return value
 
+    @classmethod
+    def check_ordering_index(cls, order_by: List[str], refuse: bool = True):
+        """
+        Check whether an index serves the ordering, see
+        src.infrastructure.sqlalchemy.ordering.check_ordering. Orderings by related
+        fields are sorted after the join and never are.
+        """
+        field_name = order_by[0].replace("-", "").replace("+", "")
+        model = inspect(cls.Constants.model).mapper.class_
+        field = None if "__" in field_name else getattr(model, field_name)
+        check_ordering(
+            model, [(field, order_by[0].startswith("-"))], ",".join(order_by), refuse
+        )
+
+    @classmethod
+    def get_indexed_ordering_fields(cls) -> List[str]:
+        """
+        Fields of the model an index can sort by, in either direction.
+        """
+        model = inspect(cls.Constants.model).mapper.class_
+        return [
+            column_attr.key
+            for column_attr in inspect(model).mapper.column_attrs
+            if is_ordering_indexed([(getattr(model, column_attr.key), False)])
+        ]
+
     @validator("*", pre=True)
     def split_str(cls, value, field):
         if (
@@ -126,81 +183,202 @@ class Filter(SQLAlchemyFilter):
             return [field.type_(v) for v in value.split(",")]
         return value
 
-    def filter(self, query: Union[Query, Select], model_class_without_alias=None):
+    def has_criteria(self) -> bool:
         """
-        Applies all the filters to the query. We had to add the model_class parameter in order
-        to specify which is the class model that initiates the call to the filter method,
-        otherwise when the alias was previously created that caused the query to be incorrect.
+        Whether any field of the filter or of its nested filters has a value.
+        """
+        for field_name, _ in self.filtering_fields:
+            field_value = getattr(self, field_name)
+            if not isinstance(field_value, Filter) or field_value.has_criteria():
+                return True
+        return False
+
+    def get_ordering_paths(self) -> List[Tuple[str, ...]]:
+        """
+        Relationship paths of the ordering fields, e.g. ("rate", "rate_type") for
+        rate__rate_type__name.
+        """
+        return [
+            tuple(field_name.replace("-", "").replace("+", "").split("__")[:-1])
+            for field_name in self.ordering_values or []
+            if "__" in field_name
+        ]
+
+    def join_path(
+        self,
+        query: Union[Query, Select],
+        path: Tuple[str, ...],
+        model_class_without_alias=None,
+    ):
+        """
+        Outer join every relationship of the path that is not joined yet, with one
+        alias per path, and return the query and the alias of the last one.
+        """
+        model = self.get_model(model_class_without_alias)
+        for position in range(1, len(path) + 1):
+            alias = self._aliases.get(path[:position])
+            if alias is None:
+                relationship = getattr(model, path[position - 1])
+                alias = aliased(relationship.property.mapper.class_)
+                query = query.outerjoin(alias, relationship)
+                self._aliases[path[:position]] = alias
+            model = alias
+        return query, model
+
+    def get_field_criterion(self, model, field_name: str, value):
+        if "__" in field_name:
+            field_name, operator = field_name.split("__")
+            operator, value = _orm_operator_transformer[operator](value)
+        else:
+            operator = "__eq__"
+
+        if field_name == self.Constants.search_field_name and hasattr(
+            self.Constants, "search_model_fields"
+        ):
+            return or_(
+                *[
+                    unaccent_contains(getattr(model, search_field), value)
+                    for search_field in self.Constants.search_model_fields
+                ]
+            )
+        # Start customization
+        if operator == "unaccent":
+            return unaccent_contains(getattr(model, field_name), value)
+        # End customization
+        return getattr(getattr(model, field_name), operator)(value)
+
+    def get_criteria(
+        self,
+        root: "Filter",
+        query: Union[Query, Select],
+        model,
+        path: Tuple[str, ...] = (),
+        correlated: bool = False,
+    ):
         """
+        Criteria of the filter over model, the entity or the alias of its path.
+        Nested filters without values are skipped. A to-one relationship is joined
+        and filtered in the WHERE, unless the criteria are inside an EXISTS, and a
+        to-many one becomes an EXISTS, so the rows are not multiplied, unless the
+        ordering already joins it.
+        """
+        criteria = []
         for field_name, value in self.filtering_fields:
             field_value = getattr(self, field_name)
-            if isinstance(field_value, Filter):
-                field_value.Constants.model = (
-                    aliased(inspect(field_value.Constants.model).class_)
-                    if type(field_value.Constants.model) == AliasedClass
-                    else aliased(field_value.Constants.model)
-                )
+            if not isinstance(field_value, Filter):
+                criteria.append(self.get_field_criterion(model, field_name, value))
+                continue
+            if not field_value.has_criteria():
+                continue
 
-                query = field_value.filter(
-                    query.outerjoin(
-                        field_value.Constants.model,
-                        self.get_model_field(field_name, model_class_without_alias),
-                    )
+            relationship_path = path + (field_name,)
+            relationship = getattr(model, field_name)
+            if not correlated and (
+                relationship_path in root._aliases or not relationship.property.uselist
+            ):
+                query, alias = root.join_path(query, relationship_path, root._model)
+                query, nested_criteria = field_value.get_criteria(
+                    root, query, alias, relationship_path
                 )
-            else:
-                if "__" in field_name:
-                    field_name, operator = field_name.split("__")
-                    operator, value = _orm_operator_transformer[operator](value)
-                else:
-                    operator = "__eq__"
-
-                if field_name == self.Constants.search_field_name and hasattr(
-                    self.Constants, "search_model_fields"
-                ):
+                criteria.extend(nested_criteria)
+                continue
+
+            alias = aliased(relationship.property.mapper.class_)
+            query, nested_criteria = field_value.get_criteria(
+                root, query, alias, relationship_path, correlated=True
+            )
+            relationship = relationship.of_type(alias)
+            criteria.append(
+                relationship.any(and_(*nested_criteria))
+                if relationship.property.uselist
+                else relationship.has(and_(*nested_criteria))
+            )
+        return query, criteria
+
+    def filter(self, query: Union[Query, Select], model_class_without_alias=None):
+        """
+        Applies all the filters to the query. We had to add the model_class parameter in order
+        to specify which is the class model that initiates the call to the filter method,
+        otherwise when the alias was previously created that caused the query to be incorrect.
+
+        The relationships of the ordering fields are joined here too, so sort uses
+        the same aliases.
+        """
+        self._aliases = {}
+        self._model = model_class_without_alias
+        for path in self.get_ordering_paths():
+            query, _ = self.join_path(query, path, model_class_without_alias)
 
-                    def search_filter(field):
-                        return getattr(self.Constants.model, field).ilike(
-                            "%" + value + "%"
-                        )
-
-                    query = query.filter(
-                        or_(
-                            *list(
-                                map(search_filter, self.Constants.search_model_fields)
-                            )
-                        )
-                    )
-                # Start customization
-                elif operator == "unaccent":
-                    model_field = self.get_model_field(
-                        field_name, model_class_without_alias
-                    )
-                    field_ascii = unicodedata.normalize("NFD", value).encode(
-                        "ascii", "ignore"
-                    )
-                    value = field_ascii.decode("UTF-8")
-                    query = query.filter(unaccent(model_field).ilike("%" + value + "%"))
-                # End customization
-                else:
-                    model_field = self.get_model_field(
-                        field_name, model_class_without_alias
-                    )
-                    query = query.filter(getattr(model_field, operator)(value))
+        query, criteria = self.get_criteria(
+            self, query, self.get_model(model_class_without_alias)
+        )
+        if criteria:
+            query = query.filter(*criteria)
         return query
 
+    def get_ordering(self, model_class_without_alias=None) -> List[Tuple[Any, bool]]:
+        """
+        (column, descending) of every ordering field, followed by the primary key as
+        tie-breaker so that the order is total, as keyset pagination needs. The
+        tie-breaker follows the direction of the last field, so a (field, id) index
+        serves the order in either direction.
+        """
+        ordering = []
+        for field_name in self.ordering_values or []:
+            descending = field_name.startswith("-")
+            field_name = field_name.replace("-", "").replace("+", "")
+            ordering.append(
+                (self.get_order_by(field_name, model_class_without_alias), descending)
+            )
+
+        descending = ordering[-1][1] if ordering else False
+        mapper = inspect(self.Constants.model).mapper
+        for column in mapper.primary_key:
+            primary_key = self.get_model_field(
+                mapper.get_property_by_column(column).key, model_class_without_alias
+            )
+            if not any(field is primary_key for field, _ in ordering):
+                ordering.append((primary_key, descending))
+        return ordering
+
     def sort(self, query: Union[Query, Select], model_class_without_alias=None):
+        """
+        Orders by every ordering field, in order, and the primary key tie-breaker of
+        get_ordering, so pages of equal values are deterministic.
+        """
         if not self.ordering_values:
             return query
 
-        for field_name in self.ordering_values:
-            direction = Filter.Direction.asc
-            if field_name.startswith("-"):
-                direction = Filter.Direction.desc
-            field_name = field_name.replace("-", "").replace("+", "")
+        order_by = []
+        for order_by_field, descending in self.get_ordering(model_class_without_alias):
+            try:
+                order_by.append(
+                    order_by_field.desc() if descending else order_by_field.asc()
+                )
+            except NotImplementedError:
+                raise ValueError(f"{order_by_field.key} is not a valid ordering field.")
+        return query.order_by(*order_by)
+
 
-        order_by_field = self.get_order_by(field_name, model_class_without_alias)
+def FilterDepends(
+    filter_class: Type[Filter], *, by_alias: bool = False, use_cache: bool = True
+) -> Any:
+    """
+    fastapi_filter's FilterDepends, resolved to the validated filter instead of a
+    wrapper that builds a new filter on every filter and sort call. The endpoint and
+    its services share a single instance, so sort and get_ordering use the aliases
+    of the relationships joined by filter.
+    """
+    wrapper = WrapperFilterDepends(
+        filter_class, by_alias=by_alias, use_cache=use_cache
+    ).dependency
+
+    def get_filter(value: BaseModel = Depends(wrapper, use_cache=use_cache)):
         try:
-            query = query.order_by(getattr(order_by_field, direction)())
-        except NotImplementedError:
-            raise ValueError(f"{field_name} is not a valid ordering field.")
-        return query
+            return filter_class(**value.dict(by_alias=by_alias))
+        except ValidationError as e:
+            raise RequestValidationError(
+                [{**error, "loc": ("query", *error["loc"])} for error in e.errors()]
+            ) from e
+
+    return Depends(get_filter, use_cache=use_cache)
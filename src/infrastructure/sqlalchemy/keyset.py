@@ -0,0 +1,124 @@
+"""
+Keyset pagination: the next page starts right after the sort key of the last row
+of the previous one, so every page is an index range scan no matter how deep it
+is, instead of an OFFSET that reads and discards every previous row.
+"""
+import datetime
+import enum
+import json
+from decimal import Decimal
+from typing import Any, List, Sequence, Tuple, Union
+
+from sqlalchemy import and_, false, or_
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.selectable import Select
+
+# (column, descending)
+Ordering = List[Tuple[Any, bool]]
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_value(value: Any) -> Any:
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, Decimal):
+        return str(value)
+    return value
+
+
+def decode_value(column, value: Any) -> Any:
+    if value is None:
+        return None
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (datetime.datetime, datetime.date, datetime.time):
+        return python_type.fromisoformat(value)
+    if issubclass(python_type, (enum.Enum, Decimal)):
+        return python_type(value)
+    return value
+
+
+def encode_keyset(values: Sequence) -> str:
+    return json.dumps([encode_value(value) for value in values], separators=(",", ":"))
+
+
+def decode_keyset(cursor: str, ordering: Ordering) -> List:
+    try:
+        values = json.loads(cursor)
+        if not isinstance(values, list) or len(values) != len(ordering):
+            raise InvalidCursor(cursor)
+        return [
+            decode_value(column, value) for (column, _), value in zip(ordering, values)
+        ]
+    except (TypeError, ValueError) as e:
+        raise InvalidCursor(cursor) from e
+
+
+def _nullable(column) -> bool:
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+def _after(column, descending: bool, value):
+    # Postgres sorts NULLs as larger than any value: last ascending, first descending
+    if descending:
+        if value is None:
+            return column.is_not(None)
+        return column < value
+    if value is None:
+        return false()
+    if _nullable(column):
+        return or_(column > value, column.is_(None))
+    return column > value
+
+
+def _equal(column, value):
+    return column.is_(None) if value is None else column == value
+
+
+def keyset_condition(ordering: Ordering, values: Sequence):
+    """
+    Rows after values in the ordering: (a > va) OR (a = va AND b > vb) OR ...
+    """
+    conditions = []
+    for position, (column, descending) in enumerate(ordering):
+        conditions.append(
+            and_(
+                *[
+                    _equal(previous_column, previous_value)
+                    for (previous_column, _), previous_value in zip(
+                        ordering[:position], values
+                    )
+                ],
+                _after(column, descending, values[position]),
+            )
+        )
+    return or_(*conditions)
+
+
+def keyset_query(
+    query: Union[Query, Select], ordering: Ordering, values: Sequence | None, size: int
+) -> Union[Query, Select]:
+    """
+    Page of size + 1 rows, the extra one tells whether there is a next page. The
+    ordering columns are added to every row to build the cursor of the next page.
+    """
+    if values is not None:
+        query = query.filter(keyset_condition(ordering, values))
+    return (
+        query.order_by(None)
+        .order_by(
+            *[
+                column.desc() if descending else column.asc()
+                for column, descending in ordering
+            ]
+        )
+        .add_columns(*[column for column, _ in ordering])
+        .limit(size + 1)
+    )
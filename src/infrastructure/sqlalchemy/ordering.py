@@ -0,0 +1,137 @@
+"""
+Orderings a btree index can serve, and the planner estimate of the table sizes, to
+spot the list orderings that sort a whole large table on every request.
+"""
+import logging
+import threading
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+from sqlalchemy import Column, Table, UniqueConstraint, inspect, text
+
+from config.settings import settings
+from src.infrastructure.sqlalchemy.database import engine
+
+logger = logging.getLogger(__name__)
+
+# table name -> estimated rows, loaded by refresh_table_rows
+table_rows: Dict[str, int] = {}
+_refresh_thread = None
+
+
+class UnindexedOrdering(ValueError):
+    pass
+
+
+def get_table_column(field) -> Column | None:
+    """
+    Column of a mapped attribute of a class, None for relationships and for the
+    attributes of aliases, which are sorted after a join.
+    """
+    parent = getattr(field, "parent", None)
+    if parent is None or parent.is_aliased_class:
+        return None
+    columns = getattr(field.property, "columns", None)
+    if not columns or not isinstance(columns[0], Column):
+        return None
+    return columns[0]
+
+
+def get_leading_columns(table: Table) -> List[Column]:
+    """
+    First column of every index of the table, the unique constraints and the
+    primary key included, when it is a plain column.
+    """
+    column_lists = [list(table.primary_key.columns)]
+    column_lists += [
+        list(constraint.columns)
+        for constraint in table.constraints
+        if isinstance(constraint, UniqueConstraint)
+    ]
+    column_lists += [list(index.expressions) for index in table.indexes]
+    return [
+        columns[0]
+        for columns in column_lists
+        if columns and isinstance(columns[0], Column)
+    ]
+
+
+def is_ordering_indexed(ordering: Sequence[Tuple[Any, bool]]) -> bool:
+    """
+    Whether an index of the table leads with the first column of the ordering. The
+    index is scanned in that order, forward or backward, and Postgres sorts the rest
+    of the ordering, e.g. the primary key tie-breaker, incrementally within each
+    group of equal values instead of sorting the whole table.
+    """
+    column = get_table_column(ordering[0][0]) if ordering else None
+    if column is None:
+        return False
+    return any(
+        leading_column is column for leading_column in get_leading_columns(column.table)
+    )
+
+
+def load_table_rows() -> None:
+    """
+    Rows of every table estimated by the last ANALYZE, in a single query.
+    """
+    global table_rows
+    with engine.connect() as connection:
+        rows = connection.execute(
+            text(
+                "SELECT relname, greatest(reltuples, 0)::bigint FROM pg_class "
+                "WHERE relkind IN ('r', 'p') "
+                "AND relnamespace = 'public'::regnamespace"
+            )
+        ).all()
+    table_rows = {name: count for name, count in rows}
+
+
+def refresh_table_rows() -> None:
+    """
+    Loads the table estimates now and every UNINDEXED_ORDERING_ROWS_TTL seconds in
+    a daemon thread, so the validation of the orderings never queries them.
+    """
+    global _refresh_thread
+    if _refresh_thread is not None:
+        return
+
+    def refresh():
+        while True:
+            try:
+                load_table_rows()
+            except Exception:
+                logger.exception("Table row estimates could not be loaded")
+            time.sleep(settings.UNINDEXED_ORDERING_ROWS_TTL)
+
+    _refresh_thread = threading.Thread(target=refresh, daemon=True)
+    _refresh_thread.start()
+
+
+def get_table_rows(table: Table) -> int:
+    """
+    Estimated rows of the table, 0 until the estimates are loaded.
+    """
+    return table_rows.get(table.name, 0)
+
+
+def check_ordering(model, ordering: List[Tuple[Any, bool]], name: str, refuse: bool):
+    """
+    Warns about orderings no index serves on tables over UNINDEXED_ORDERING_ROWS
+    rows, and raises UnindexedOrdering instead when refuse and
+    UNINDEXED_ORDERING_FAIL are set.
+    """
+    if settings.UNINDEXED_ORDERING_ROWS is None or is_ordering_indexed(ordering):
+        return
+    table = inspect(model).mapper.local_table
+    rows = get_table_rows(table)
+    if rows <= settings.UNINDEXED_ORDERING_ROWS:
+        return
+    if refuse and settings.UNINDEXED_ORDERING_FAIL:
+        raise UnindexedOrdering(f"{name} is not an indexed ordering.")
+    logger.warning(
+        "[%s] Ordering by %s is not backed by an index (~%s rows)",
+        table.name,
+        name,
+        rows,
+    )
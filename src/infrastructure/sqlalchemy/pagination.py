@@ -0,0 +1,107 @@
+"""
+Pagination of querysets joined to n to many relationships, where a row of the
+query is not an instance: the instances are counted with COUNT(DISTINCT pk), the
+page is a limited query of primary keys, and the instances of the page are loaded
+afterwards with their relationships.
+"""
+import json
+from typing import Any, List, Tuple
+
+from sqlalchemy import distinct, func, inspect
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Query
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) of a statement, keeping its bound parameters.
+    """
+
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def get_entity(qs: Query):
+    return qs.column_descriptions[0]["entity"]
+
+
+def get_primary_key(qs: Query):
+    return inspect(get_entity(qs)).mapper.primary_key[0]
+
+
+def count_distinct(qs: Query) -> int:
+    return (
+        qs.order_by(None)
+        .with_entities(func.count(distinct(get_primary_key(qs))))
+        .scalar()
+    )
+
+
+def estimate_count(qs: Query) -> int:
+    """
+    Row count estimated by the planner, from the table statistics, without
+    running the query.
+    """
+    primary_key = get_primary_key(qs)
+    statement = qs.order_by(None).with_entities(primary_key).distinct().statement
+    plan = qs.session.execute(Explain(statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def page_ids_query(
+    qs: Query, ordering: List[Tuple[Any, bool]], limit: int, offset: int
+) -> Query:
+    """
+    Primary keys of a page, each one once however many related rows it joins.
+    ordering is the (column, descending) list of the filter, e.g. get_ordering();
+    the columns may be of joined relationships, so every instance is ordered by
+    the min() of its values, or the max() descending.
+    """
+    primary_key = get_primary_key(qs)
+    return (
+        qs.with_entities(primary_key)
+        .group_by(primary_key)
+        .order_by(None)
+        .order_by(
+            *[
+                func.max(column).desc() if descending else func.min(column).asc()
+                for column, descending in ordering
+            ]
+        )
+        .limit(limit)
+        .offset(offset)
+    )
+
+
+def get_page_ids(
+    qs: Query, ordering: List[Tuple[Any, bool]], limit: int, offset: int
+) -> List:
+    return [row[0] for row in page_ids_query(qs, ordering, limit, offset)]
+
+
+def get_page_items(qs: Query, ids: List, *options) -> List[Any]:
+    """
+    Instances of the ids, in the same order, with the relationships of options
+    eager loaded.
+    """
+    if not ids:
+        return []
+    entity = get_entity(qs)
+    primary_key = get_primary_key(qs)
+    items = {
+        inspect(item).identity[0]: item
+        for item in qs.session.query(entity)
+        .filter(primary_key.in_(ids))
+        .options(*options)
+    }
+    return [items[id_] for id_ in ids if id_ in items]
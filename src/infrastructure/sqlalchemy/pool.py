@@ -0,0 +1,119 @@
+import time
+from typing import Dict, List, Tuple
+
+from sqlalchemy import Engine, event, exc
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from src.infrastructure.metrics import registry, to_labels
+
+engines: List[Tuple[str, Engine]] = []
+
+checkouts = registry.counter(
+    "db_pool_checkouts_total", "Connections checked out from the pool."
+)
+connections_created = registry.counter(
+    "db_pool_connections_created_total", "New database connections opened."
+)
+invalidations = registry.counter(
+    "db_pool_invalidations_total", "Connections invalidated, e.g. after a disconnect."
+)
+timeouts = registry.counter(
+    "db_pool_timeouts_total", "Checkouts that gave up after the pool timeout."
+)
+wait_time = registry.histogram(
+    "db_pool_wait_seconds", "Time waiting for a connection of the pool."
+)
+hold_time = registry.histogram(
+    "db_pool_hold_seconds", "Time a connection is checked out of the pool."
+)
+
+
+def get_pool_status(method: str) -> Dict:
+    return {
+        to_labels({"pool": name}): getattr(engine.pool, method)()
+        for name, engine in engines
+        if isinstance(engine.pool, QueuePool)
+    }
+
+
+registry.gauge(
+    "db_pool_checked_out",
+    "Connections currently checked out.",
+    lambda: get_pool_status("checkedout"),
+)
+registry.gauge(
+    "db_pool_checked_in",
+    "Idle connections in the pool.",
+    lambda: get_pool_status("checkedin"),
+)
+registry.gauge(
+    "db_pool_overflow",
+    "Connections open beyond the pool size, negative while the pool is not full.",
+    lambda: get_pool_status("overflow"),
+)
+
+
+class PoolMetricsMixin:
+    """
+    Times every wait for a connection, including the connect of overflow
+    connections, and counts the waits that end in a pool timeout. The pool label is
+    the name given to instrument_engine, kept when the engine recreates the pool.
+    """
+
+    metrics_name = "default"
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics_name = self.metrics_name
+        return pool
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except exc.TimeoutError:
+            timeouts.inc(pool=self.metrics_name)
+            raise
+        finally:
+            wait_time.observe(time.perf_counter() - started_at, pool=self.metrics_name)
+
+
+class InstrumentedQueuePool(PoolMetricsMixin, QueuePool):
+    ...
+
+
+class InstrumentedAsyncAdaptedQueuePool(PoolMetricsMixin, AsyncAdaptedQueuePool):
+    ...
+
+
+def instrument_engine(engine: Engine, name: str) -> Engine:
+    """
+    Feed the pool events of the engine to the pool metrics, labelled with name. Pass
+    the sync_engine of async engines.
+    """
+    if isinstance(engine.pool, PoolMetricsMixin):
+        engine.pool.metrics_name = name
+
+    @event.listens_for(engine, "connect")
+    def on_connect(dbapi_connection, connection_record):
+        connections_created.inc(pool=name)
+
+    @event.listens_for(engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+        checkouts.inc(pool=name)
+
+    @event.listens_for(engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            hold_time.observe(
+                time.perf_counter() - checked_out_at, pool=name
+            )
+
+    @event.listens_for(engine, "invalidate")
+    def on_invalidate(dbapi_connection, connection_record, exception):
+        invalidations.inc(pool=name)
+
+    engines.append((name, engine))
+    return engine
@@ -0,0 +1,63 @@
+"""
+Count of the SQL statements executed, and their time, per request. Every engine is
+instrumented; the statements are attributed to the QueryStats of the current
+context, set by the query stats middleware for every request.
+"""
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, List
+
+from sqlalchemy import Engine, event
+
+
+class QueryStats:
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0  # seconds
+
+    def add(self, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+# Stats of count_queries blocks, fed by every thread
+collectors: List[QueryStats] = []
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.add(duration)
+    for collector in collectors:
+        collector.add(duration)
+
+
+def start_query_stats() -> QueryStats:
+    stats = QueryStats()
+    current_query_stats.set(stats)
+    return stats
+
+
+@contextmanager
+def count_queries() -> Iterator[QueryStats]:
+    """
+    Statements executed inside the block by any thread, e.g. by the app of a
+    TestClient.
+    """
+    stats = QueryStats()
+    collectors.append(stats)
+    try:
+        yield stats
+    finally:
+        collectors.remove(stats)
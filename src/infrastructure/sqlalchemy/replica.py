@@ -0,0 +1,75 @@
+import logging
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from src.infrastructure.cache.broadcast import PostgresBroadcast
+from src.infrastructure.cache.memory import TTLCache
+from src.infrastructure.sqlalchemy.database import (
+    RoutingSession,
+    async_replica_engine,
+    replica_engine,
+)
+
+logger = logging.getLogger(__name__)
+
+BROADCAST_CHANNEL = "replica_recent_writes"
+
+# user id -> True for the users that wrote in the read your writes window
+recent_writers = TTLCache(100_000, settings.DATABASE_REPLICA_READ_YOUR_WRITES)
+broadcast = PostgresBroadcast(BROADCAST_CHANNEL)
+
+
+def set_session_user(db: Session, user_id: int) -> None:
+    """
+    Writes committed by the session are attributed to the user.
+    """
+    db.info["user_id"] = user_id
+
+
+def mark_recent_writer(user_id: int) -> None:
+    recent_writers.set(user_id, True)
+    if settings.DATABASE_REPLICA_BROADCAST:
+        broadcast.publish(str(user_id))
+
+
+def is_recent_writer(user_id: int) -> bool:
+    return recent_writers.get(user_id, False)
+
+
+def listen_recent_writers() -> None:
+    broadcast.listen(lambda message: recent_writers.set(int(message), True))
+
+
+def use_replica(db: Session, user_id: int) -> Session:
+    """
+    Send the queries of db to the replica, unless the user wrote lately and the
+    replica may not have the changes yet.
+    """
+    if replica_engine is not None and not is_recent_writer(user_id):
+        db.replica_bind = replica_engine
+    return db
+
+
+def use_async_replica(db: AsyncSession, user_id: int) -> AsyncSession:
+    if async_replica_engine is not None and not is_recent_writer(user_id):
+        db.sync_session.replica_bind = async_replica_engine.sync_engine
+    return db
+
+
+@event.listens_for(RoutingSession, "after_flush")
+def receive_after_flush(session: Session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(RoutingSession, "after_commit")
+def receive_after_commit(session: Session):
+    if session.info.pop("has_writes", False) and "user_id" in session.info:
+        mark_recent_writer(session.info["user_id"])
+
+
+@event.listens_for(RoutingSession, "after_rollback")
+def receive_after_rollback(session: Session):
+    session.info.pop("has_writes", None)
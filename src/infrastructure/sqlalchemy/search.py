@@ -0,0 +1,26 @@
+from typing import List
+
+from sqlalchemy import func
+from sqlalchemy.orm import Query, Session
+
+from src.modules.search.models import SearchDocument
+
+
+def get_search_queryset(
+    db: Session, tsquery: str, entity_types: List[str] | None, limit: int
+) -> Query:
+    """
+    Documents matching the tsquery, best ranked first.
+    """
+    query = func.to_tsquery("simple", tsquery)
+    rank = func.ts_rank(SearchDocument.document, query)
+    queryset = db.query(
+        SearchDocument.entity_type,
+        SearchDocument.entity_id,
+        SearchDocument.title,
+        SearchDocument.subtitle,
+        rank.label("rank"),
+    ).filter(SearchDocument.document.op("@@")(query))
+    if entity_types:
+        queryset = queryset.filter(SearchDocument.entity_type.in_(entity_types))
+    return queryset.order_by(rank.desc(), SearchDocument.id).limit(limit)
@@ -0,0 +1,140 @@
+from datetime import date, datetime
+from typing import IO, Dict, List
+
+from sqlalchemy import func, text, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.database import engine
+from src.modules.sips.models import SipsCacheEntry, SipsDumpRecord
+from src.sips.reader import SIPSTypes
+
+
+def get_sips_cache_entries(
+    db: Session, sips_type: SIPSTypes, cups: List[str], min_fetched_at: datetime
+) -> List[SipsCacheEntry]:
+    return (
+        db.query(SipsCacheEntry)
+        .filter(
+            SipsCacheEntry.sips_type == sips_type,
+            SipsCacheEntry.cups.in_(cups),
+            SipsCacheEntry.fetched_at >= min_fetched_at,
+        )
+        .all()
+    )
+
+
+def increment_sips_cache_hits(entry_ids: List[int]) -> None:
+    """
+    Counted on a connection of its own, committing the session of the lookup would
+    also commit the pending changes of the caller.
+    """
+    with engine.begin() as connection:
+        connection.execute(
+            update(SipsCacheEntry)
+            .where(SipsCacheEntry.id.in_(entry_ids))
+            .values(hit_count=SipsCacheEntry.hit_count + 1)
+        )
+
+
+def upsert_sips_cache_entries(
+    sips_type: SIPSTypes, records_by_cups: Dict[str, List[Dict]]
+) -> None:
+    """
+    Written on a connection of its own, like the hit counts, so the session of the
+    caller is never committed here.
+    """
+    fetched_at = datetime.utcnow()
+    statement = insert(SipsCacheEntry).values(
+        [
+            {
+                "cups": cups,
+                "sips_type": sips_type,
+                "records": records,
+                "fetched_at": fetched_at,
+                "hit_count": 0,
+            }
+            for cups, records in records_by_cups.items()
+        ]
+    )
+    statement = statement.on_conflict_do_update(
+        index_elements=[SipsCacheEntry.cups, SipsCacheEntry.sips_type],
+        set_={
+            "records": statement.excluded.records,
+            "fetched_at": statement.excluded.fetched_at,
+        },
+    )
+    with engine.begin() as connection:
+        connection.execute(statement)
+
+
+def delete_sips_cache_entries(db: Session, *filters) -> None:
+    db.query(SipsCacheEntry).filter(*filters).delete()
+    db.commit()
+
+
+def create_sips_dump_stage(db: Session) -> None:
+    db.execute(
+        text(
+            "CREATE TEMP TABLE IF NOT EXISTS sips_dump_stage ("
+            "position bigserial, sips_type text NOT NULL, cups text NOT NULL, "
+            "record_date date NOT NULL, data jsonb NOT NULL"
+            ") ON COMMIT DELETE ROWS"
+        )
+    )
+
+
+def copy_sips_dump_stage(db: Session, buffer: IO[str]) -> None:
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY sips_dump_stage (sips_type, cups, record_date, data) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+
+def merge_sips_dump_stage(db: Session) -> int:
+    """
+    Move the staged rows to sips_dump. The same CUPS and date may appear twice in a
+    chunk, only the last one copied is kept, the position of the stage follows the
+    COPY order. The stage is emptied on commit.
+    """
+    result = db.execute(
+        text(
+            "INSERT INTO sips_dump (sips_type, cups, record_date, data, imported_at) "
+            "SELECT DISTINCT ON (sips_type, cups, record_date) "
+            "sips_type::sipstypes, cups, record_date, data, timezone('utc', now()) "
+            "FROM sips_dump_stage "
+            "ORDER BY sips_type, cups, record_date, position DESC "
+            "ON CONFLICT (sips_type, cups, record_date) DO UPDATE "
+            "SET data = excluded.data, imported_at = excluded.imported_at"
+        )
+    )
+    db.commit()
+    return result.rowcount
+
+
+def get_sips_dump_last_record_date(db: Session, sips_type: SIPSTypes) -> date | None:
+    return (
+        db.query(func.max(SipsDumpRecord.record_date))
+        .filter(SipsDumpRecord.sips_type == sips_type)
+        .scalar()
+    )
+
+
+def get_sips_dump_records(
+    db: Session, sips_type: SIPSTypes, cups: List[str], latest_only: bool = False
+) -> List[SipsDumpRecord]:
+    query = db.query(SipsDumpRecord).filter(
+        SipsDumpRecord.sips_type == sips_type, SipsDumpRecord.cups.in_(cups)
+    )
+    if latest_only:
+        query = query.distinct(SipsDumpRecord.cups).order_by(
+            SipsDumpRecord.cups, SipsDumpRecord.record_date.desc()
+        )
+    else:
+        query = query.order_by(SipsDumpRecord.cups, SipsDumpRecord.record_date)
+    return query.all()
@@ -1,8 +1,13 @@
-from typing import List
+from datetime import datetime, timedelta
+from typing import Dict, List
 
+from sqlalchemy import Numeric, Select, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.modules.supply_points.models import SupplyPoint
+from src.modules.rates.models import EnergyType
+from src.modules.supply_points.models import SupplyPoint, SupplyPointConsumption
 
 
 def create_supply_point_db(db: Session, supply_point: SupplyPoint) -> SupplyPoint:
@@ -21,3 +26,123 @@ def get_supply_point_queryset(db: Session, join_list: List = None, *filters):
 
 def get_supply_point_by(db: Session, *filters) -> SupplyPoint:
     return db.query(SupplyPoint).filter(*filters).first()
+
+
+def get_supply_point_async_queryset(join_list: List = None, *filters) -> Select:
+    queryset = select(SupplyPoint).filter(*filters)
+    if join_list:
+        queryset = queryset.join(*join_list)
+    return queryset
+
+
+async def get_supply_point_by_async(
+    db: AsyncSession, *filters, options: List = None
+) -> SupplyPoint:
+    return await db.scalar(
+        select(SupplyPoint).filter(*filters).options(*(options or [])).limit(1)
+    )
+
+
+def get_refreshable_supply_points_queryset(db: Session, *filters):
+    return (
+        db.query(
+            SupplyPoint.id,
+            SupplyPoint.cups,
+            SupplyPoint.max_available_power,
+            SupplyPoint.counter_type,
+        )
+        .filter(
+            SupplyPoint.is_active.is_(True),
+            SupplyPoint.energy_type == EnergyType.electricity,
+            *filters,
+        )
+        .order_by(SupplyPoint.id)
+    )
+
+
+def get_supply_points_batch(db: Session, last_id: int, limit: int) -> List:
+    return (
+        get_refreshable_supply_points_queryset(db, SupplyPoint.id > last_id)
+        .limit(limit)
+        .all()
+    )
+
+
+def get_supply_points_by_ids(db: Session, ids: List[int]) -> List:
+    return get_refreshable_supply_points_queryset(db, SupplyPoint.id.in_(ids)).all()
+
+
+def bulk_update_supply_points(db: Session, values: List[Dict]) -> None:
+    """
+    values holds one dict per supply point with its id and the fields to update.
+    """
+    if not values:
+        return
+
+    db.execute(update(SupplyPoint), values)
+    db.commit()
+
+
+def upsert_supply_point_consumptions(db: Session, consumptions: List[Dict]) -> None:
+    if not consumptions:
+        return
+
+    statement = insert(SupplyPointConsumption).values(consumptions)
+    statement = statement.on_conflict_do_update(
+        index_elements=[SupplyPointConsumption.cups, SupplyPointConsumption.start_date],
+        set_={
+            column: statement.excluded[column]
+            for column in consumptions[0].keys()
+            if column not in ("cups", "start_date")
+        },
+    )
+    db.execute(statement)
+    db.commit()
+
+
+def delete_supply_point_consumptions(db: Session, cups: List[str]) -> None:
+    db.query(SupplyPointConsumption).filter(
+        SupplyPointConsumption.cups.in_(cups)
+    ).delete()
+    db.commit()
+
+
+def get_supply_point_consumption_last_update(db: Session, cups: str) -> datetime | None:
+    return (
+        db.query(func.max(SupplyPointConsumption.create_at))
+        .filter(SupplyPointConsumption.cups == cups)
+        .scalar()
+    )
+
+
+def get_supply_point_consumption_summary(db: Session, cups: str):
+    """
+    Active energy of the last 12 months (in kWh) and the period they cover, computed
+    in a single aggregate over the cups history.
+    """
+    last_end_date = (
+        select(func.max(SupplyPointConsumption.end_date))
+        .where(SupplyPointConsumption.cups == cups)
+        .scalar_subquery()
+    )
+    return (
+        db.query(
+            func.min(SupplyPointConsumption.start_date).label("start_date"),
+            func.max(SupplyPointConsumption.end_date).label("end_date"),
+            *[
+                func.round(
+                    func.sum(
+                        getattr(SupplyPointConsumption, f"active_energy_p{i}")
+                    ).cast(Numeric)
+                    / 1000,
+                    2,
+                ).label(f"consumption_p{i}")
+                for i in range(1, 7)
+            ],
+        )
+        .filter(
+            SupplyPointConsumption.cups == cups,
+            SupplyPointConsumption.start_date >= last_end_date - timedelta(days=365),
+        )
+        .one()
+    )
@@ -10,7 +10,6 @@ def get_user_by(db: Session, *filters) -> User:
     return db.query(User).filter(*filters).first()
 
 
-# TODO -> Check sql num queries executed
 def get_users_queryset(db: Session, join_list: List = None, *filters) -> List[User]:
     queryset = db.query(User).filter(*filters)
     if join_list:
@@ -0,0 +1,18 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+
+from src.infrastructure.sqlalchemy.database import Base
+
+
+class CatalogVersion(Base):
+    """
+    Version of a catalog table, e.g. rate types or marketers. Database triggers
+    increment it on every statement that writes the table, bulk updates included.
+    """
+
+    __tablename__ = "catalog_version"
+
+    name = Column(String(64), primary_key=True)
+    version = Column(BigInteger, default=0, nullable=False)
+    modified_at = Column(DateTime, default=datetime.utcnow, nullable=False)
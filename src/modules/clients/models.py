@@ -1,10 +1,19 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.orm import relationship
 
-from src.infrastructure.sqlalchemy.database import Base
+from src.infrastructure.sqlalchemy.database import Base, trigram_index
 from src.modules.contacts.models import Contact
 from src.modules.rates.models import ClientType
 
@@ -50,6 +59,12 @@ class Client(Base):
 
     is_renewable = Column(Boolean, default=False, nullable=False)
 
+    __table_args__ = (
+        # Keyset pagination in the default order
+        Index("ix_client_create_at_id", "create_at", "id"),
+        trigram_index("ix_client_fiscal_name_trgm", fiscal_name),
+    )
+
     supply_points = relationship("SupplyPoint", back_populates="client")
 
     def __str__(self):
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.clients import schemas
 from src.modules.users.models import User
 from src.services.clients import (
@@ -13,13 +16,16 @@ from src.services.clients import (
     client_partial_update,
     client_update,
     delete_clients,
-    get_client,
+    get_client_async,
     list_client,
+    list_client_async,
 )
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
+    get_async_read_db,
     get_current_user,
-    paginate_queryset_with_n_to_many,
+    get_read_db,
+    paginate_keyset_async,
 )
 from src.services.exceptions import RESPONSES
 
@@ -47,14 +53,33 @@ def client_create_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def client_list_endpoint(
+async def client_list_endpoint(
     client_filter: schemas.ClientFilter = FilterDepends(
         schemas.ClientFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> AbstractPage[schemas.ClientListResponse]:
-    return paginate_queryset_with_n_to_many(list_client(db, client_filter), params)
+    return await paginate(db, list_client_async(client_filter), params)
+
+
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[schemas.ClientListResponse],
+    dependencies=[Depends(get_current_user)],
+    responses={**RESPONSES},
+)
+async def client_cursor_list_endpoint(
+    client_filter: schemas.ClientFilter = FilterDepends(
+        schemas.ClientFilter, use_cache=False
+    ),
+    params: CursorParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> CursorPage[schemas.ClientListResponse]:
+    return await paginate_keyset_async(
+        db, list_client_async(client_filter), client_filter, params
+    )
 
 
 @router.patch(
@@ -79,11 +104,11 @@ def client_update_partial_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def user_detail_endpoint(
+async def user_detail_endpoint(
     client_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> schemas.ClientUpdateDetailResponse:
-    return get_client(db, client_id)
+    return await get_client_async(db, client_id)
 
 
 @router.put(
@@ -117,7 +142,7 @@ def delete_client_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -125,12 +150,8 @@ def client_export_endpoint(
     client_filter: schemas.ClientFilter = FilterDepends(
         schemas.ClientFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "clients",
-            schemas.client_export_headers,
-            list_client(db, client_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "clients", schemas.client_export_headers, list_client(db, client_filter)
     )
@@ -7,6 +7,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -34,6 +35,7 @@ commissions_rates_association = Table(
     Column("commission_id", ForeignKey("commission.id")),
     Column("rate_id", ForeignKey("rate.id")),
     UniqueConstraint("commission_id", "rate_id"),
+    Index("ix_commissions_rates_rate_id_commission_id", "rate_id", "commission_id"),
 )
 
 
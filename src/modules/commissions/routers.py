@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.commissions import schemas
+from src.services.catalogs import COMMISSION_ETAG
 from src.services.commissions import (
+    COMMISSION_LIST_OPTIONS,
     commission_create,
     commission_partial_update,
     commission_update,
@@ -16,8 +18,9 @@ from src.services.commissions import (
     list_commissions,
 )
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
     get_current_user,
+    get_read_db,
     paginate_queryset_with_n_to_many,
 )
 from src.services.exceptions import RESPONSES
@@ -62,12 +65,12 @@ def commission_update_endpoint(
     "/{commission_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.CommissionUpdateDetailListResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(COMMISSION_ETAG)],
     responses={**RESPONSES},
 )
 def commission_detail_endpoint(
     commission_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.CommissionUpdateDetailListResponse:
     return get_commission(db, commission_id)
 
@@ -95,7 +98,7 @@ def commission_update_partial_endpoint(
     "",
     status_code=status.HTTP_200_OK,
     response_model=Page[schemas.CommissionUpdateDetailListResponse],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(COMMISSION_ETAG)],
     responses={**RESPONSES},
 )
 def commission_list_endpoint(
@@ -103,10 +106,13 @@ def commission_list_endpoint(
         schemas.CommissionFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.CommissionUpdateDetailListResponse]:
     return paginate_queryset_with_n_to_many(
-        list_commissions(db, commission_filter), params
+        list_commissions(db, commission_filter),
+        commission_filter.get_ordering(),
+        params,
+        *COMMISSION_LIST_OPTIONS,
     )
 
 
@@ -126,7 +132,7 @@ def delete_commissions_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -134,12 +140,10 @@ def commission_export_endpoint(
     commission_filter: schemas.CommissionFilter = FilterDepends(
         schemas.CommissionFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "commissions",
-            schemas.commission_export_headers,
-            list_commissions(db, commission_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "commissions",
+        schemas.commission_export_headers,
+        list_commissions(db, commission_filter),
     )
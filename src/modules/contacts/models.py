@@ -3,7 +3,7 @@ from datetime import datetime
 from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
 from sqlalchemy.orm import relationship
 
-from src.infrastructure.sqlalchemy.database import Base
+from src.infrastructure.sqlalchemy.database import Base, trigram_index
 
 
 class Contact(Base):
@@ -24,5 +24,11 @@ class Contact(Base):
     user_id = Column(Integer, ForeignKey("user_table.id"), nullable=False)
     user = relationship("User", back_populates="contacts")
 
+    __table_args__ = (
+        trigram_index("ix_contact_name_trgm", name),
+        trigram_index("ix_contact_email_trgm", email),
+        trigram_index("ix_contact_phone_trgm", phone),
+    )
+
     def __str__(self):
         return f"{self.__class__.__name__}: {self.name}"
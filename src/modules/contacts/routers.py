@@ -1,25 +1,29 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.contacts import schemas
 from src.modules.users.models import User
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
+    get_async_read_db,
     get_current_user,
-    paginate_queryset_with_n_to_many,
+    get_read_db,
 )
 from src.services.contacts import (
     contact_create,
     contact_partial_update,
     contact_update,
     delete_contacts,
-    get_contact,
+    get_contact_async,
     list_contact,
+    list_contact_async,
 )
 from src.services.exceptions import RESPONSES
 
@@ -47,14 +51,14 @@ def contact_create_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def contact_list_endpoint(
+async def contact_list_endpoint(
     contact_filter: schemas.ContactFilter = FilterDepends(
         schemas.ContactFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> AbstractPage[schemas.ContactListResponse]:
-    return paginate_queryset_with_n_to_many(list_contact(db, contact_filter), params)
+    return await paginate(db, list_contact_async(contact_filter), params)
 
 
 @router.patch(
@@ -79,11 +83,11 @@ def contact_update_partial_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def user_detail_endpoint(
+async def user_detail_endpoint(
     contact_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> schemas.ContactUpdateDetailResponse:
-    return get_contact(db, contact_id)
+    return await get_contact_async(db, contact_id)
 
 
 @router.put(
@@ -117,7 +121,7 @@ def deletecontact_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -125,12 +129,8 @@ def contact_export_endpoint(
     contact_filter: schemas.ContactFilter = FilterDepends(
         schemas.ContactFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "contacts",
-            schemas.contact_export_headers,
-            list_contact(db, contact_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "contacts", schemas.contact_export_headers, list_contact(db, contact_filter)
     )
@@ -1,19 +1,21 @@
 from fastapi import APIRouter, Depends, status
-from fastapi_filter import FilterDepends
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from sqlalchemy.orm import Session
-from starlette.responses import FileResponse
+from starlette.responses import StreamingResponse
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.contracts import schemas
 from src.modules.users.models import User
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
     get_current_user,
+    get_read_db,
     paginate_queryset_with_n_to_many,
 )
 from src.services.contracts import (
+    CONTRACT_LIST_OPTIONS,
     contract_create,
     contract_partial_update,
     contract_update,
@@ -52,9 +54,14 @@ def contract_list_endpoint(
         schemas.ContractFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.ContractListResponse]:
-    return paginate_queryset_with_n_to_many(list_contract(db, contract_filter), params)
+    return paginate_queryset_with_n_to_many(
+        list_contract(db, contract_filter),
+        contract_filter.get_ordering(),
+        params,
+        *CONTRACT_LIST_OPTIONS,
+    )
 
 
 @router.patch(
@@ -81,7 +88,7 @@ def contract_update_partial_endpoint(
 )
 def user_detail_endpoint(
     contract_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.ContractUpdateDetailResponse:
     return get_contract(db, contract_id)
 
@@ -117,7 +124,7 @@ def delete_contract_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -125,12 +132,8 @@ def contract_export_endpoint(
     contract_filter: schemas.ContractFilter = FilterDepends(
         schemas.ContractFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "contracts",
-            schemas.contract_export_headers,
-            list_contract(db, contract_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "contracts", schemas.contract_export_headers, list_contract(db, contract_filter)
     )
@@ -7,11 +7,14 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     Table,
     UniqueConstraint,
+    false,
+    true,
 )
 from sqlalchemy.orm import relationship
 
@@ -51,6 +54,7 @@ other_cost_rates_association = Table(
     Column("other_cost_id", ForeignKey("other_cost.id")),
     Column("rate_id", ForeignKey("rate.id")),
     UniqueConstraint("other_cost_id", "rate_id"),
+    Index("ix_other_costs_rates_rate_id_other_cost_id", "rate_id", "other_cost_id"),
 )
 
 
@@ -74,6 +78,17 @@ class OtherCost(Base):
     is_active = Column(Boolean, default=True, nullable=False)
     is_deleted = Column(Boolean, default=False, nullable=False)
 
+    __table_args__ = (
+        # Mandatory costs of the rates of a saving study
+        Index(
+            "ix_other_cost_id_mandatory",
+            "id",
+            postgresql_where=(is_deleted == false())
+            & (is_active == true())
+            & (mandatory == true()),
+        ),
+    )
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {self.name}"
 
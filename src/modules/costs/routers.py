@@ -1,20 +1,23 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.costs import schemas
 from src.modules.users.models import User
+from src.services.catalogs import ENERGY_COST_ETAG
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
     get_current_user,
+    get_read_db,
     paginate_queryset_with_n_to_many,
 )
 from src.services.costs import (
+    OTHER_COST_LIST_OPTIONS,
     delete_energy_costs,
     delete_other_costs,
     energy_cost_create,
@@ -50,7 +53,7 @@ def energy_cost_create_endpoint(
 @router.get(
     "/energy-costs",
     response_model=Page[schemas.CostInfo],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(ENERGY_COST_ETAG)],
     responses={**RESPONSES},
 )
 def energy_costs_list_endpoint(
@@ -58,7 +61,7 @@ def energy_costs_list_endpoint(
         schemas.EnergyCostFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.CostInfo]:
     return paginate(list_energy_costs(db, energy_cost_filter), params)
 
@@ -87,11 +90,11 @@ def energy_cost_update_partial_endpoint(
     "/energy-costs/amount-range",
     status_code=status.HTTP_200_OK,
     response_model=schemas.EnergyCostAmountRangeResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(ENERGY_COST_ETAG)],
     responses={**RESPONSES},
 )
 def energy_cost_min_max_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.EnergyCostAmountRangeResponse:
     return get_energy_cost_amount_range(db)
 
@@ -100,12 +103,12 @@ def energy_cost_min_max_endpoint(
     "/energy-costs/{energy_cost_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.CostInfo,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(ENERGY_COST_ETAG)],
     responses={**RESPONSES},
 )
 def energy_cost_detail_endpoint(
     energy_cost_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.CostInfo:
     return get_energy_cost(db, energy_cost_id)
 
@@ -127,7 +130,7 @@ def delete_energy_costs_endpoint(
 @router.post(
     "/energy-costs/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -136,13 +139,11 @@ def energy_costs_export_endpoint(
         schemas.EnergyCostFilter, use_cache=False
     ),
     db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "energy_costs",
-            schemas.energy_cost_export_headers,
-            list_energy_costs(db, energy_cost_filter).all(),
-        )
+) -> StreamingResponse:
+    return csv_response(
+        "energy_costs",
+        schemas.energy_cost_export_headers,
+        list_energy_costs(db, energy_cost_filter),
     )
 
 
@@ -191,10 +192,13 @@ def other_cost_list_endpoint(
         schemas.OtherCostFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.OtherCostUpdateListDetailResponse]:
     return paginate_queryset_with_n_to_many(
-        list_other_costs(db, other_cost_filter), params
+        list_other_costs(db, other_cost_filter),
+        other_cost_filter.get_ordering(),
+        params,
+        *OTHER_COST_LIST_OPTIONS,
     )
 
 
@@ -207,7 +211,7 @@ def other_cost_list_endpoint(
 )
 def user_detail_endpoint(
     other_cost_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.OtherCostUpdateListDetailResponse:
     return get_other_cost(db, other_cost_id)
 
@@ -247,7 +251,7 @@ def delete_other_costs_endpoint(
 @router.post(
     "/costs/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -256,11 +260,9 @@ def other_cost_export_endpoint(
         schemas.OtherCostFilter, use_cache=False
     ),
     db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "other_costs",
-            schemas.other_cost_export_headers,
-            list_other_costs(db, other_cost_filter).all(),
-        )
+) -> StreamingResponse:
+    return csv_response(
+        "other_costs",
+        schemas.other_cost_export_headers,
+        list_other_costs(db, other_cost_filter),
     )
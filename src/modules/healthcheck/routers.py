@@ -1,10 +1,16 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, status
+from fastapi.responses import PlainTextResponse
 
+from config.settings import settings
+from src.infrastructure.metrics import registry
 from src.modules.healthcheck import schemas
 from src.services.exceptions import RESPONSES
 
 router = APIRouter(prefix="/__status__", tags=["healthcheck"])
 
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
 
 @router.get("/", response_model=schemas.HealthCheck, responses={**RESPONSES})
 def api_status() -> schemas.HealthCheck:
@@ -14,3 +20,10 @@ def api_status() -> schemas.HealthCheck:
 @router.get("/sentry-debug")
 def trigger_error():
     return 1 / 0
+
+
+@router.get("/metrics", include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    return PlainTextResponse(registry.render(), media_type=CONTENT_TYPE)
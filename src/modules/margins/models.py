@@ -7,9 +7,11 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
+    false,
 )
 from sqlalchemy.orm import relationship
 
@@ -38,5 +40,13 @@ class Margin(Base):
 
     rate = relationship("Rate", back_populates="margin")
 
+    __table_args__ = (
+        Index(
+            "ix_margin_rate_id_not_deleted",
+            "rate_id",
+            postgresql_where=is_deleted == false(),
+        ),
+    )
+
     def __str__(self):
         return f"{self.__class__.__name__}: {self.type} for rate_id {self.rate_id}"
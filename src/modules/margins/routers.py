@@ -1,14 +1,15 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.margins import schemas
-from src.services.common import generate_csv_file, get_current_user
+from src.services.catalogs import MARGIN_ETAG
+from src.services.common import csv_response, get_current_user, get_read_db
 from src.services.exceptions import RESPONSES
 from src.services.margins import (
     delete_margins,
@@ -59,7 +60,7 @@ def margin_update_endpoint(
     "",
     status_code=status.HTTP_200_OK,
     response_model=Page[schemas.MarginListDetailPartialUpdateResponse],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(MARGIN_ETAG)],
     responses={**RESPONSES},
 )
 def margin_list_endpoint(
@@ -67,7 +68,7 @@ def margin_list_endpoint(
         schemas.MarginFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.MarginListDetailPartialUpdateResponse]:
     return paginate(list_margins(db, margin_filter), params)
 
@@ -76,12 +77,12 @@ def margin_list_endpoint(
     "/{margin_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.MarginListDetailPartialUpdateResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(MARGIN_ETAG)],
     responses={**RESPONSES},
 )
 def user_detail_endpoint(
     margin_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.MarginListDetailPartialUpdateResponse:
     return get_margin(db, margin_id)
 
@@ -121,7 +122,7 @@ def delete_margins_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -129,12 +130,8 @@ def margin_export_endpoint(
     margin_filter: schemas.MarginFilter = FilterDepends(
         schemas.MarginFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "margins",
-            schemas.margin_export_headers,
-            list_margins(db, margin_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "margins", schemas.margin_export_headers, list_margins(db, margin_filter)
     )
@@ -1,6 +1,16 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, Numeric, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    Numeric,
+    String,
+    false,
+)
 from sqlalchemy.orm import relationship
 
 from src.infrastructure.sqlalchemy.database import Base
@@ -50,5 +60,13 @@ class Marketer(Base):
     user = relationship("User", back_populates="marketers")
     rate = relationship("Rate", back_populates="marketer", uselist=False)
 
+    __table_args__ = (
+        Index(
+            "ix_marketer_create_at_not_deleted",
+            "create_at",
+            postgresql_where=is_deleted == false(),
+        ),
+    )
+
     def __str__(self):
         return f"{self.__class__.__name__}: {self.fiscal_name}"
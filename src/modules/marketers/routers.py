@@ -1,20 +1,23 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.marketers import schemas
 from src.modules.users.models import User
+from src.services.catalogs import MARKETER_ETAG
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
     get_current_user,
+    get_read_db,
     paginate_queryset_with_n_to_many,
 )
 from src.services.exceptions import RESPONSES
 from src.services.marketers import (
+    MARKETER_LIST_OPTIONS,
     delete_marketers,
     get_marketer,
     list_marketer,
@@ -44,7 +47,7 @@ def marketer_create_endpoint(
     "",
     status_code=status.HTTP_200_OK,
     response_model=Page[schemas.MarketerListResponse],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(MARKETER_ETAG)],
     responses={**RESPONSES},
 )
 def marketer_list_endpoint(
@@ -52,9 +55,14 @@ def marketer_list_endpoint(
         schemas.MarketerFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.MarketerListResponse]:
-    return paginate_queryset_with_n_to_many(list_marketer(db, marketer_filter), params)
+    return paginate_queryset_with_n_to_many(
+        list_marketer(db, marketer_filter),
+        marketer_filter.get_ordering(),
+        params,
+        *MARKETER_LIST_OPTIONS,
+    )
 
 
 @router.patch(
@@ -80,12 +88,12 @@ def marketer_update_partial_endpoint(
     "/{marketer_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.MarketerUpdateDetailResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(MARKETER_ETAG)],
     responses={**RESPONSES},
 )
 def user_detail_endpoint(
     marketer_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.MarketerUpdateDetailResponse:
     return get_marketer(db, marketer_id)
 
@@ -125,7 +133,7 @@ def deletemarketer_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -133,12 +141,8 @@ def marketer_export_endpoint(
     marketer_filter: schemas.MarketerFilter = FilterDepends(
         schemas.MarketerFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "marketers",
-            schemas.marketer_export_headers,
-            list_marketer(db, marketer_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "marketers", schemas.marketer_export_headers, list_marketer(db, marketer_filter)
     )
@@ -7,10 +7,13 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
     UniqueConstraint,
+    false,
+    true,
 )
 from sqlalchemy.orm import relationship
 
@@ -120,6 +123,16 @@ class Rate(Base):
 
     contracts = relationship("Contract", back_populates="rate")
 
+    __table_args__ = (
+        # Candidate rates of a saving study
+        Index(
+            "ix_rate_candidates",
+            "rate_type_id",
+            "price_type",
+            postgresql_where=(is_deleted == false()) & (is_active == true()),
+        ),
+    )
+
     def __str__(self) -> str:
         return f"{self.__class__.__name__}: {self.name}"
 
@@ -1,15 +1,24 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
 from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.rates import schemas
+from src.modules.rates.models import Rate
 from src.modules.users.models import User
-from src.services.common import generate_csv_file, get_current_user
+from src.services.catalogs import RATE_ETAG, RATE_TYPE_ETAG
+from src.services.common import (
+    FieldSet,
+    SparseFields,
+    csv_response,
+    get_current_user,
+    get_read_db,
+    paginate_fields,
+)
 from src.services.exceptions import RESPONSES
 from src.services.rates import (
     delete_rate_types,
@@ -46,7 +55,7 @@ def rate_type_create_endpoint(
 @router.get(
     "/rate-types",
     response_model=Page[schemas.RateTypeInfo],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(RATE_TYPE_ETAG)],
     responses={**RESPONSES},
 )
 def rate_types_list_endpoint(
@@ -54,7 +63,7 @@ def rate_types_list_endpoint(
         schemas.RateTypeFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.RateTypeInfo]:
     return paginate(list_rate_types(db, rate_type_filter), params)
 
@@ -82,11 +91,11 @@ def rate_type_update_partial_endpoint(
     "/rate-types/power-ranges",
     status_code=status.HTTP_200_OK,
     response_model=schemas.RateTypePowerRangesResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(RATE_TYPE_ETAG)],
     responses={**RESPONSES},
 )
 def rate_type_min_max_endpoint(
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.RateTypePowerRangesResponse:
     return get_rate_type_power_ranges(db)
 
@@ -95,12 +104,12 @@ def rate_type_min_max_endpoint(
     "/rate-types/{rate_type_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.RateTypeInfo,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(RATE_TYPE_ETAG)],
     responses={**RESPONSES},
 )
 def rate_type_detail_endpoint(
     rate_type_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.RateTypeInfo:
     return get_rate_type(db, rate_type_id)
 
@@ -121,7 +130,7 @@ def delete_rate_types_endpoint(
 @router.post(
     "/rate-types/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -130,13 +139,11 @@ def rate_type_export_endpoint(
         schemas.RateTypeFilter, use_cache=False
     ),
     db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "rate_types",
-            schemas.rate_type_export_headers,
-            list_rate_types(db, rate_type_filter).all(),
-        )
+) -> StreamingResponse:
+    return csv_response(
+        "rate_types",
+        schemas.rate_type_export_headers,
+        list_rate_types(db, rate_type_filter),
     )
 
 
@@ -195,7 +202,7 @@ def rate_update_partial_endpoint(
 @router.get(
     "/rates",
     response_model=Page[schemas.RateUpdateDetailListResponse],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(RATE_ETAG)],
     responses={**RESPONSES},
 )
 def rate_list_endpoint(
@@ -203,21 +210,24 @@ def rate_list_endpoint(
         schemas.RateFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    fields: FieldSet = Depends(
+        SparseFields(schemas.RateUpdateDetailListResponse, Rate)
+    ),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.RateUpdateDetailListResponse]:
-    return paginate(list_rate(db, rate_filter), params)
+    return paginate_fields(list_rate(db, rate_filter), params, fields)
 
 
 @router.get(
     "/rates/{rate_id}",
     status_code=status.HTTP_200_OK,
     response_model=schemas.RateUpdateDetailListResponse,
-    dependencies=[Depends(get_current_user)],
+    dependencies=[Depends(get_current_user), Depends(RATE_ETAG)],
     responses={**RESPONSES},
 )
 def rate_detail_endpoint(
     rate_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.RateUpdateDetailListResponse:
     return get_rate(db, rate_id)
 
@@ -238,7 +248,7 @@ def delete_rates_endpoint(
 @router.post(
     "/rates/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -247,11 +257,7 @@ def rate_export_endpoint(
         schemas.RateFilter, use_cache=False
     ),
     db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "rates",
-            schemas.rate_export_headers,
-            list_rate(db, rate_filter).all(),
-        )
+) -> StreamingResponse:
+    return csv_response(
+        "rates", schemas.rate_export_headers, list_rate(db, rate_filter)
     )
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
@@ -179,5 +180,10 @@ class SuggestedRate(Base):
 
     saving_study = relationship("SavingStudy", back_populates="suggested_rates")
 
+    # Suggested rates of a study in keyset pagination order
+    __table_args__ = (
+        Index("ix_suggested_rate_saving_study_id_id", "saving_study_id", "id"),
+    )
+
     def __str__(self) -> str:
         return f"SuggestedRate(id={self.id}, rate_name={self.rate_name})"
@@ -1,17 +1,26 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
-from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy.orm import Session
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from sqlalchemy.orm import Session, selectinload
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.saving_studies import schemas
+from src.modules.saving_studies.models import SavingStudy, SuggestedRate
 from src.modules.users.models import User
-from src.services.common import generate_csv_file, get_current_user
+from src.services.common import (
+    FieldSet,
+    SparseFields,
+    csv_response,
+    get_current_user,
+    get_read_db,
+    paginate_fields,
+    paginate_keyset,
+)
 from src.services.exceptions import RESPONSES
 from src.services.studies import (
     delete_saving_study,
@@ -37,10 +46,13 @@ router = APIRouter(prefix="/api", tags=["saving-studies"])
 )
 def saving_study_create_endpoint(
     saving_study_create_data: schemas.SavingStudyRequest,
+    force_sips_refresh: bool = False,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ) -> schemas.SavingStudyOutput:
-    return saving_study_create(db, saving_study_create_data, current_user)
+    return saving_study_create(
+        db, saving_study_create_data, current_user, force_sips_refresh
+    )
 
 
 @router.get(
@@ -54,9 +66,28 @@ def saving_studies_list_endpoint(
         schemas.SavingStudyFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    fields: FieldSet = Depends(SparseFields(schemas.SavingStudyOutput, SavingStudy)),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.SavingStudyOutput]:
-    return paginate(list_saving_studies(db, saving_study_filter), params)
+    return paginate_fields(list_saving_studies(db, saving_study_filter), params, fields)
+
+
+@router.get(
+    "/studies/cursor",
+    response_model=CursorPage[schemas.SavingStudyOutput],
+    dependencies=[Depends(get_current_user)],
+    responses={**RESPONSES},
+)
+def saving_studies_cursor_list_endpoint(
+    saving_study_filter: schemas.SavingStudyFilter = FilterDepends(
+        schemas.SavingStudyFilter, use_cache=False
+    ),
+    params: CursorParams = Depends(),
+    db: Session = Depends(get_read_db),
+) -> CursorPage[schemas.SavingStudyOutput]:
+    return paginate_keyset(
+        list_saving_studies(db, saving_study_filter), saving_study_filter, params
+    )
 
 
 @router.put(
@@ -83,7 +114,7 @@ def saving_study_update_endpoint(
 )
 def saving_study_detail_endpoint(
     saving_study_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.SavingStudyOutput:
     return get_saving_study(db, saving_study_id)
 
@@ -133,10 +164,36 @@ def suggested_rates_list_endpoint(
         schemas.SuggestedRateFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    fields: FieldSet = Depends(
+        SparseFields(schemas.SuggestedRateResponse, SuggestedRate)
+    ),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.SuggestedRateResponse]:
-    return paginate(
-        list_suggested_rates(db, suggested_rate_filter, saving_study_id), params
+    return paginate_fields(
+        list_suggested_rates(db, suggested_rate_filter, saving_study_id),
+        params,
+        fields,
+    )
+
+
+@router.get(
+    "/studies/{saving_study_id}/suggested-rates/cursor",
+    response_model=CursorPage[schemas.SuggestedRateResponse],
+    dependencies=[Depends(get_current_user)],
+    responses={**RESPONSES},
+)
+def suggested_rates_cursor_list_endpoint(
+    saving_study_id: int,
+    suggested_rate_filter: schemas.SuggestedRateFilter = FilterDepends(
+        schemas.SuggestedRateFilter, use_cache=False
+    ),
+    params: CursorParams = Depends(),
+    db: Session = Depends(get_read_db),
+) -> CursorPage[schemas.SuggestedRateResponse]:
+    return paginate_keyset(
+        list_suggested_rates(db, suggested_rate_filter, saving_study_id),
+        suggested_rate_filter,
+        params,
     )
 
 
@@ -190,7 +247,7 @@ def duplicate_saving_study_endpoint(
 @router.post(
     "/studies/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -199,11 +256,11 @@ def saving_study_export_endpoint(
         schemas.SavingStudyFilter, use_cache=False
     ),
     db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "saving_studies",
-            schemas.saving_study_export_headers,
-            list_saving_studies(db, saving_study_filter).all(),
-        )
+) -> StreamingResponse:
+    return csv_response(
+        "saving_studies",
+        schemas.saving_study_export_headers,
+        list_saving_studies(db, saving_study_filter),
+        # Read by the selected_suggested_rate property
+        selectinload(SavingStudy.suggested_rates),
     )
@@ -0,0 +1,35 @@
+import enum
+
+from sqlalchemy import Column, Index, Integer, String, UniqueConstraint
+from sqlalchemy.dialects.postgresql import TSVECTOR
+
+from src.infrastructure.sqlalchemy.database import Base
+
+
+class SearchEntityType(str, enum.Enum):
+    client = "client"
+    contact = "contact"
+    supply_point = "supply_point"
+    contract = "contract"
+    saving_study = "saving_study"
+
+
+class SearchDocument(Base):
+    """
+    Searchable text of the clients, contacts, supply points, contracts and saving
+    studies. Rows are kept up to date by database triggers on those tables.
+    """
+
+    __tablename__ = "search_document"
+
+    id = Column(Integer, primary_key=True)
+    entity_type = Column(String(20), nullable=False)
+    entity_id = Column(Integer, nullable=False)
+    title = Column(String(256))
+    subtitle = Column(String(256))
+    document = Column(TSVECTOR, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("entity_type", "entity_id"),
+        Index("ix_search_document_document", "document", postgresql_using="gin"),
+    )
@@ -0,0 +1,32 @@
+from typing import List
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from src.modules.search import schemas
+from src.modules.search.models import SearchEntityType
+from src.services.common import get_current_user, get_read_db
+from src.services.exceptions import RESPONSES
+from src.services.search import search
+
+router = APIRouter(prefix="/api/search", tags=["search"])
+
+
+@router.get(
+    "",
+    status_code=status.HTTP_200_OK,
+    response_model=List[schemas.SearchResultResponse],
+    dependencies=[Depends(get_current_user)],
+    responses={**RESPONSES},
+)
+def search_endpoint(
+    q: str = Query(min_length=2, max_length=128),
+    entity_type: List[SearchEntityType] | None = Query(None),
+    limit: int = Query(20, ge=1, le=50),
+    db: Session = Depends(get_read_db),
+) -> List[schemas.SearchResultResponse]:
+    """
+    Clients, contacts, supply points, contracts and saving studies matching every
+    term of q, by NIF, CUPS, alias, name, email or phone, best ranked first.
+    """
+    return search(db, q, entity_type, limit)
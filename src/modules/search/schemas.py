@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+
+from src.modules.search.models import SearchEntityType
+
+
+class SearchResultResponse(BaseModel):
+    entity_type: SearchEntityType
+    entity_id: int
+    title: str | None
+    subtitle: str | None
+    rank: float
+
+    class Config:
+        orm_mode = True
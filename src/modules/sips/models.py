@@ -0,0 +1,48 @@
+from datetime import datetime
+
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import JSONB
+
+from src.infrastructure.sqlalchemy.database import Base
+from src.sips.reader import SIPSTypes
+
+
+class SipsCacheEntry(Base):
+    __tablename__ = "sips_cache"
+
+    id = Column(Integer, primary_key=True)
+    cups = Column(String(124), nullable=False)
+    sips_type = Column(Enum(SIPSTypes), nullable=False)
+    records = Column(JSONB, nullable=False, default=list)
+    fetched_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    hit_count = Column(Integer, default=0, nullable=False)
+
+    __table_args__ = (UniqueConstraint("cups", "sips_type"),)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}: {self.sips_type} - {self.cups}"
+
+
+class SipsDumpRecord(Base):
+    __tablename__ = "sips_dump"
+
+    id = Column(BigInteger, primary_key=True)
+    sips_type = Column(Enum(SIPSTypes), nullable=False)
+    cups = Column(String(124), nullable=False)
+    record_date = Column(Date, nullable=False)
+    data = Column(JSONB, nullable=False)
+    imported_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+
+    __table_args__ = (UniqueConstraint("sips_type", "cups", "record_date"),)
+
+    def __str__(self) -> str:
+        return f"{self.__class__.__name__}: {self.sips_type} - {self.cups} - {self.record_date}"
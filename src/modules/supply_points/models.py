@@ -2,14 +2,18 @@ import enum
 from datetime import datetime
 
 from sqlalchemy import (
+    BigInteger,
     Boolean,
     Column,
+    Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     Numeric,
     String,
+    UniqueConstraint,
 )
 from sqlalchemy.orm import relationship
 
@@ -79,7 +83,53 @@ class SupplyPoint(Base):
     )
     counter_price = Column(Numeric(10, 2))
 
+    # Serves the default -create_at list order, cursor pages included
+    __table_args__ = (Index("ix_supply_point_create_at_id", "create_at", "id"),)
+
     contracts = relationship("Contract", back_populates="supply_point")
 
     def __str__(self):
         return f"{self.__class__.__name__}: {self.alias} - {self.cups}"
+
+
+class SupplyPointConsumption(Base):
+    """
+    Monthly consumption history of a cups as reported by SIPS. Values are stored as
+    received: energies in Wh/VArh and demanded power in W.
+    """
+
+    __tablename__ = "supply_point_consumption"
+
+    id = Column(Integer, primary_key=True)
+    create_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    cups = Column(String(124), nullable=False)
+    start_date = Column(Date, nullable=False)
+    end_date = Column(Date, nullable=False)
+    rate_code = Column(String(3))
+
+    active_energy_p1 = Column(BigInteger, default=0, nullable=False)
+    active_energy_p2 = Column(BigInteger, default=0, nullable=False)
+    active_energy_p3 = Column(BigInteger, default=0, nullable=False)
+    active_energy_p4 = Column(BigInteger, default=0, nullable=False)
+    active_energy_p5 = Column(BigInteger, default=0, nullable=False)
+    active_energy_p6 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p1 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p2 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p3 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p4 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p5 = Column(BigInteger, default=0, nullable=False)
+    reactive_energy_p6 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p1 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p2 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p3 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p4 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p5 = Column(BigInteger, default=0, nullable=False)
+    demanded_power_p6 = Column(BigInteger, default=0, nullable=False)
+
+    __table_args__ = (
+        UniqueConstraint("cups", "start_date"),
+        Index("ix_supply_point_consumption_cups_end_date", "cups", "end_date"),
+    )
+
+    def __str__(self):
+        return f"{self.__class__.__name__}: {self.cups} - {self.start_date}"
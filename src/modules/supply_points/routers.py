@@ -1,23 +1,29 @@
 from fastapi import APIRouter, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
+from fastapi_pagination.cursor import CursorPage, CursorParams
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.supply_points import schemas
 from src.modules.users.models import User
 from src.services.common import (
-    generate_csv_file,
+    csv_response,
+    get_async_read_db,
     get_current_user,
-    paginate_queryset_with_n_to_many,
+    get_read_db,
+    paginate_keyset_async,
 )
 from src.services.exceptions import RESPONSES
 from src.services.supply_points import (
     delete_supply_points,
-    get_supply_point,
+    get_supply_point_async,
     list_supply_point,
+    list_supply_point_async,
     supply_point_create,
     supply_point_partial_update,
     supply_point_update,
@@ -47,15 +53,32 @@ def supply_point_create_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def supply_point_list_endpoint(
+async def supply_point_list_endpoint(
     supply_point_filter: schemas.SupplyPointFilter = FilterDepends(
         schemas.SupplyPointFilter, use_cache=False
     ),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> AbstractPage[schemas.SupplyPointListResponse]:
-    return paginate_queryset_with_n_to_many(
-        list_supply_point(db, supply_point_filter), params
+    return await paginate(db, list_supply_point_async(supply_point_filter), params)
+
+
+@router.get(
+    "/cursor",
+    status_code=status.HTTP_200_OK,
+    response_model=CursorPage[schemas.SupplyPointListResponse],
+    dependencies=[Depends(get_current_user)],
+    responses={**RESPONSES},
+)
+async def supply_point_cursor_list_endpoint(
+    supply_point_filter: schemas.SupplyPointFilter = FilterDepends(
+        schemas.SupplyPointFilter, use_cache=False
+    ),
+    params: CursorParams = Depends(),
+    db: AsyncSession = Depends(get_async_read_db),
+) -> CursorPage[schemas.SupplyPointListResponse]:
+    return await paginate_keyset_async(
+        db, list_supply_point_async(supply_point_filter), supply_point_filter, params
     )
 
 
@@ -81,11 +104,11 @@ def supply_point_update_partial_endpoint(
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
-def user_detail_endpoint(
+async def user_detail_endpoint(
     supply_point_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_read_db),
 ) -> schemas.SupplyPointUpdateDetailResponse:
-    return get_supply_point(db, supply_point_id)
+    return await get_supply_point_async(db, supply_point_id)
 
 
 @router.put(
@@ -119,7 +142,7 @@ def delete_supply_point_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -127,12 +150,10 @@ def supply_point_export_endpoint(
     supply_point_filter: schemas.SupplyPointFilter = FilterDepends(
         schemas.SupplyPointFilter, use_cache=False
     ),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "supply_points",
-            schemas.supply_point_export_headers,
-            list_supply_point(db, supply_point_filter).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "supply_points",
+        schemas.supply_point_export_headers,
+        list_supply_point(db, supply_point_filter),
     )
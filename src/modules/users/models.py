@@ -1,10 +1,20 @@
 import enum
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, DateTime, Enum, ForeignKey, Integer, String
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    false,
+)
 from sqlalchemy.orm import relationship
 
-from src.infrastructure.sqlalchemy.database import Base
+from src.infrastructure.sqlalchemy.database import Base, trigram_index
 from src.modules.costs.models import EnergyCost
 from src.modules.marketers.models import Marketer
 from src.modules.rates.models import RateType
@@ -50,6 +60,17 @@ class User(Base):
     contacts = relationship(Contact, back_populates="user")
     supply_points = relationship(SupplyPoint, back_populates="user")
 
+    __table_args__ = (
+        trigram_index("ix_user_table_first_name_trgm", first_name),
+        trigram_index("ix_user_table_last_name_trgm", last_name),
+        trigram_index("ix_user_table_email_trgm", email),
+        Index(
+            "ix_user_table_create_at_not_deleted",
+            "create_at",
+            postgresql_where=is_deleted == false(),
+        ),
+    )
+
 
 class Token(Base):
     __tablename__ = "token"
@@ -1,15 +1,21 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, status
-from fastapi.responses import FileResponse
-from fastapi_filter import FilterDepends
+from fastapi.responses import StreamingResponse
 from fastapi_pagination import Page, Params
 from fastapi_pagination.bases import AbstractPage
-from fastapi_pagination.ext.sqlalchemy import paginate
 from sqlalchemy.orm import Session
 
 from src.infrastructure.sqlalchemy.database import get_db
+from src.infrastructure.sqlalchemy.filters import FilterDepends
 from src.modules.users import schemas
 from src.modules.users.models import User
-from src.services.common import generate_csv_file, get_current_user
+from src.services.common import (
+    FieldSet,
+    SparseFields,
+    csv_response,
+    get_current_user,
+    get_read_db,
+    paginate_fields,
+)
 from src.services.exceptions import RESPONSES
 from src.services.users import (
     change_password,
@@ -38,9 +44,10 @@ def user_list_endpoint(
     ),
     current_user: User = Depends(get_current_user),
     params: Params = Depends(),
-    db: Session = Depends(get_db),
+    fields: FieldSet = Depends(SparseFields(schemas.UserListResponse, User)),
+    db: Session = Depends(get_read_db),
 ) -> AbstractPage[schemas.UserListResponse]:
-    return paginate(list_users(db, user_filter, current_user), params)
+    return paginate_fields(list_users(db, user_filter, current_user), params, fields)
 
 
 @router.post(
@@ -180,7 +187,7 @@ def user_update_partial_endpoint(
 )
 def user_detail_endpoint(
     user_id: int,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
 ) -> schemas.UserMeDetailResponse:
     return get_user(db, user_id)
 
@@ -201,7 +208,7 @@ def delete_users_endpoint(
 @router.post(
     "/export/csv",
     status_code=status.HTTP_200_OK,
-    response_class=FileResponse,
+    response_class=StreamingResponse,
     dependencies=[Depends(get_current_user)],
     responses={**RESPONSES},
 )
@@ -210,12 +217,8 @@ def user_export_endpoint(
         schemas.UserFilter, use_cache=False
     ),
     current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db),
-) -> FileResponse:
-    return FileResponse(
-        generate_csv_file(
-            "users",
-            schemas.user_export_headers,
-            list_users(db, user_filter, current_user).all(),
-        )
+    db: Session = Depends(get_read_db),
+) -> StreamingResponse:
+    return csv_response(
+        "users", schemas.user_export_headers, list_users(db, user_filter, current_user)
     )
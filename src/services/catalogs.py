@@ -0,0 +1,111 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, List
+
+from fastapi import Depends, HTTPException, Request, status
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from src.infrastructure.sqlalchemy.catalogs import get_catalog_versions
+from src.modules.commissions.models import Commission, commissions_rates_association
+from src.modules.costs.models import EnergyCost
+from src.modules.margins.models import Margin
+from src.modules.marketers.models import Address, Marketer
+from src.modules.rates.models import Rate, RateType
+from src.modules.users.models import User
+from src.services.common import get_read_db
+
+
+def get_catalog_name(catalog) -> str:
+    """
+    Name of the catalog of a model or a table, its table name.
+    """
+    return getattr(catalog, "__table__", catalog).name
+
+
+def get_etag(versions: List[Row]) -> str:
+    """
+    Weak ETag of the versions, the responses are equivalent but not byte for byte
+    equal, e.g. once compressed.
+    """
+    key = ";".join(f"{row.name}:{row.version}" for row in versions)
+    return f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+
+
+def get_cache_headers(versions: List[Row]) -> Dict[str, str]:
+    """
+    Last-Modified has a resolution of one second, a second change within the
+    second of the last one would keep it. It is only sent, and so If-Modified-Since
+    only honoured, once the last change is older than the current second; until
+    then the ETag alone validates the responses.
+    """
+    headers = {
+        "ETag": get_etag(versions),
+        "Cache-Control": settings.CATALOG_CACHE_CONTROL,
+    }
+    if not versions:
+        return headers
+    modified_at = max(row.modified_at for row in versions)
+    if modified_at < datetime.utcnow().replace(microsecond=0):
+        headers["Last-Modified"] = format_datetime(
+            modified_at.replace(tzinfo=timezone.utc), usegmt=True
+        )
+    return headers
+
+
+def is_not_modified(request: Request, headers: Dict[str, str]) -> bool:
+    """
+    Whether the client has the current response, If-None-Match wins over
+    If-Modified-Since when both are sent.
+    """
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match is not None:
+        etags = {etag.strip().removeprefix("W/") for etag in if_none_match.split(",")}
+        return "*" in etags or headers["ETag"].removeprefix("W/") in etags
+
+    if_modified_since = request.headers.get("If-Modified-Since")
+    if if_modified_since is None or "Last-Modified" not in headers:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    modified_at = parsedate_to_datetime(headers["Last-Modified"])
+    return modified_at <= since <= datetime.now(timezone.utc)
+
+
+class CatalogETag:
+    """
+    Dependency of the conditional GET of the endpoints that only read catalogs, the
+    models or tables given. The ETag and Last-Modified come from the versions of the
+    catalogs, so a client with the current response gets a 304 after a single
+    primary key lookup, before the endpoint queries anything.
+    """
+
+    def __init__(self, *catalogs):
+        self.names = tuple(sorted(get_catalog_name(catalog) for catalog in catalogs))
+
+    def __call__(self, request: Request, db: Session = Depends(get_read_db)) -> None:
+        headers = get_cache_headers(get_catalog_versions(db, self.names))
+        if is_not_modified(request, headers):
+            raise HTTPException(
+                status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+            )
+        # Added to the response by the cache_headers middleware, endpoints may
+        # return a Response of their own
+        request.state.cache_headers = headers
+
+
+# Catalogs of the responses of each endpoint, nested objects included
+RATE_TYPE_ETAG = CatalogETag(RateType, User)
+RATE_ETAG = CatalogETag(Rate, RateType, Marketer)
+MARKETER_ETAG = CatalogETag(Marketer, Address, User)
+MARGIN_ETAG = CatalogETag(Margin, Rate, RateType, Marketer)
+COMMISSION_ETAG = CatalogETag(
+    Commission, commissions_rates_association, Rate, RateType, Marketer
+)
+ENERGY_COST_ETAG = CatalogETag(EnergyCost, User)
@@ -1,10 +1,14 @@
 from fastapi import HTTPException, status
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from src.infrastructure.sqlalchemy.clients import (
     create_client_db,
+    get_client_async_queryset,
     get_client_by,
+    get_client_by_async,
     get_client_queryset,
 )
 from src.infrastructure.sqlalchemy.common import update_obj_db
@@ -70,6 +74,27 @@ def get_client(db: Session, client_id: int) -> Client:
     return client
 
 
+def list_client_async(client_filter: ClientFilter) -> Select:
+    return client_filter.sort(
+        client_filter.filter(
+            get_client_async_queryset(None).options(selectinload(Client.user)),
+            model_class_without_alias=Client,
+        ),
+        model_class_without_alias=Client,
+    )
+
+
+async def get_client_async(db: AsyncSession, client_id: int) -> Client:
+    client = await get_client_by_async(db, Client.id == client_id)
+
+    if not client:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="client_not_exist"
+        )
+
+    return client
+
+
 def client_partial_update(
     db: Session,
     client_id: int,
@@ -2,7 +2,7 @@ from dataclasses import dataclass, field
 
 from fastapi import HTTPException, status
 from sqlalchemy import false
-from sqlalchemy.orm import Query, Session
+from sqlalchemy.orm import Query, Session, joinedload, selectinload
 
 from src.infrastructure.sqlalchemy.commissions import (
     create_commission_db,
@@ -348,6 +348,15 @@ def commission_partial_update(
     return commission
 
 
+# Relationships of the list response, loaded with the rows of the page
+COMMISSION_LIST_OPTIONS = [
+    selectinload(Commission.rates).options(
+        joinedload(Rate.rate_type), joinedload(Rate.marketer)
+    ),
+    joinedload(Commission.rate_type),
+]
+
+
 def list_commissions(db: Session, commission_filter: CommissionFilter) -> Query:
     return commission_filter.sort(
         commission_filter.filter(
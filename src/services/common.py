@@ -1,15 +1,46 @@
 import csv
-from functools import reduce
-from tempfile import NamedTemporaryFile
-from typing import Any, List
+import io
+from functools import lru_cache
+from operator import attrgetter
+from typing import Any, Callable, Iterator, List, Tuple, Type
 
 from fastapi import Depends, HTTPException, Request, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.security.utils import get_authorization_scheme_param
-from fastapi_pagination import Params
+from fastapi_pagination import Page, Params, create_page
+from fastapi_pagination.cursor import CursorPage, CursorParams, decode_cursor
 from fastapi_pagination.ext.sqlalchemy import paginate
+from pydantic import BaseModel, create_model
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.selectable import Select
+from starlette.concurrency import run_in_threadpool
 
-from src.infrastructure.sqlalchemy.database import get_db
+from config.settings import settings
+from src.infrastructure.cache.tokens import cache_user, get_cached_user
+from src.infrastructure.serialization import ORJSONResponse, get_serializer
+from src.infrastructure.sqlalchemy.database import get_async_db, get_db
+from src.infrastructure.sqlalchemy.exports import get_export_options
+from src.infrastructure.sqlalchemy.fields import get_load_only_option
+from src.infrastructure.sqlalchemy.filters import Filter
+from src.infrastructure.sqlalchemy.keyset import (
+    InvalidCursor,
+    decode_keyset,
+    encode_keyset,
+    keyset_query,
+)
+from src.infrastructure.sqlalchemy.pagination import (
+    count_distinct,
+    estimate_count,
+    get_page_ids,
+    get_page_items,
+)
+from src.infrastructure.sqlalchemy.replica import (
+    set_session_user,
+    use_async_replica,
+    use_replica,
+)
 from src.infrastructure.sqlalchemy.users import get_user_by
 from src.modules.rates.models import ClientType
 from src.modules.users.models import Token, User
@@ -25,16 +56,43 @@ async def get_current_user(request: Request, db: Session = Depends(get_db)) -> U
             headers={"WWW-Authenticate": "token"},
         )
 
-    user = get_user_by(db, User.token.has(Token.token == token))
+    user = get_cached_user(db, token)
+    if user:
+        set_session_user(db, user.id)
+        return user
+
+    # The session is synchronous, the query must not block the event loop
+    user = await run_in_threadpool(
+        get_user_by, db, User.token.has(Token.token == token)
+    )
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="invalid_credentials",
             headers={"WWW-Authenticate": "token"},
         )
+    cache_user(token, user)
+    set_session_user(db, user.id)
     return user
 
 
+def get_read_db(
+    current_user: User = Depends(get_current_user), db: Session = Depends(get_db)
+) -> Session:
+    """
+    Request session of the read only endpoints, served by the replica when there is
+    one. Depends on get_current_user so the token is always checked in the primary.
+    """
+    return use_replica(db, current_user.id)
+
+
+async def get_async_read_db(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_async_db),
+) -> AsyncSession:
+    return use_async_replica(db, current_user.id)
+
+
 def update_from_dict(obj: Any, update_request: dict) -> Any:
     for key, value in update_request.items():
         setattr(obj, key, value)
@@ -50,49 +108,234 @@ def empty_string_to_none(value: str) -> str | None:
     return value or None
 
 
-def recursive_getattr(obj, attr, *args):
-    def _getattr(obj, attr):
-        return getattr(obj, attr, *args)
-
-    return reduce(_getattr, [obj] + attr.split("."))
-
-
-def generate_csv_file(filename: str, headers: dict, data: list):
-    with NamedTemporaryFile(
-        "w", suffix=".csv", prefix=filename, delete=False
-    ) as outfile:
-        writer = csv.writer(outfile, delimiter=";")
-        writer.writerow(headers.values())
-        for instance in data:
-            row = []
-            for attribute in headers.keys():
-                try:
-                    field = recursive_getattr(instance, attribute)
-                except AttributeError:
-                    try:
-                        related_field, field = attribute.split(":")
-                    except ValueError:  # related field None
-                        row.append("")
-                        continue
-                    related_objects = recursive_getattr(instance, related_field)
-                    row.append(
-                        "|".join(
-                            [
-                                recursive_getattr(related_obj, field)
-                                for related_obj in related_objects
-                            ]
-                        )
-                    )
-                    continue
-                if type(field) is list:
-                    row.append("|".join(field))
-                    continue
-                row.append(field)
-            writer.writerow(row)
-        return outfile.name
-
-
-def paginate_queryset_with_n_to_many(qs: Query, params: Params) -> Any:
-    paginated_response = paginate(qs, params)
-    paginated_response.total = len(qs.all())
-    return paginated_response
+def get_csv_column(attribute: str) -> Callable[[Any], Any]:
+    """
+    Value of the export column of attribute of an instance. "a.b" follows the
+    relationships, "" when one is None, and "rates:name" joins the name of every
+    rate with "|", as lists are.
+    """
+    related_field, _, field = attribute.partition(":")
+    if field:
+        get_related_objects, get_field = attrgetter(related_field), attrgetter(field)
+        return lambda instance: "|".join(
+            [get_field(related_obj) for related_obj in get_related_objects(instance)]
+        )
+
+    get_value = attrgetter(attribute)
+
+    def column(instance: Any) -> Any:
+        try:
+            value = get_value(instance)
+        except AttributeError:  # related field None
+            return ""
+        if type(value) is list:
+            return "|".join(value)
+        return value
+
+    return column
+
+
+def stream_csv(headers: dict, qs: Query, *options) -> Iterator[str]:
+    """
+    CSV of the instances of the queryset in chunks of about EXPORT_CHUNK_SIZE
+    characters. The rows are fetched EXPORT_YIELD_PER at a time through a server
+    side cursor, with the relationships of the headers eager loaded per batch, so
+    the memory used doesn't depend on the size of the export. options are added to
+    the query, e.g. the relationships read by a property of the headers.
+    """
+    columns = [get_csv_column(attribute) for attribute in headers.keys()]
+    model = qs.column_descriptions[0]["entity"]
+    qs = qs.options(*get_export_options(model, headers.keys()), *options)
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, delimiter=";")
+    writer.writerow(headers.values())
+    for instance in qs.yield_per(settings.EXPORT_YIELD_PER):
+        writer.writerow([column(instance) for column in columns])
+        if buffer.tell() >= settings.EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def csv_response(
+    filename: str, headers: dict, qs: Query, *options
+) -> StreamingResponse:
+    """
+    Streamed CSV export of the queryset. The rows are read while the response is
+    sent, from the session of the request, which is closed after it.
+    """
+    return StreamingResponse(
+        stream_csv(headers, qs, *options),
+        media_type="text/csv",
+        headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+    )
+
+
+def count_queryset(qs: Query) -> int:
+    """
+    Instances of the queryset. Past PAGINATION_COUNT_ESTIMATE_THRESHOLD rows the
+    planner estimate is returned instead of counting them.
+    """
+    threshold = settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD
+    if threshold is not None:
+        estimate = estimate_count(qs)
+        if estimate > threshold:
+            return estimate
+    return count_distinct(qs)
+
+
+def paginate_queryset_with_n_to_many(
+    qs: Query, ordering: List[Tuple[Any, bool]], params: Params, *options
+) -> Any:
+    """
+    Page of a queryset whose joins repeat the instances. ordering is the
+    get_ordering() of the filter that sorted the queryset, options the loader
+    options of the relationships of the response, e.g. selectinload(Model.rates).
+    """
+    raw_params = params.to_raw_params().as_limit_offset()
+    ids = get_page_ids(qs, ordering, raw_params.limit, raw_params.offset)
+    return create_page(
+        get_page_items(qs, ids, *options), total=count_queryset(qs), params=params
+    )
+
+
+class FieldSet:
+    """
+    Fields of schema a list endpoint returns, every one when names is None.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model, names: Tuple[str, ...] = None):
+        self.schema = schema
+        self.model = model
+        self.names = names
+
+    def get_schema(self) -> Type[BaseModel]:
+        if self.names is None:
+            return self.schema
+        return get_fields_schema(self.schema, self.names)
+
+
+class SparseFields:
+    """
+    Dependency of the fields query parameter of a list endpoint, the comma separated
+    fields of schema to return, e.g. ?fields=id,name.
+    """
+
+    def __init__(self, schema: Type[BaseModel], model):
+        self.schema = schema
+        self.model = model
+
+    def __call__(self, fields: str | None = None) -> FieldSet:
+        if not fields:
+            return FieldSet(self.schema, self.model)
+        names = tuple(dict.fromkeys(name.strip() for name in fields.split(",")))
+        if any(name not in self.schema.__fields__ for name in names):
+            raise HTTPException(
+                status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                detail="invalid_fields",
+            )
+        return FieldSet(self.schema, self.model, names)
+
+
+@lru_cache(maxsize=256)
+def get_fields_schema(schema: Type[BaseModel], names: Tuple[str, ...]):
+    """
+    Copy of schema with only the fields of names.
+    """
+    return create_model(
+        f"{schema.__name__}Fields",
+        __config__=schema.__config__,
+        **{
+            name: (
+                schema.__fields__[name].annotation,
+                schema.__fields__[name].field_info,
+            )
+            for name in names
+        },
+    )
+
+
+def create_page_response(
+    items: List, params: Params, total: int, schema: Type[BaseModel]
+) -> JSONResponse:
+    """
+    Page of ORM instances as a response, which FastAPI doesn't validate against the
+    response_model of the endpoint. With FAST_JSON_RESPONSES the instances are
+    serialized with the compiled serializer of schema and orjson instead of pydantic.
+    Either way the page fields come from Page.create.
+    """
+    page = Page[schema].create([], params, total=total)
+    if settings.FAST_JSON_RESPONSES:
+        serializer = get_serializer(schema)
+        return ORJSONResponse(
+            {
+                "items": [serializer(item) for item in items],
+                **page.dict(exclude={"items"}),
+            }
+        )
+    page = page.copy(update={"items": [schema.from_orm(item) for item in items]})
+    return JSONResponse(jsonable_encoder(page))
+
+
+def paginate_fields(qs: Query, params: Params, fields: FieldSet) -> Any:
+    """
+    Page of the queryset with only the columns of the fields loaded, serialized with
+    a trimmed copy of the response schema.
+    """
+    if fields.names is None and not settings.FAST_JSON_RESPONSES:
+        return paginate(qs, params)
+
+    if fields.names is not None:
+        load_only_option = get_load_only_option(fields.model, fields.names)
+        if load_only_option is not None:
+            qs = qs.options(load_only_option)
+    raw_params = params.to_raw_params().as_limit_offset()
+    return create_page_response(
+        qs.limit(raw_params.limit).offset(raw_params.offset).all(),
+        params,
+        count_queryset(qs),
+        fields.get_schema(),
+    )
+
+
+def get_keyset_values(params: CursorParams, ordering: List) -> List | None:
+    if not params.cursor:
+        return None
+    try:
+        return decode_keyset(decode_cursor(params.cursor), ordering)
+    except (InvalidCursor, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY, detail="invalid_cursor"
+        )
+
+
+def create_keyset_page(rows: List, params: CursorParams) -> CursorPage:
+    next_cursor = None
+    if len(rows) > params.size:
+        rows = rows[: params.size]
+        next_cursor = encode_keyset(rows[-1][1:])
+    return CursorPage.create([row[0] for row in rows], params, next_=next_cursor)
+
+
+def paginate_keyset(qs: Query, sort_filter: Filter, params: CursorParams) -> Any:
+    """
+    Cursor page of the queryset in the order of the filter. The cursor is opaque to
+    clients, it holds the sort key and id of the last row of the previous page.
+    """
+    ordering = sort_filter.get_ordering()
+    values = get_keyset_values(params, ordering)
+    return create_keyset_page(
+        keyset_query(qs, ordering, values, params.size).all(), params
+    )
+
+
+async def paginate_keyset_async(
+    db: AsyncSession, query: Select, sort_filter: Filter, params: CursorParams
+) -> Any:
+    ordering = sort_filter.get_ordering()
+    values = get_keyset_values(params, ordering)
+    result = await db.execute(keyset_query(query, ordering, values, params.size))
+    return create_keyset_page(result.all(), params)
@@ -1,11 +1,15 @@
 from fastapi import HTTPException, status
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.contacts import (
     create_contact_db,
+    get_contact_async_queryset,
     get_contact_by,
+    get_contact_by_async,
     get_contact_queryset,
 )
 from src.modules.contacts.models import Contact
@@ -62,6 +66,27 @@ def get_contact(db: Session, contact_id: int) -> Contact:
     return contact
 
 
+def list_contact_async(contact_filter: ContactFilter) -> Select:
+    return contact_filter.sort(
+        contact_filter.filter(
+            get_contact_async_queryset(None).options(selectinload(Contact.user)),
+            model_class_without_alias=Contact,
+        ),
+        model_class_without_alias=Contact,
+    )
+
+
+async def get_contact_async(db: AsyncSession, contact_id: int) -> Contact:
+    contact = await get_contact_by_async(db, Contact.id == contact_id)
+
+    if not contact:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="contact_not_exist"
+        )
+
+    return contact
+
+
 def contact_partial_update(
     db: Session,
     contact_id: int,
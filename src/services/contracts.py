@@ -2,7 +2,7 @@ from datetime import timedelta
 
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.contracts import (
@@ -18,6 +18,7 @@ from src.modules.contracts.schemas import (
     ContractPartialUpdateRequest,
     ContractUpdateRequest,
 )
+from src.modules.rates.models import Rate
 from src.modules.users.models import User
 from src.services.common import update_from_dict
 
@@ -39,6 +40,15 @@ def contract_create(
         )
 
 
+CONTRACT_LIST_OPTIONS = [
+    joinedload(Contract.supply_point),
+    joinedload(Contract.rate).options(
+        joinedload(Rate.rate_type), joinedload(Rate.marketer)
+    ),
+    joinedload(Contract.user),
+]
+
+
 #
 def list_contract(db: Session, contract_filter: ContractFilter):
     return contract_filter.sort(
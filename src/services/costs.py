@@ -1,9 +1,10 @@
 from fastapi import HTTPException, status
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload
 from sqlalchemy.sql.expression import false, label
 
+from src.infrastructure.cache.catalogs import energy_cost_cache
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.costs import (
     create_energy_cost_db,
@@ -24,7 +25,7 @@ from src.modules.costs.schemas import (
     OtherCostFilter,
     OtherCostPartialUpdateRequest,
 )
-from src.modules.rates.models import EnergyType
+from src.modules.rates.models import EnergyType, Rate
 from src.modules.users.models import User
 from src.services.common import update_from_dict
 from src.services.rates import get_validated_rates
@@ -68,6 +69,14 @@ def get_energy_cost(db: Session, energy_cost_id: int) -> EnergyCost:
     return energy_cost
 
 
+def get_energy_cost_snapshot_by_code(db: Session, code: str):
+    """
+    Cached read only snapshot of the energy cost of the code, e.g. the taxes applied
+    by the saving studies, None when there is none.
+    """
+    return energy_cost_cache.get(db, ("code", code), EnergyCost.code == code)
+
+
 def energy_cost_partial_update(
     db: Session,
     energy_cost_id: int,
@@ -98,6 +107,7 @@ def energy_cost_partial_update(
         raise HTTPException(
             status.HTTP_409_CONFLICT, detail="value_error.already_exists"
         )
+    energy_cost_cache.invalidate()
     return energy_cost
 
 
@@ -121,11 +131,13 @@ def delete_energy_costs(
             {"is_deleted": True}
         )
         db.commit()
+        energy_cost_cache.invalidate()
         return
     db.query(EnergyCost).filter(
         EnergyCost.id.in_(energy_costs_data.ids), EnergyCost.is_protected == false()
     ).update({"is_deleted": True})
     db.commit()
+    energy_cost_cache.invalidate()
 
 
 def other_cost_validate_power_range(
@@ -204,6 +216,13 @@ def other_cost_update(
     return other_cost
 
 
+OTHER_COST_LIST_OPTIONS = [
+    selectinload(OtherCost.rates).options(
+        joinedload(Rate.rate_type), joinedload(Rate.marketer)
+    ),
+]
+
+
 def list_other_costs(db: Session, other_cost_filter: OtherCostFilter):
     return other_cost_filter.sort(
         other_cost_filter.filter(
@@ -6,7 +6,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel
 from starlette.exceptions import HTTPException as StarletteHTTPException
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +50,30 @@ CUSTOM_ERRORS = {
         "source": None,
         "field": None,
     },
+    "invalid_cursor": {
+        "code": "INVALID_CURSOR",
+        "message": "The pagination cursor is not valid",
+        "source": None,
+        "field": None,
+    },
+    "invalid_fields": {
+        "code": "INVALID_FIELDS",
+        "message": "Some of the fields are not fields of the response",
+        "source": "query",
+        "field": "fields",
+    },
+    "query_budget_exceeded": {
+        "code": "QUERY_BUDGET_EXCEEDED",
+        "message": "The request executed more SQL statements than its budget",
+        "source": None,
+        "field": None,
+    },
+    "server_busy": {
+        "code": "SERVER_BUSY",
+        "message": "The server is busy, try again later",
+        "source": None,
+        "field": None,
+    },
     "invalid_credentials": {
         "code": "INVALID_CREDENTIALS",
         "message": "Invalid authentication credentials",
@@ -390,7 +414,9 @@ def request_validation_error_handler(exc: RequestValidationError) -> JSONRespons
     )
 
 
-def custom_exception(exc: StarletteHTTPException) -> JSONResponse:
+def custom_exception(exc: StarletteHTTPException) -> Response:
+    if exc.status_code == status.HTTP_304_NOT_MODIFIED:
+        return Response(status_code=exc.status_code, headers=exc.headers)
     try:
         error_response = CustomValidationErrorSchema(**CUSTOM_ERRORS[exc.detail])
     except KeyError:
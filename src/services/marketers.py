@@ -1,8 +1,9 @@
 from fastapi import HTTPException, status
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql.expression import false
 
+from src.infrastructure.cache.catalogs import marketer_cache
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.marketers import (
     create_marketer_db,
@@ -37,6 +38,9 @@ def marketer_create(
     return marketer
 
 
+MARKETER_LIST_OPTIONS = [joinedload(Marketer.user)]
+
+
 def list_marketer(db: Session, marketer_filter: MarketerFilter):
     return marketer_filter.sort(
         marketer_filter.filter(
@@ -62,6 +66,23 @@ def get_marketer(db: Session, marketer_id: int) -> Marketer:
     return marketer
 
 
+def get_marketer_snapshot(db: Session, marketer_id: int):
+    """
+    Cached read only snapshot of the marketer, for the validations that don't
+    modify it.
+    """
+    marketer = marketer_cache.get(
+        db, marketer_id, Marketer.id == marketer_id, Marketer.is_deleted == false()
+    )
+
+    if not marketer:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="marketer_not_exist"
+        )
+
+    return marketer
+
+
 def create_update_marketer_address(
     db: Session, marketer: Marketer, address_data_request: AddressUpdateRequest
 ):
@@ -81,6 +102,7 @@ def marketer_partial_update(
     marketer_data_request = marketer_data.dict(exclude_unset=True)
     update_from_dict(marketer, marketer_data_request)
     marketer = update_obj_db(db, marketer)
+    marketer_cache.invalidate()
     return marketer
 
 
@@ -102,6 +124,7 @@ def marketer_update(
         raise HTTPException(
             status.HTTP_409_CONFLICT, detail="value_error.already_exists"
         )
+    marketer_cache.invalidate()
     return marketer
 
 
@@ -110,3 +133,4 @@ def delete_marketers(db: Session, marketers_data: MarketerDeleteRequest):
         {"is_deleted": True}
     )
     db.commit()
+    marketer_cache.invalidate()
@@ -6,6 +6,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy.sql.expression import false, label
 
+from src.infrastructure.cache.catalogs import rate_type_cache
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.database import Base
 from src.infrastructure.sqlalchemy.rates import (
@@ -38,7 +39,7 @@ from src.modules.rates.schemas import (
 )
 from src.modules.users.models import User
 from src.services.common import update_from_dict
-from src.services.marketers import get_marketer
+from src.services.marketers import get_marketer_snapshot
 
 MIN_PRICES = 1
 MAX_PRICES = 7
@@ -82,6 +83,23 @@ def get_rate_type(db: Session, rate_type_id: int) -> RateType:
     return rate_type
 
 
+def get_rate_type_snapshot(db: Session, rate_type_id: int):
+    """
+    Cached read only snapshot of the rate type, for the validations that don't
+    modify it.
+    """
+    rate_type = rate_type_cache.get(
+        db, rate_type_id, RateType.id == rate_type_id, RateType.is_deleted == false()
+    )
+
+    if not rate_type:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="rate_type_not_exist"
+        )
+
+    return rate_type
+
+
 def rate_type_partial_update(
     db: Session,
     rate_type_id: int,
@@ -114,6 +132,7 @@ def rate_type_partial_update(
             )
     update_from_dict(rate_type, rate_type_data_request)
     rate_type = update_obj_db(db, rate_type)
+    rate_type_cache.invalidate()
     return rate_type
 
 
@@ -139,6 +158,7 @@ def delete_rate_types(db: Session, rate_types_data: RateDeleteRequest):
         {"is_active": False}
     )
     db.commit()
+    rate_type_cache.invalidate()
 
 
 def validate_rate(energy_type: str, price_type: PriceType, values: dict):
@@ -214,8 +234,8 @@ def validate_rate_create(energy_type: str, values: dict):
 
 
 def rate_create(db: Session, rate_data: RateCreateRequest) -> Rate:
-    rate_type = get_rate_type(db, rate_data.rate_type_id)
-    get_marketer(db, rate_data.marketer_id)
+    rate_type = get_rate_type_snapshot(db, rate_data.rate_type_id)
+    get_marketer_snapshot(db, rate_data.marketer_id)
 
     rate_data_dict = rate_data.dict()
     rate_data_dict = validate_rate(
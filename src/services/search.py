@@ -0,0 +1,38 @@
+import re
+from typing import List
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.filters import remove_accents
+from src.infrastructure.sqlalchemy.search import get_search_queryset
+from src.modules.search.models import SearchEntityType
+
+# Characters kept in the terms, the rest separate them. @ . + - _ keep emails,
+# CUPS and phone numbers in one piece for the text search parser
+TERM_REGEX = re.compile(r"[\w@.+\-]+")
+
+
+def build_tsquery(text: str) -> str | None:
+    """
+    Prefix tsquery matching every term of the text, e.g. "Juan 600" ->
+    'juan':* & '600':*. Terms are quoted, so the text can not inject tsquery
+    operators.
+    """
+    terms = TERM_REGEX.findall(remove_accents(text).lower())
+    if not terms:
+        return None
+    return " & ".join(f"'{term}':*" for term in terms)
+
+
+def search(
+    db: Session, text: str, entity_types: List[SearchEntityType] | None, limit: int
+) -> List:
+    tsquery = build_tsquery(text)
+    if tsquery is None:
+        return []
+    return get_search_queryset(
+        db,
+        tsquery,
+        [entity_type.value for entity_type in entity_types or []],
+        limit,
+    ).all()
@@ -1,13 +1,42 @@
+from datetime import datetime, timedelta
+from typing import Type
+
+from sqlalchemy.orm import Session
+
 from config.settings import settings
+from src.infrastructure.sqlalchemy.supply_points import (
+    get_supply_point_consumption_last_update,
+    get_supply_point_consumption_summary,
+    upsert_supply_point_consumptions,
+)
 from src.modules.saving_studies.models import SavingStudy
-from src.sips.consumption_electricity import ConsumptionElectricityReader
+from src.sips.cache import SIPSCache
+from src.sips.consumption_electricity import (
+    ConsumptionElectricityReader,
+    ConsumptionElectricityResponse,
+)
+from src.sips.dump import SIPSDumpStore
 from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import BaseReader
 
 
-def fill_study_with_sips(saving_study: SavingStudy) -> SavingStudy:
-    reader = PsElectricityReader()
+def get_sips_reader(db: Session, reader_class: Type[BaseReader]) -> BaseReader:
+    reader = reader_class()
     reader.set_credentials(settings.SIPS_CONSUMER_KEY, settings.SIPS_CONSUMER_SECRET)
-    data = reader.get([saving_study.cups])
+    reader.set_base_url(settings.SIPS_BASE_URL)
+    if settings.SIPS_CACHE_ENABLED:
+        reader.set_cache(SIPSCache(db))
+    # Offline, the imported extracts are the only source of the lookups
+    if settings.SIPS_DUMP_ENABLED or settings.SIPS_OFFLINE:
+        reader.set_dump_store(SIPSDumpStore(db), offline=settings.SIPS_OFFLINE)
+    return reader
+
+
+def fill_study_with_sips(
+    db: Session, saving_study: SavingStudy, force_refresh: bool = False
+) -> SavingStudy:
+    reader = get_sips_reader(db, PsElectricityReader)
+    data = reader.get([saving_study.cups], force_refresh)
 
     for cups, item in data.items():
         saving_study.power_1 = int(item["potenciasContratadasEnWP1"]) / 1000
@@ -17,11 +46,8 @@ def fill_study_with_sips(saving_study: SavingStudy) -> SavingStudy:
         saving_study.power_5 = int(item["potenciasContratadasEnWP5"]) / 1000
         saving_study.power_6 = int(item["potenciasContratadasEnWP6"]) / 1000
 
-    reader = ConsumptionElectricityReader()
-    reader.set_credentials(settings.SIPS_CONSUMER_KEY, settings.SIPS_CONSUMER_SECRET)
-    data = reader.get([saving_study.cups])
-
-    for cups, item in data.items():
+    item = get_consumption_summary(db, saving_study.cups, force_refresh)
+    if item:
         saving_study.consumption_p1 = item.consumption_p1
         saving_study.consumption_p2 = item.consumption_p2
         saving_study.consumption_p3 = item.consumption_p3
@@ -32,3 +58,30 @@ def fill_study_with_sips(saving_study: SavingStudy) -> SavingStudy:
         saving_study.analyzed_days = item.analyzed_days
 
     return saving_study
+
+
+def refresh_consumption_history(
+    db: Session, cups: str, force_refresh: bool = False
+) -> None:
+    reader = get_sips_reader(db, ConsumptionElectricityReader)
+    months = reader.get_monthly([cups], force_refresh)[cups]
+
+    create_at = datetime.utcnow()
+    upsert_supply_point_consumptions(
+        db, [{**month.dict(), "create_at": create_at} for month in months]
+    )
+
+
+def get_consumption_summary(
+    db: Session, cups: str, force_refresh: bool = False
+) -> ConsumptionElectricityResponse | None:
+    last_update = get_supply_point_consumption_last_update(db, cups)
+    max_age = timedelta(days=settings.SUPPLY_POINT_CONSUMPTION_MAX_AGE)
+    if force_refresh or not last_update or datetime.utcnow() - last_update > max_age:
+        refresh_consumption_history(db, cups, force_refresh)
+
+    summary = get_supply_point_consumption_summary(db, cups)
+    if not summary.end_date:
+        return None
+
+    return ConsumptionElectricityResponse(cups=cups, **summary._asdict())
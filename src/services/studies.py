@@ -9,7 +9,6 @@ from sqlalchemy.orm import Query, Session
 from sqlalchemy.sql.expression import false
 
 from src.infrastructure.sqlalchemy.common import update_obj_db
-from src.infrastructure.sqlalchemy.costs import get_energy_cost_by
 from src.infrastructure.sqlalchemy.rates import get_rate_by
 from src.infrastructure.sqlalchemy.studies import (
     create_saving_study_db,
@@ -23,7 +22,7 @@ from src.infrastructure.sqlalchemy.studies import (
     get_suggested_rates_queryset,
 )
 from src.modules.commissions.models import RangeType
-from src.modules.costs.models import EnergyCost, OtherCostType
+from src.modules.costs.models import OtherCostType
 from src.modules.margins.models import Margin, MarginType
 from src.modules.rates.models import EnergyType, PriceType, Rate
 from src.modules.saving_studies.models import (
@@ -42,7 +41,8 @@ from src.modules.saving_studies.schemas import (
 )
 from src.modules.users.models import User
 from src.services.common import update_from_dict
-from src.services.rates import get_rate_type
+from src.services.costs import get_energy_cost_snapshot_by_code
+from src.services.rates import get_rate_type_snapshot
 from src.services.sips import fill_study_with_sips
 
 logger = logging.getLogger(__name__)
@@ -117,7 +117,7 @@ class CostCalculator(ABC):
         return total_cost
 
     def get_iva(self) -> Decimal:
-        iva = get_energy_cost_by(self.db_session, EnergyCost.code == IVA)
+        iva = get_energy_cost_snapshot_by_code(self.db_session, IVA)
         if not iva:
             return Decimal("0")
         return iva.amount / 100
@@ -209,7 +209,7 @@ class CostCalculatorElectricity(CostCalculator):
         return sum(cost_list) * self.saving_study.analyzed_days
 
     def get_ie(self) -> Decimal:
-        ie = get_energy_cost_by(self.db_session, EnergyCost.code == IMP_ELECTRICOS)
+        ie = get_energy_cost_snapshot_by_code(self.db_session, IMP_ELECTRICOS)
         if not ie:
             return Decimal("0")
         return ie.amount / 100
@@ -279,7 +279,7 @@ class CostCalculatorGas(CostCalculator):
         return fixed_term_price * self.saving_study.analyzed_days
 
     def get_ih(self) -> Decimal:
-        ih = get_energy_cost_by(self.db_session, EnergyCost.code == IMP_HIDROCARBUROS)
+        ih = get_energy_cost_snapshot_by_code(self.db_session, IMP_HIDROCARBUROS)
         if not ih:
             return Decimal("0")
         return Decimal(str(ih.amount))
@@ -385,7 +385,7 @@ def generate_suggested_rates_for_study(
 ) -> List[SuggestedRate]:
     saving_study = get_saving_study(db_session, saving_study_id)
     validate_saving_study_before_generating_rates(saving_study)
-    _ = get_rate_type(db_session, saving_study.current_rate_type_id)
+    _ = get_rate_type_snapshot(db_session, saving_study.current_rate_type_id)
 
     logger.info("[saving_study_id=%s] Generating suggested rates", saving_study.id)
     suggested_rates_deleted = delete_study_suggested_rates(db_session, saving_study.id)
@@ -586,20 +586,25 @@ class SuggestedRatesGenerator:
 
 
 def saving_study_create(
-    db: Session, saving_study_request: SavingStudyRequest, current_user: User
+    db: Session,
+    saving_study_request: SavingStudyRequest,
+    current_user: User,
+    force_sips_refresh: bool = False,
 ) -> SavingStudy:
     saving_study = SavingStudy(**saving_study_request.dict())
     saving_study.user_creator_id = current_user.id
 
     if saving_study_request.current_rate_type_id:
-        current_rate_type = get_rate_type(db, saving_study_request.current_rate_type_id)
+        current_rate_type = get_rate_type_snapshot(
+            db, saving_study_request.current_rate_type_id
+        )
         saving_study.current_rate_type_id = current_rate_type.id
 
     if (
         saving_study_request.is_from_sips
         and saving_study.energy_type == EnergyType.electricity
     ):
-        saving_study = fill_study_with_sips(saving_study)
+        saving_study = fill_study_with_sips(db, saving_study, force_sips_refresh)
 
     try:
         saving_study = create_saving_study_db(db, saving_study)
@@ -643,12 +648,12 @@ def saving_study_update(
     rate_type_id = saving_study_dict.get("current_rate_type_id")
     if not rate_type_id:
         _ = (
-            get_rate_type(db, saving_study.current_rate_type_id)
+            get_rate_type_snapshot(db, saving_study.current_rate_type_id)
             if saving_study.current_rate_type_id
             else None
         )
     else:
-        _ = get_rate_type(db, rate_type_id)
+        _ = get_rate_type_snapshot(db, rate_type_id)
 
     update_from_dict(saving_study, saving_study_dict)
     saving_study = update_obj_db(db, saving_study)
@@ -1,11 +1,15 @@
 from fastapi import HTTPException, status
+from sqlalchemy import Select
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
 
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.supply_points import (
     create_supply_point_db,
+    get_supply_point_async_queryset,
     get_supply_point_by,
+    get_supply_point_by_async,
     get_supply_point_queryset,
 )
 from src.modules.supply_points.models import SupplyPoint
@@ -56,6 +60,33 @@ def get_supply_point(db: Session, supply_point_id: int) -> SupplyPoint:
     return supply_point
 
 
+def list_supply_point_async(supply_point_filter: SupplyPointFilter) -> Select:
+    return supply_point_filter.sort(
+        supply_point_filter.filter(
+            get_supply_point_async_queryset(None).options(
+                selectinload(SupplyPoint.user), selectinload(SupplyPoint.client)
+            ),
+            model_class_without_alias=SupplyPoint,
+        ),
+        model_class_without_alias=SupplyPoint,
+    )
+
+
+async def get_supply_point_async(db: AsyncSession, supply_point_id: int) -> SupplyPoint:
+    supply_point = await get_supply_point_by_async(
+        db,
+        SupplyPoint.id == supply_point_id,
+        options=[selectinload(SupplyPoint.user), selectinload(SupplyPoint.client)],
+    )
+
+    if not supply_point:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="supply_point_not_exist"
+        )
+
+    return supply_point
+
+
 def supply_point_partial_update(
     db: Session,
     supply_point_id: int,
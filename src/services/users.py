@@ -4,15 +4,21 @@ from typing import List
 from urllib import parse
 
 from fastapi import HTTPException, status
-from passlib.handlers.argon2 import argon2
 from passlib.hash import pbkdf2_sha256
 from sqlalchemy import false, true
 from sqlalchemy.orm import Session
 from starlette.background import BackgroundTasks
 
 from config.settings import settings
+from src.infrastructure.cache.tokens import invalidate_users
 from src.infrastructure.email.email_config import EmailMessageSchema
 from src.infrastructure.email.email_manager import send_email
+from src.infrastructure.hashing import (
+    HashingOverloaded,
+    hash_password,
+    hashing_executor,
+    verify_password,
+)
 from src.infrastructure.sqlalchemy.common import update_obj_db
 from src.infrastructure.sqlalchemy.users import (
     create_user_db,
@@ -36,14 +42,23 @@ from src.services.common import update_from_dict
 from utils.i18n import trans as _
 
 
+def run_hashing(function, *args):
+    try:
+        return hashing_executor.run(function, *args)
+    except HashingOverloaded:
+        raise HTTPException(
+            status.HTTP_503_SERVICE_UNAVAILABLE,
+            "server_busy",
+            headers={"Retry-After": "1"},
+        )
+
+
 def generate_password_hash(password: str) -> str:
-    return argon2.using(rounds=2, salt=bytes(settings.SECRET_KEY, "UTF-8")).hash(
-        password
-    )
+    return run_hashing(hash_password, password, bytes(settings.SECRET_KEY, "UTF-8"))
 
 
 def validate_password(password: str, hashed_password) -> bool:
-    return argon2.verify(password, hashed_password)
+    return run_hashing(verify_password, password, hashed_password)
 
 
 def check_password_policy(password: str) -> bool:
@@ -69,6 +84,7 @@ def login_user(db: Session, login_data: UserLoginRequest) -> Token:
 
 def logout_user(db: Session, user: User) -> None:
     delete_token(db, Token.user_id == user.id)
+    invalidate_users(user.id)
 
 
 def forgot_password(db: Session, user_email: ForgotPasswordRequest):
@@ -164,6 +180,7 @@ def reset_password(db: Session, reset_password_request: schemas.ResetPasswordReq
     new_pass = generate_password_hash(reset_password_request.password)
     user.hashed_password = new_pass
     db.commit()
+    invalidate_users(user.id)
 
 
 def user_create(
@@ -255,6 +272,7 @@ def user_update(
         user.email = f"{user.id}{user.email}"
         user.deleted_at = datetime.datetime.utcnow()
         user = update_obj_db(db, user)
+        invalidate_users(user.id)
         user.email = original_email
         return user
 
@@ -274,6 +292,8 @@ def user_update(
     update_from_dict(user, user_data_request)
 
     user = update_obj_db(db, user)
+    # Role, active flag or password may have changed
+    invalidate_users(user.id)
     if has_password_changed_email:
         background_tasks.add_task(send_password_changed_email, user, current_user.email)
 
@@ -291,6 +311,7 @@ def change_password(db: Session, user: User, old_password: str, new_password: st
     new_hashed_password = generate_password_hash(new_password)
     user.hashed_password = new_hashed_password
     db.commit()
+    invalidate_users(user.id)
 
 
 def list_users(db: Session, users_filter: UserFilter, current_user: User) -> List[User]:
@@ -309,3 +330,4 @@ def list_users(db: Session, users_filter: UserFilter, current_user: User) -> Lis
 def delete_users(db: Session, users_data: UserDeleteRequest):
     db.query(User).filter(User.id.in_(users_data.ids)).update({"is_deleted": True})
     db.commit()
+    invalidate_users(*users_data.ids)
@@ -0,0 +1,69 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from config.settings import settings
+from src.infrastructure.sqlalchemy.sips import (
+    get_sips_cache_entries,
+    increment_sips_cache_hits,
+    upsert_sips_cache_entries,
+)
+from src.sips.reader import SIPSTypes
+
+logger = logging.getLogger(__name__)
+
+
+class SIPSCache:
+    """
+    Postgres backed cache of the records returned by the CNMC SIPS API, stored per
+    CUPS and SIPS type. Entries older than the TTL are ignored and refetched, empty
+    ones, CUPS SIPS doesn't know yet, after the shorter SIPS_CACHE_EMPTY_TTL.
+    """
+
+    hits = 0
+    misses = 0
+
+    def __init__(self, db: Session, ttl: int = None):
+        self.db = db
+        self.ttl = settings.SIPS_CACHE_TTL if ttl is None else ttl
+        self.empty_ttl = min(settings.SIPS_CACHE_EMPTY_TTL, self.ttl)
+
+    @classmethod
+    def hit_ratio(cls) -> float:
+        lookups = cls.hits + cls.misses
+        return cls.hits / lookups if lookups else 0.0
+
+    @classmethod
+    def record_lookup(cls, hits: int, misses: int) -> None:
+        cls.hits += hits
+        cls.misses += misses
+
+    def get(self, sips_type: SIPSTypes, cups: List[str]) -> Dict[str, List[Dict]]:
+        now = datetime.utcnow()
+        min_fetched_at = now - timedelta(seconds=self.ttl)
+        min_empty_fetched_at = now - timedelta(seconds=self.empty_ttl)
+        entries = [
+            entry
+            for entry in get_sips_cache_entries(
+                self.db, sips_type, cups, min_fetched_at
+            )
+            if entry.records or entry.fetched_at >= min_empty_fetched_at
+        ]
+        if entries:
+            increment_sips_cache_hits([entry.id for entry in entries])
+
+        self.record_lookup(hits=len(entries), misses=len(set(cups)) - len(entries))
+        logger.info(
+            "[sips_type=%s] SIPS cache lookup hits=%s requested=%s hit_ratio=%.2f",
+            sips_type.value,
+            len(entries),
+            len(set(cups)),
+            self.hit_ratio(),
+        )
+        return {entry.cups: entry.records for entry in entries}
+
+    def set(self, sips_type: SIPSTypes, records_by_cups: Dict[str, List[Dict]]):
+        if records_by_cups:
+            upsert_sips_cache_entries(sips_type, records_by_cups)
@@ -36,6 +36,32 @@ class ConsumptionElectricityResponse(BaseModel):
         return delta.days
 
 
+class ConsumptionElectricityMonthResponse(BaseModel):
+    cups: constr(min_length=20, max_length=22)
+    start_date: pydantic.types.date
+    end_date: pydantic.types.date
+    rate_code: str | None
+    # Energies in Wh/VArh and power in W, as reported by SIPS
+    active_energy_p1: int = 0
+    active_energy_p2: int = 0
+    active_energy_p3: int = 0
+    active_energy_p4: int = 0
+    active_energy_p5: int = 0
+    active_energy_p6: int = 0
+    reactive_energy_p1: int = 0
+    reactive_energy_p2: int = 0
+    reactive_energy_p3: int = 0
+    reactive_energy_p4: int = 0
+    reactive_energy_p5: int = 0
+    reactive_energy_p6: int = 0
+    demanded_power_p1: int = 0
+    demanded_power_p2: int = 0
+    demanded_power_p3: int = 0
+    demanded_power_p4: int = 0
+    demanded_power_p5: int = 0
+    demanded_power_p6: int = 0
+
+
 class ConsumptionElectricityReader(BaseReader):
     FIELDS = [
         "cups",  # Código Universal de Punto de Suministro. X(22)
@@ -76,8 +102,8 @@ class ConsumptionElectricityReader(BaseReader):
         "codigoTipoLectura",  # Información sobre la procedencia de la lectura. X(2)
     ]
 
-    def get(self, cups: List[str]) -> Dict:
-        reader = self.fetch(SIPSTypes.CONSUMOS_ELECTRICIDAD, cups)
+    def get(self, cups: List[str], force_refresh: bool = False) -> Dict:
+        reader = self.read(SIPSTypes.CONSUMOS_ELECTRICIDAD, cups, force_refresh)
 
         data = dict()
 
@@ -87,6 +113,39 @@ class ConsumptionElectricityReader(BaseReader):
 
         return data
 
+    def get_monthly(
+        self, cups: List[str], force_refresh: bool = False
+    ) -> Dict[str, List[ConsumptionElectricityMonthResponse]]:
+        rows = self.read(SIPSTypes.CONSUMOS_ELECTRICIDAD, cups, force_refresh)
+
+        data = {cup: [] for cup in cups}
+        for row in rows:
+            data.setdefault(row["cups"], []).append(self._get_month(row))
+
+        return data
+
+    @staticmethod
+    def _get_month(row: Dict) -> ConsumptionElectricityMonthResponse:
+        def to_int(*fields: str) -> int:
+            return int(next((row[field] for field in fields if row.get(field)), 0))
+
+        values = dict()
+        for i in range(1, 7):
+            values[f"active_energy_p{i}"] = to_int(f"consumoEnergiaActivaEnWhP{i}")
+            # The reactive energy header is published both with and without accent
+            values[f"reactive_energy_p{i}"] = to_int(
+                f"consumoEnergíaReactivaEnVArhP{i}", f"consumoEnergiaReactivaEnVArhP{i}"
+            )
+            values[f"demanded_power_p{i}"] = to_int(f"potenciaDemandadaEnWP{i}")
+
+        return ConsumptionElectricityMonthResponse(
+            cups=row["cups"],
+            start_date=row["fechaInicioMesConsumo"],
+            end_date=row["fechaFinMesConsumo"],
+            rate_code=row.get("codigoTarifaATR") or None,
+            **values,
+        )
+
     @staticmethod
     def _get_by_cup(cup: str, results: Iterator) -> ConsumptionElectricityResponse:
         results = sorted(
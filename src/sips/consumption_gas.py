@@ -2,6 +2,8 @@ from src.sips.reader import BaseReader
 
 
 class ConsumptionGasReader(BaseReader):
+    CUPS_FIELD = "Cups"
+
     FIELDS = [
         "Cups",  # Código Universal de Punto de Suministro. X(22)
         "fechaInicioMesConsumo",  # Fecha inicio del periodo mensual de consumo. AAAA-MM-DD
@@ -0,0 +1,124 @@
+import csv
+import json
+import logging
+from datetime import date
+from io import StringIO
+from typing import IO, Dict, List
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.sips import (
+    copy_sips_dump_stage,
+    create_sips_dump_stage,
+    get_sips_dump_last_record_date,
+    get_sips_dump_records,
+    merge_sips_dump_stage,
+)
+from src.sips.consumption_electricity import ConsumptionElectricityReader
+from src.sips.consumption_gas import ConsumptionGasReader
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.ps_gas import PsGasReader
+from src.sips.reader import SIPSTypes
+
+logger = logging.getLogger(__name__)
+
+READERS = {
+    SIPSTypes.PS_ELECTRICIDAD: PsElectricityReader,
+    SIPSTypes.CONSUMOS_ELECTRICIDAD: ConsumptionElectricityReader,
+    SIPSTypes.PS_GAS: PsGasReader,
+    SIPSTypes.CONSUMOS_GAS: ConsumptionGasReader,
+}
+RECORD_DATE_FIELDS = {
+    SIPSTypes.PS_ELECTRICIDAD: "fechaUltimaLectura",
+    SIPSTypes.CONSUMOS_ELECTRICIDAD: "fechaFinMesConsumo",
+    SIPSTypes.PS_GAS: "fechaUltimoMovimientoContrato",
+    SIPSTypes.CONSUMOS_GAS: "fechaFinMesConsumo",
+}
+# PS extracts hold one current row per cups, consumption extracts one row per month
+PS_TYPES = (SIPSTypes.PS_ELECTRICIDAD, SIPSTypes.PS_GAS)
+# Rows without a valid date are stored with this one and always (re)imported
+UNDATED_RECORD_DATE = date(1970, 1, 1)
+
+
+class SIPSDumpImporter:
+    """
+    Stream a CNMC SIPS CSV extract into the sips_dump table. Rows are sent with COPY
+    in chunks of chunk_size rows, so memory usage does not depend on the file size.
+    """
+
+    def __init__(self, db: Session, sips_type: SIPSTypes, chunk_size: int = 50_000):
+        self.db = db
+        self.sips_type = sips_type
+        self.chunk_size = chunk_size
+        self.cups_field = READERS[sips_type].CUPS_FIELD
+        self.record_date_field = RECORD_DATE_FIELDS[sips_type]
+
+    def get_last_record_date(self) -> date | None:
+        return get_sips_dump_last_record_date(self.db, self.sips_type)
+
+    def import_file(
+        self, file: IO[str], since: date | None = None, delimiter: str = ","
+    ) -> int:
+        create_sips_dump_stage(self.db)
+        imported = 0
+        buffer, writer, buffered = self._new_chunk()
+
+        for row in csv.DictReader(file, delimiter=delimiter):
+            cups = row.get(self.cups_field)
+            if not cups:
+                continue
+            record_date = self.get_record_date(row)
+            if since and UNDATED_RECORD_DATE < record_date < since:
+                continue
+
+            writer.writerow(
+                [self.sips_type.name, cups, record_date.isoformat(), json.dumps(row)]
+            )
+            buffered += 1
+            if buffered >= self.chunk_size:
+                imported += self._flush(buffer)
+                buffer, writer, buffered = self._new_chunk()
+
+        if buffered:
+            imported += self._flush(buffer)
+        return imported
+
+    def get_record_date(self, row: Dict) -> date:
+        try:
+            return date.fromisoformat(row.get(self.record_date_field) or "")
+        except ValueError:
+            return UNDATED_RECORD_DATE
+
+    @staticmethod
+    def _new_chunk():
+        buffer = StringIO()
+        return buffer, csv.writer(buffer), 0
+
+    def _flush(self, buffer: StringIO) -> int:
+        buffer.seek(0)
+        copy_sips_dump_stage(self.db, buffer)
+        imported = merge_sips_dump_stage(self.db)
+        logger.info(
+            "[sips_type=%s] %s SIPS dump rows imported",
+            self.sips_type.value,
+            imported,
+        )
+        return imported
+
+
+class SIPSDumpStore:
+    """
+    Answer SIPS lookups from the rows imported with SIPSDumpImporter.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def get(self, sips_type: SIPSTypes, cups: List[str]) -> Dict[str, List[Dict]]:
+        records = get_sips_dump_records(
+            self.db, sips_type, cups, latest_only=sips_type in PS_TYPES
+        )
+        records_by_cups = dict()
+        for record in records:
+            records_by_cups.setdefault(record.cups, []).append(record.data)
+        return records_by_cups
@@ -0,0 +1,156 @@
+"""
+Local stand-in for the CNMC SIPS API, used to develop and benchmark without
+credentials or network access. Point SIPS_BASE_URL to it, for example:
+
+    python cli.py sips emulator --port 8001 --latency 0.3
+    SIPS_BASE_URL=http://localhost:8001/verticales/v1/SIPS/consulta/v1/
+"""
+import asyncio
+import csv
+import random
+from datetime import date, timedelta
+from io import StringIO
+from pathlib import Path
+from typing import Dict, List
+
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse, Response
+from starlette.routing import Route
+
+from src.sips.dump import PS_TYPES, READERS
+from src.sips.reader import SIPSTypes
+
+PATH = "/verticales/v1/SIPS/consulta/v1/{sips_type}.csv"
+
+
+class SIPSFixtures:
+    """
+    Rows served by the emulator. Recorded rows are read from <fixtures_dir>/<SIPS
+    type>.csv files (e.g. SIPS2_PS_ELECTRICIDAD.csv); cups without recorded rows get
+    generated ones, deterministic per cups, unless generate is False.
+    """
+
+    def __init__(
+        self,
+        fixtures_dir: Path | None = None,
+        months: int = 12,
+        generate: bool = True,
+        seed: int = 0,
+    ):
+        self.months = months
+        self.generate = generate
+        self.seed = seed
+        self.recorded = {sips_type: dict() for sips_type in SIPSTypes}
+        if fixtures_dir:
+            for sips_type in SIPSTypes:
+                self._load(fixtures_dir / f"{sips_type.value}.csv", sips_type)
+
+    def _load(self, path: Path, sips_type: SIPSTypes) -> None:
+        if not path.exists():
+            return
+        cups_field = READERS[sips_type].CUPS_FIELD
+        with open(path, newline="", encoding="utf-8") as file:
+            for row in csv.DictReader(file):
+                self.recorded[sips_type].setdefault(row[cups_field], []).append(row)
+
+    def get(self, sips_type: SIPSTypes, cups: List[str]) -> List[Dict]:
+        rows = []
+        for cup in cups:
+            if cup in self.recorded[sips_type]:
+                rows.extend(self.recorded[sips_type][cup])
+            elif self.generate:
+                rows.extend(self.generate_rows(sips_type, cup))
+        return rows
+
+    def generate_rows(self, sips_type: SIPSTypes, cups: str) -> List[Dict]:
+        rng = random.Random(f"{self.seed}-{sips_type.value}-{cups}")
+        if sips_type in PS_TYPES:
+            return [self._generate_row(sips_type, cups, rng, date.today())]
+
+        rows = []
+        end_date = date.today().replace(day=1)
+        for _ in range(self.months):
+            start_date = (end_date - timedelta(days=1)).replace(day=1)
+            row = self._generate_row(sips_type, cups, rng, start_date)
+            row["fechaInicioMesConsumo"] = start_date.isoformat()
+            row["fechaFinMesConsumo"] = end_date.isoformat()
+            rows.append(row)
+            end_date = start_date
+        return rows
+
+    @staticmethod
+    def _generate_row(
+        sips_type: SIPSTypes, cups: str, rng: random.Random, day: date
+    ) -> Dict:
+        reader_class = READERS[sips_type]
+        row = dict()
+        for field in reader_class.FIELDS:
+            lower_field = field.lower()
+            if lower_field.startswith("fecha"):
+                row[field] = (day - timedelta(days=rng.randint(0, 365))).isoformat()
+            elif "caudal" in lower_field or "consumo" in lower_field:
+                row[field] = str(rng.randint(0, 500_000))
+            elif "potencia" in lower_field or lower_field.endswith("w"):
+                row[field] = str(rng.randint(1, 20) * 500)
+            else:
+                row[field] = ""
+        row[reader_class.CUPS_FIELD] = cups
+        if sips_type == SIPSTypes.PS_ELECTRICIDAD:
+            row["codigoTarifaATREnVigor"] = "018"
+            row["codigoTensionV"] = rng.choice(["02", "08"])
+            row["codigoTelegestion"] = rng.choice(["01", "03"])
+        elif sips_type == SIPSTypes.CONSUMOS_ELECTRICIDAD:
+            row["codigoTarifaATR"] = "018"
+        return row
+
+
+def to_csv(rows: List[Dict], fields: List[str]) -> str:
+    buffer = StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, extrasaction="ignore")
+    writer.writeheader()
+    writer.writerows(rows)
+    return buffer.getvalue()
+
+
+def create_app(
+    fixtures: SIPSFixtures | None = None,
+    latency: float = 0,
+    jitter: float = 0,
+    error_rate: float = 0,
+    max_cups: int = 100,
+) -> Starlette:
+    """
+    latency and jitter are in seconds, error_rate is the fraction of requests
+    answered with a 500 error. Requests with more than max_cups cups get a 400.
+    """
+    fixtures = fixtures or SIPSFixtures()
+    rng = random.Random()
+    stats = {"requests": 0, "errors": 0, "cups": 0}
+
+    async def sips(request: Request) -> Response:
+        stats["requests"] += 1
+        try:
+            sips_type = SIPSTypes(request.path_params["sips_type"])
+        except ValueError:
+            return PlainTextResponse("Unknown SIPS type", status_code=404)
+
+        cups = [cup for cup in request.query_params.get("cups", "").split(",") if cup]
+        if not cups or len(cups) > max_cups:
+            return PlainTextResponse("Invalid cups", status_code=400)
+
+        if latency or jitter:
+            await asyncio.sleep(latency + rng.uniform(0, jitter))
+        if rng.random() < error_rate:
+            stats["errors"] += 1
+            return PlainTextResponse("Emulated error", status_code=500)
+
+        stats["cups"] += len(cups)
+        fields = READERS[sips_type].FIELDS
+        return PlainTextResponse(
+            to_csv(fixtures.get(sips_type, cups), fields), media_type="text/csv"
+        )
+
+    app = Starlette(routes=[Route(PATH, sips)])
+    app.state.stats = stats
+    return app
@@ -112,6 +112,6 @@ class PsElectricityReader(BaseReader):
         # “1” - sí se aplica bono social.
     ]
 
-    def get(self, cups: List[str]) -> Dict:
-        result = self.fetch(SIPSTypes.PS_ELECTRICIDAD, cups)
+    def get(self, cups: List[str], force_refresh: bool = False) -> Dict:
+        result = self.read(SIPSTypes.PS_ELECTRICIDAD, cups, force_refresh)
         return BaseReader._get(result)
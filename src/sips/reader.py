@@ -1,7 +1,7 @@
 import csv
 from enum import Enum
 from io import StringIO
-from typing import Dict, List
+from typing import Dict, Iterable, List
 
 import requests
 from requests_oauthlib import OAuth1
@@ -24,15 +24,78 @@ class ReaderException(Exception):
 
 class BaseReader:
     FIELDS = []
+    CUPS_FIELD = "cups"
 
     BASE_URL = "https://api.cnmc.gob.es/verticales/v1/SIPS/consulta/v1/"
     consumer_key = None
     consumer_secret = None
+    cache = None
+    dump_store = None
+    offline = False
 
     def set_credentials(self, consumer_key: str, consumer_secret: str):
         self.consumer_key = consumer_key
         self.consumer_secret = consumer_secret
 
+    def set_base_url(self, base_url: str):
+        self.BASE_URL = base_url
+
+    def set_cache(self, cache):
+        self.cache = cache
+
+    def set_dump_store(self, dump_store, offline: bool = False):
+        self.dump_store = dump_store
+        self.offline = offline
+
+    def read(
+        self, sips_type: SIPSTypes, cups: List[str], force_refresh: bool = False
+    ) -> List[Dict]:
+        """
+        Return the SIPS rows of the given cups. They are looked up in the imported
+        SIPS dump first, then in the cache and finally requested to the CNMC API.
+        force_refresh skips the dump and the cache, except in offline mode where the
+        CNMC API is never called.
+        """
+        records = dict()
+        if self.dump_store is not None and (self.offline or not force_refresh):
+            records.update(self.dump_store.get(sips_type, cups))
+
+        missing_cups = [cup for cup in dict.fromkeys(cups) if cup not in records]
+        if missing_cups and not self.offline:
+            records.update(self._read_remote(sips_type, missing_cups, force_refresh))
+
+        return [row for rows in records.values() for row in rows]
+
+    def _read_remote(
+        self, sips_type: SIPSTypes, cups: List[str], force_refresh: bool
+    ) -> Dict[str, List[Dict]]:
+        if self.cache is None:
+            return self._group_by_cups(self.fetch(sips_type, cups), [])
+
+        records = dict() if force_refresh else self.cache.get(sips_type, cups)
+        missing_cups = [cup for cup in cups if cup not in records]
+        if missing_cups:
+            fetched_records = self._group_by_cups(
+                self.fetch(sips_type, missing_cups), missing_cups
+            )
+            self.cache.set(sips_type, fetched_records)
+            records.update(fetched_records)
+        return records
+
+    def _group_by_cups(self, rows: Iterable[Dict], cups: List[str]) -> Dict:
+        # Cups without rows are kept too, so unknown cups are not requested again
+        grouped_rows = {cup: [] for cup in cups}
+        for row in rows:
+            grouped_rows.setdefault(row[self.CUPS_FIELD], []).append(row)
+        return grouped_rows
+
+    def fetch_by_cups(self, sips_type: SIPSTypes, cups: List[str]) -> Dict[str, Dict]:
+        """
+        Rows of the cups requested to the CNMC API by cups, the dump and the cache
+        are not looked up.
+        """
+        return self._get(self.fetch(sips_type, cups))
+
     def fetch(self, sips_type: SIPSTypes, cups: List[str]):
         if self.consumer_key is None or self.consumer_secret is None:
             raise ReaderException(code=0, message="Invalid credentials")
@@ -60,7 +123,7 @@ class BaseReader:
         return reader
 
     @staticmethod
-    def _get(result: csv.DictReader) -> Dict:
+    def _get(result: Iterable[Dict]) -> Dict:
         data = dict()
         for row in result:
             data[row["cups"]] = row
@@ -0,0 +1,196 @@
+import json
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.supply_points import (
+    bulk_update_supply_points,
+    get_supply_points_batch,
+    get_supply_points_by_ids,
+)
+from src.modules.supply_points.models import CounterType
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import ReaderException, SIPSTypes
+
+logger = logging.getLogger(__name__)
+
+COUNTER_TYPES = {
+    "01": CounterType.telematic,
+    "02": CounterType.telematic,
+    "03": CounterType.normal,
+}
+
+
+def split_in_chunks(items: List, size: int) -> List[List]:
+    chunks = []
+    for start in range(0, len(items), size):
+        end = start + size
+        chunks.append(items[start:end])
+    return chunks
+
+
+def get_technical_data(row: Dict) -> Dict:
+    """
+    Supply point technical fields found in a SIPS PS electricity row. Fields SIPS
+    does not inform are left out, so they are never overwritten with empty values.
+    """
+    data = dict()
+    max_power = row.get("potenciaMaximaAPMW") or row.get("potenciaMaximaBIEW")
+    if max_power and int(max_power) > 0:
+        data["max_available_power"] = int(max_power)
+    counter_type = COUNTER_TYPES.get(row.get("codigoTelegestion"))
+    if counter_type:
+        data["counter_type"] = counter_type
+    return data
+
+
+class SupplyPointRefresher:
+    """
+    Refresh the technical data of every active electricity supply point from SIPS.
+    Supply points are walked by id in batches of batch_size, each batch is requested
+    to SIPS in concurrent requests of request_size cups, and only the changed fields
+    are written back. The last processed id and the ids of the supply points whose
+    request failed are saved in the checkpoint file after every batch, so an
+    interrupted run can be resumed. The failed supply points are requested again
+    once the walk is over.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        reader: PsElectricityReader,
+        batch_size: int = 1_000,
+        request_size: int = 50,
+        workers: int = 4,
+        checkpoint: Path | None = None,
+        cache=None,
+    ):
+        self.db = db
+        self.reader = reader
+        self.batch_size = batch_size
+        self.request_size = request_size
+        self.workers = workers
+        self.checkpoint = checkpoint
+        self.cache = cache
+        self.stats = {
+            "last_id": 0,
+            "processed": 0,
+            "updated": 0,
+            "failed": 0,
+            "failed_ids": [],
+        }
+
+    def load_checkpoint(self) -> Dict:
+        if self.checkpoint and self.checkpoint.exists():
+            self.stats.update(json.loads(self.checkpoint.read_text()))
+        return self.stats
+
+    def save_checkpoint(self) -> None:
+        if self.checkpoint:
+            self.checkpoint.write_text(json.dumps(self.stats))
+
+    def clear_checkpoint(self) -> None:
+        if self.checkpoint and self.checkpoint.exists():
+            self.checkpoint.unlink()
+
+    def run(self) -> Dict:
+        started_at = time.monotonic()
+        processed_at_start = self.stats["processed"]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            while True:
+                supply_points = get_supply_points_batch(
+                    self.db, self.stats["last_id"], self.batch_size
+                )
+                if not supply_points:
+                    break
+
+                self.stats["updated"] += self._refresh(executor, supply_points)
+                self.stats["last_id"] = supply_points[-1].id
+                self.stats["processed"] += len(supply_points)
+                self.stats["failed"] = len(self.stats["failed_ids"])
+                self.save_checkpoint()
+
+                elapsed = time.monotonic() - started_at
+                cups_per_second = (self.stats["processed"] - processed_at_start) / max(
+                    elapsed, 1e-6
+                )
+                logger.info(
+                    "[last_id=%s] %s supply points processed, %s updated, %s failed "
+                    "(%.1f CUPS/s)",
+                    self.stats["last_id"],
+                    self.stats["processed"],
+                    self.stats["updated"],
+                    self.stats["failed"],
+                    cups_per_second,
+                )
+
+            self._retry_failed(executor)
+
+        self.clear_checkpoint()
+        return self.stats
+
+    def _retry_failed(self, executor: ThreadPoolExecutor) -> None:
+        failed_ids, self.stats["failed_ids"] = self.stats["failed_ids"], []
+        if not failed_ids:
+            return
+
+        supply_points = get_supply_points_by_ids(self.db, failed_ids)
+        self.stats["updated"] += self._refresh(executor, supply_points)
+        self.stats["failed"] = len(self.stats["failed_ids"])
+        if self.stats["failed_ids"]:
+            logger.warning(
+                "SIPS requests failed again for supply points %s",
+                self.stats["failed_ids"],
+            )
+
+    def _refresh(self, executor: ThreadPoolExecutor, supply_points: List) -> int:
+        rows = self._fetch(executor, supply_points)
+        changes = self.get_changes(supply_points, rows)
+        bulk_update_supply_points(self.db, changes)
+        return len(changes)
+
+    def _fetch(
+        self, executor: ThreadPoolExecutor, supply_points: List
+    ) -> Dict[str, Dict]:
+        chunks = split_in_chunks(supply_points, self.request_size)
+        cups_chunks = [[sp.cups for sp in chunk] for chunk in chunks]
+        rows = dict()
+        for chunk, result in zip(chunks, executor.map(self._fetch_chunk, cups_chunks)):
+            if result is None:
+                self.stats["failed_ids"].extend(sp.id for sp in chunk)
+                continue
+            rows.update(result)
+
+        if self.cache is not None and rows:
+            self.cache.set(
+                SIPSTypes.PS_ELECTRICIDAD, {cups: [row] for cups, row in rows.items()}
+            )
+        return rows
+
+    def _fetch_chunk(self, cups: List[str]) -> Dict[str, Dict] | None:
+        try:
+            return self.reader.fetch_by_cups(SIPSTypes.PS_ELECTRICIDAD, cups)
+        except (ReaderException, OSError) as e:
+            logger.warning("SIPS request of %s cups failed: %s", len(cups), e)
+            return None
+
+    @staticmethod
+    def get_changes(supply_points: List, rows: Dict[str, Dict]) -> List[Dict]:
+        changes = []
+        for supply_point in supply_points:
+            row = rows.get(supply_point.cups)
+            if not row:
+                continue
+            changed_fields = {
+                field: value
+                for field, value in get_technical_data(row).items()
+                if getattr(supply_point, field) != value
+            }
+            if changed_fields:
+                changes.append({"id": supply_point.id, **changed_fields})
+        return changes
@@ -1,4 +1,5 @@
 import datetime
+from contextlib import contextmanager
 from typing import List
 
 import psycopg2
@@ -9,12 +10,18 @@ from fastapi.testclient import TestClient
 from fastapi_mail import FastMail
 from passlib.hash import pbkdf2_sha256
 from psycopg2.extensions import ISOLATION_LEVEL_AUTOCOMMIT
+from sqlalchemy import event
+from sqlalchemy.exc import MissingGreenlet
 from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only, greenlet_spawn
 
 from config.settings import settings
 from main import app
+from src.infrastructure.cache.catalogs import catalog_caches
+from src.infrastructure.cache.tokens import token_cache
 from src.infrastructure.email.email_config import EmailConfig
-from src.infrastructure.sqlalchemy.database import Base, engine, get_db
+from src.infrastructure.sqlalchemy.database import Base, engine, get_async_db, get_db
+from src.infrastructure.sqlalchemy.queries import count_queries
 from src.modules.clients.models import Client, InvoiceNotificationType
 from src.modules.commissions.models import Commission, RangeType
 from src.modules.contacts.models import Contact
@@ -126,6 +133,73 @@ def db_session():
     connection.close()
 
 
+async def _driver_io():
+    pass
+
+
+class AsyncSessionAdapter:
+    """
+    AsyncSession interface over a sync session on the connection of the test
+    transaction, so async endpoints see its rows. Like AsyncSession, the statements
+    run inside greenlet_spawn, and any other, e.g. the lazy load of a relationship
+    while the response is serialized, raises MissingGreenlet as asyncpg does.
+    """
+
+    def __init__(self, db_session: Session):
+        # A session of its own, the instances of the fixtures are not reused
+        self.sync_session = Session(bind=db_session.bind)
+        event.listen(self.sync_session, "do_orm_execute", self._check_greenlet)
+
+    @staticmethod
+    def _check_greenlet(orm_execute_state) -> None:
+        coroutine = _driver_io()
+        try:
+            await_only(coroutine)
+        except MissingGreenlet:
+            coroutine.close()
+            raise
+
+    async def execute(self, *args, **kwargs):
+        return await greenlet_spawn(self.sync_session.execute, *args, **kwargs)
+
+    async def scalar(self, *args, **kwargs):
+        return await greenlet_spawn(self.sync_session.scalar, *args, **kwargs)
+
+    async def scalars(self, *args, **kwargs):
+        return await greenlet_spawn(self.sync_session.scalars, *args, **kwargs)
+
+    async def get(self, *args, **kwargs):
+        return await greenlet_spawn(self.sync_session.get, *args, **kwargs)
+
+    def close(self) -> None:
+        self.sync_session.close()
+
+
+@pytest.fixture
+def async_db_session(db_session: Session) -> AsyncSessionAdapter:
+    adapter = AsyncSessionAdapter(db_session)
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    # Test users share ids and tokens, so cached identities must not leak between tests
+    token_cache.clear()
+    yield
+    token_cache.clear()
+
+
+@pytest.fixture(autouse=True)
+def clear_catalog_caches():
+    # Rows are rolled back after every test, their cached snapshots must go too
+    for cache in catalog_caches.values():
+        cache.invalidate()
+    yield
+    for cache in catalog_caches.values():
+        cache.invalidate()
+
+
 @pytest.fixture()
 def test_client(db_session: Session) -> TestClient:
     def override_get_db():
@@ -134,10 +208,34 @@ def test_client(db_session: Session) -> TestClient:
         finally:
             db_session.close()
 
+    async def override_get_async_db():
+        adapter = AsyncSessionAdapter(db_session)
+        try:
+            yield adapter
+        finally:
+            adapter.close()
+
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     return TestClient(app)
 
 
+@pytest.fixture
+def assert_num_queries():
+    """
+    with assert_num_queries(3):
+        test_client.get(...)
+    """
+
+    @contextmanager
+    def _assert_num_queries(expected: int):
+        with count_queries() as stats:
+            yield stats
+        assert stats.count == expected, f"{stats.count} queries, {expected} expected"
+
+    return _assert_num_queries
+
+
 @pytest.fixture()
 def user_create(db_session: Session, hashed_password_example: str) -> User:
     user = User(
@@ -0,0 +1,38 @@
+from sqlalchemy.orm import Query
+
+from src.infrastructure.sqlalchemy.exports import (
+    get_export_options,
+    get_relationship_paths,
+)
+from src.modules.commissions.models import Commission
+from src.modules.margins.models import Margin
+from src.modules.saving_studies.models import SavingStudy
+
+
+def test_get_relationship_paths():
+    assert get_relationship_paths(
+        ["id", "rate.name", "rate.rate_type.name", "rates:name", "rate.id"]
+    ) == [["rate"], ["rate", "rate_type"], ["rates"]]
+
+
+def test_get_export_options_joined_many_to_one():
+    options = get_export_options(Margin, ["id", "rate.rate_type.name"])
+
+    statement = str(Query(Margin).options(*options).statement)
+    assert "LEFT OUTER JOIN rate AS rate_1 ON rate_1.id = margin.rate_id" in statement
+    assert "LEFT OUTER JOIN rate_type AS rate_type_1" in statement
+
+
+def test_get_export_options_collection_not_joined():
+    options = get_export_options(Commission, ["id", "rates:name"])
+
+    assert len(options) == 1
+    assert "JOIN" not in str(Query(Commission).options(*options).statement)
+
+
+def test_get_export_options_property():
+    options = get_export_options(
+        SavingStudy, ["id", "selected_suggested_rate.name", "user_creator.id"]
+    )
+
+    assert len(options) == 1
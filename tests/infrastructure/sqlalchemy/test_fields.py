@@ -0,0 +1,25 @@
+from sqlalchemy.orm import Query
+
+from src.infrastructure.sqlalchemy.fields import get_load_only_option
+from src.modules.rates.models import Rate
+from src.modules.saving_studies.models import SavingStudy
+
+
+def test_get_load_only_option_columns():
+    option = get_load_only_option(Rate, ["name", "min_power"])
+
+    assert str(Query(Rate).options(option).statement) == (
+        "SELECT rate.id, rate.name, rate.min_power \nFROM rate"
+    )
+
+
+def test_get_load_only_option_relationship_foreign_key():
+    option = get_load_only_option(Rate, ["id", "rate_type"])
+
+    assert str(Query(Rate).options(option).statement) == (
+        "SELECT rate.id, rate.rate_type_id \nFROM rate"
+    )
+
+
+def test_get_load_only_option_property():
+    assert get_load_only_option(SavingStudy, ["id", "selected_suggested_rate"]) is None
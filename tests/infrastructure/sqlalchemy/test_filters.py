@@ -1,12 +1,22 @@
 from typing import List
 
 import pytest
-from fastapi_filter import FilterDepends, with_prefix
-from sqlalchemy.orm import Session, aliased
-
-from src.infrastructure.sqlalchemy.filters import Filter
-from src.modules.rates.models import RateType
+from fastapi import FastAPI
+from fastapi.exceptions import RequestValidationError
+from fastapi.testclient import TestClient
+from fastapi_filter import FilterDepends as WrapperFilterDepends
+from fastapi_filter import with_prefix
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session, aliased
+
+from src.infrastructure.sqlalchemy.filters import Filter, FilterDepends
+from src.modules.commissions.models import Commission
+from src.modules.margins.models import Margin
+from src.modules.margins.schemas import MarginFilter
+from src.modules.rates.models import Rate, RateType
 from src.modules.users.models import User
+from src.modules.users.schemas import UserFilter
+from src.services.exceptions import request_validation_error_handler
 
 
 class DummyUserFilter(Filter):
@@ -23,7 +33,7 @@ class DummyRateTypeFilter(Filter):
     name__unaccent: str | None
     name: str | None
     name__ilike: str | None
-    user: DummyUserFilter | None = FilterDepends(
+    user: DummyUserFilter | None = WrapperFilterDepends(
         with_prefix("user", DummyUserFilter), use_cache=False
     )
 
@@ -33,6 +43,26 @@ class DummyRateTypeFilter(Filter):
         search_model_fields = ["name"]
 
 
+class DummyRateFilter(Filter):
+    name__unaccent: str | None
+    rate_type: DummyRateTypeFilter | None = WrapperFilterDepends(
+        with_prefix("rates__rate_type", DummyRateTypeFilter), use_cache=False
+    )
+
+    class Constants(Filter.Constants):
+        model = Rate
+
+
+class DummyCommissionFilter(Filter):
+    order_by: List[str] | None
+    rates: DummyRateFilter | None = WrapperFilterDepends(
+        with_prefix("rates", DummyRateFilter), use_cache=False
+    )
+
+    class Constants(Filter.Constants):
+        model = Commission
+
+
 class TestFilter:
     def test_filter_unaccent(
         self, rate_type_with_accent: RateType, db_session: Session
@@ -52,6 +82,15 @@ class TestFilter:
 
         assert rate_types.first() == gas_rate_type
 
+    def test_filter_unaccent_uses_trigram_index_expression(self):
+        rate_type_filter = DummyRateTypeFilter(name__unaccent="Gás")
+
+        query = rate_type_filter.filter(Query(RateType.id))
+
+        compiled = query.statement.compile(dialect=postgresql.dialect())
+        assert "WHERE f_unaccent(rate_type.name) ILIKE" in str(compiled)
+        assert list(compiled.params.values()) == ["%Gas%"]
+
     def test_filter_relationship_value(
         self, gas_rate_type: RateType, db_session: Session
     ):
@@ -61,6 +100,51 @@ class TestFilter:
 
         assert rate_types.first() == gas_rate_type
 
+    def test_filter_empty_relationship_filter_without_join(self):
+        rate_type_filter = DummyRateTypeFilter(user=DummyUserFilter())
+
+        query = rate_type_filter.filter(Query(RateType.id))
+
+        assert "JOIN" not in str(query.statement)
+
+    def test_filter_relationship_and_order_by_same_join(self):
+        rate_type_filter = DummyRateTypeFilter(
+            user=DummyUserFilter(first_name="John"), order_by="user__first_name"
+        )
+
+        query = rate_type_filter.sort(rate_type_filter.filter(Query(RateType.id)))
+
+        statement = str(query.statement)
+        assert statement.count("JOIN") == 1
+        assert "WHERE user_table_1.first_name = " in statement
+        assert "ORDER BY user_table_1.first_name ASC" in statement
+
+    def test_filter_to_many_relationship_exists(self):
+        commission_filter = DummyCommissionFilter(
+            rates=DummyRateFilter(
+                name__unaccent="gas", rate_type=DummyRateTypeFilter(name="Gas")
+            )
+        )
+
+        query = commission_filter.filter(Query(Commission.id))
+
+        statement = str(query.statement)
+        assert "JOIN" not in statement
+        assert statement.count("EXISTS") == 2
+
+    def test_filter_to_many_relationship_exists_no_duplicates(
+        self, commission: Commission, gas_rate: Rate, db_session: Session
+    ):
+        commission.rates.append(gas_rate)
+        db_session.commit()
+        commission_filter = DummyCommissionFilter(
+            rates=DummyRateFilter(name__unaccent="rate")
+        )
+
+        commissions = commission_filter.filter(db_session.query(Commission)).all()
+
+        assert commissions == [commission]
+
     def test_get_order_by_ok(self):
         dummy_rate_type_filter = DummyRateTypeFilter(order_by="name")
 
@@ -77,6 +161,18 @@ class TestFilter:
 
         assert dummy_rate_type_user_field == DummyUserFilter.Constants.model.first_name
 
+    def test_get_ordering_adds_primary_key(self):
+        dummy_rate_type_filter = DummyRateTypeFilter(order_by="-name")
+
+        ordering = dummy_rate_type_filter.get_ordering()
+
+        assert ordering == [(RateType.name, True), (RateType.id, True)]
+
+    def test_get_ordering_by_primary_key(self):
+        dummy_rate_type_filter = DummyRateTypeFilter(order_by="id")
+
+        assert dummy_rate_type_filter.get_ordering() == [(RateType.id, False)]
+
     def test_get_order_by_relationship_value_error(self):
         dummy_rate_type_filter = DummyRateTypeFilter(order_by="user__first_name")
         with pytest.raises(ValueError) as exc:
@@ -161,6 +257,18 @@ class TestFilter:
         assert response[1].name == "Electricity rate type"
         assert response[2].name == "Disable rate type"
 
+    def test_sort_by_every_field_and_primary_key(self):
+        rate_type_filter = DummyRateTypeFilter(order_by="-name,user__first_name")
+
+        query = rate_type_filter.sort(
+            rate_type_filter.filter(Query(RateType.id)), RateType
+        )
+
+        assert str(query.statement).endswith(
+            "ORDER BY rate_type.name DESC, user_table_1.first_name ASC, "
+            "rate_type.id ASC"
+        )
+
     def test_sort_by_foreign_key_error(
         self,
         electricity_rate_type: RateType,
@@ -196,3 +304,75 @@ class TestFilter:
         assert response[0].name == "Electricity rate type"
         assert response[0].user.first_name == "John"
         assert response[1].user.first_name == "Johnathan"
+
+    def test_filter_search_with_accent(
+        self,
+        electricity_rate_type: RateType,
+        gas_rate_type: RateType,
+        disable_rate_type: RateType,
+        superadmin: User,
+        user_create2: User,
+        db_session: Session,
+    ):
+        gas_rate_type.user = superadmin
+        disable_rate_type.user = user_create2
+
+        rate_type_filter = DummyRateTypeFilter(user=DummyUserFilter(search="jóhn"))
+
+        rate_types = rate_type_filter.filter(db_session.query(RateType))
+
+        assert rate_types.count() == 2
+
+
+@pytest.fixture
+def filter_sql_client() -> TestClient:
+    """
+    App whose endpoints return the SQL the filters of the margins and the users
+    build, the filters resolved by FilterDepends like in the routers.
+    """
+    app = FastAPI()
+    app.add_exception_handler(
+        RequestValidationError,
+        lambda request, exc: request_validation_error_handler(exc),
+    )
+
+    def get_sql(sort_filter: Filter, model) -> str:
+        query = sort_filter.sort(sort_filter.filter(Query(model)))
+        return " ".join(
+            str(query.statement.compile(dialect=postgresql.dialect())).split()
+        )
+
+    @app.get("/margins")
+    def margins(margin_filter: MarginFilter = FilterDepends(MarginFilter)) -> str:
+        return get_sql(margin_filter, Margin)
+
+    @app.get("/users")
+    def users(user_filter: UserFilter = FilterDepends(UserFilter)) -> str:
+        return get_sql(user_filter, User)
+
+    return TestClient(app)
+
+
+def test_filter_depends_related_ordering(filter_sql_client: TestClient):
+    sql = filter_sql_client.get(
+        "/margins", params={"order_by": "-rate__rate_type__name"}
+    ).json()
+
+    assert "LEFT OUTER JOIN rate_type AS rate_type_1" in sql
+    assert "ORDER BY rate_type_1.name DESC, margin.id DESC" in sql
+
+
+def test_filter_depends_related_ordering_of_same_model(filter_sql_client: TestClient):
+    sql = filter_sql_client.get(
+        "/users", params={"order_by": "responsible__first_name"}
+    ).json()
+
+    assert "ORDER BY user_table_1.first_name ASC, user_table.id ASC" in sql
+
+
+def test_filter_depends_invalid_ordering(filter_sql_client: TestClient):
+    response = filter_sql_client.get("/margins", params={"order_by": "unknown"})
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["source"] == "query"
+    assert response.json()["detail"][0]["field"] == "order_by"
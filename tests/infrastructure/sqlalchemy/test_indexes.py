@@ -0,0 +1,84 @@
+import json
+from typing import Set
+
+import pytest
+from sqlalchemy import false, text
+from sqlalchemy.orm import Query, Session
+
+from src.infrastructure.sqlalchemy.pagination import Explain
+from src.infrastructure.sqlalchemy.studies import (
+    get_candidate_rates,
+    get_other_costs_rate_study,
+)
+from src.modules.margins.models import Margin
+from src.modules.marketers.models import Marketer
+from src.modules.rates.models import Rate
+from src.modules.saving_studies.models import SavingStudy
+from src.modules.users.models import User
+
+
+def get_plan_indexes(plan: dict) -> Set[str]:
+    indexes = {plan["Index Name"]} if "Index Name" in plan else set()
+    for subplan in plan.get("Plans", []):
+        indexes |= get_plan_indexes(subplan)
+    return indexes
+
+
+def get_query_indexes(db: Session, query: Query) -> Set[str]:
+    # The test tables are tiny, where a sequential scan is always cheaper, so it is
+    # disabled to check that an index can serve the query at all
+    db.execute(text("SET LOCAL enable_seqscan = off"))
+    plan = db.execute(Explain(query.statement)).scalar()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return get_plan_indexes(plan[0]["Plan"])
+
+
+def test_candidate_rates_index(db_session: Session, saving_study: SavingStudy):
+    query = get_candidate_rates(db_session, saving_study.id)
+
+    assert "ix_rate_candidates" in get_query_indexes(db_session, query)
+
+
+def test_other_costs_rate_study_index(
+    db_session: Session, saving_study: SavingStudy, electricity_rate: Rate
+):
+    query = get_other_costs_rate_study(db_session, saving_study, electricity_rate.id)
+
+    assert "ix_other_costs_rates_rate_id_other_cost_id" in get_query_indexes(
+        db_session, query
+    )
+
+
+def test_other_costs_rate_study_mandatory_index(
+    db_session: Session, saving_study: SavingStudy, electricity_rate: Rate
+):
+    query = get_other_costs_rate_study(db_session, saving_study, electricity_rate.id)
+
+    assert "ix_other_cost_id_mandatory" in get_query_indexes(db_session, query)
+
+
+def test_margins_rate_index(db_session: Session):
+    query = db_session.query(Margin).filter(
+        Margin.rate_id == 1, Margin.is_deleted == false()
+    )
+
+    assert "ix_margin_rate_id_not_deleted" in get_query_indexes(db_session, query)
+
+
+@pytest.mark.parametrize(
+    "model,order_by,index_name",
+    [
+        (Marketer, Marketer.create_at.desc(), "ix_marketer_create_at_not_deleted"),
+        (User, User.create_at.desc(), "ix_user_table_create_at_not_deleted"),
+    ],
+)
+def test_list_not_deleted_index(db_session: Session, model, order_by, index_name):
+    query = (
+        db_session.query(model)
+        .filter(model.is_deleted == false())
+        .order_by(order_by)
+        .limit(50)
+    )
+
+    assert index_name in get_query_indexes(db_session, query)
@@ -0,0 +1,85 @@
+import datetime
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+
+from src.infrastructure.sqlalchemy.keyset import (
+    InvalidCursor,
+    decode_keyset,
+    encode_keyset,
+    keyset_condition,
+    keyset_query,
+)
+from src.modules.clients.models import Client, InvoiceNotificationType
+from src.modules.saving_studies.models import SuggestedRate
+
+
+def compile_sql(statement) -> str:
+    return str(
+        statement.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def test_encode_decode_keyset():
+    ordering = [
+        (Client.create_at, True),
+        (Client.invoice_notification_type, False),
+        (SuggestedRate.net_metering_value, False),
+        (Client.fiscal_name, False),
+        (Client.id, True),
+    ]
+    values = [
+        datetime.datetime(2023, 5, 1, 10, 30),
+        InvoiceNotificationType.email,
+        Decimal("10.25"),
+        None,
+        7,
+    ]
+
+    assert decode_keyset(encode_keyset(values), ordering) == values
+
+
+@pytest.mark.parametrize("cursor", ["foo", "[1, 2]", '{"id": 1}'])
+def test_decode_keyset_invalid(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_keyset(cursor, [(Client.id, False)])
+
+
+def test_keyset_condition():
+    condition = keyset_condition(
+        [(Client.fiscal_name, False), (Client.id, False)], ["Acme", 3]
+    )
+
+    assert compile_sql(condition) == (
+        "client.fiscal_name > 'Acme' OR client.fiscal_name IS NULL "
+        "OR client.fiscal_name = 'Acme' AND client.id > 3"
+    )
+
+
+def test_keyset_condition_null_descending():
+    condition = keyset_condition(
+        [(Client.fiscal_name, True), (Client.id, True)], [None, 3]
+    )
+
+    assert compile_sql(condition) == (
+        "client.fiscal_name IS NOT NULL "
+        "OR client.fiscal_name IS NULL AND client.id < 3"
+    )
+
+
+def test_keyset_query():
+    query = keyset_query(
+        select(Client).order_by(Client.alias),
+        [(Client.create_at, True), (Client.id, True)],
+        [datetime.datetime(2023, 5, 1), 3],
+        10,
+    )
+
+    sql = compile_sql(query)
+    assert "ORDER BY client.create_at DESC, client.id DESC" in sql
+    assert "client.alias" not in sql.split("ORDER BY")[1]
+    assert sql.endswith("LIMIT 11")
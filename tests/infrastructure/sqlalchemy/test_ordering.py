@@ -0,0 +1,104 @@
+import logging
+from typing import List
+
+import pytest
+from pydantic import ValidationError
+from sqlalchemy.orm import aliased
+
+from src.infrastructure.sqlalchemy import ordering
+from src.infrastructure.sqlalchemy.filters import Filter
+from src.infrastructure.sqlalchemy.ordering import (
+    UnindexedOrdering,
+    check_ordering,
+    is_ordering_indexed,
+)
+from src.modules.clients.models import Client
+from src.modules.marketers.models import Marketer
+from src.modules.rates.models import RateType
+from src.modules.users.models import User
+
+
+class DummyRateTypeFilter(Filter):
+    order_by: List[str] = ["-energy_type"]
+
+    class Constants(Filter.Constants):
+        model = RateType
+
+
+@pytest.fixture
+def large_tables(mocker):
+    mocker.patch.object(ordering.settings, "UNINDEXED_ORDERING_ROWS", 1_000)
+    mocker.patch.object(ordering.settings, "UNINDEXED_ORDERING_FAIL", True)
+    mocker.patch.object(ordering, "get_table_rows", return_value=1_000_000)
+
+
+@pytest.mark.parametrize(
+    "field,indexed",
+    [
+        (RateType.id, True),
+        (RateType.name, True),
+        (RateType.energy_type, False),
+        (Marketer.create_at, True),
+        (Client.fiscal_name, True),
+        (Client.alias, False),
+        (aliased(User).id, False),
+        (RateType.user, False),
+    ],
+)
+def test_is_ordering_indexed(field, indexed: bool):
+    assert is_ordering_indexed([(field, True), (RateType.id, True)]) is indexed
+
+
+def test_check_ordering_unindexed_refuse(large_tables):
+    with pytest.raises(UnindexedOrdering):
+        check_ordering(RateType, [(RateType.energy_type, False)], "energy_type", True)
+
+
+def test_check_ordering_unindexed_warning(large_tables, caplog):
+    with caplog.at_level(logging.WARNING):
+        check_ordering(RateType, [(RateType.energy_type, False)], "energy_type", False)
+
+    assert "Ordering by energy_type is not backed by an index" in caplog.text
+
+
+def test_check_ordering_small_table(large_tables, mocker):
+    mocker.patch.object(ordering, "get_table_rows", return_value=10)
+
+    check_ordering(RateType, [(RateType.energy_type, False)], "energy_type", True)
+
+
+def test_check_ordering_indexed(large_tables):
+    check_ordering(RateType, [(RateType.name, False)], "name", True)
+
+    ordering.get_table_rows.assert_not_called()
+
+
+def test_filter_unindexed_ordering_error(large_tables):
+    with pytest.raises(ValidationError) as exc:
+        DummyRateTypeFilter(order_by="energy_type")
+
+    assert exc.value.errors()[0]["msg"] == "energy_type is not an indexed ordering."
+
+
+def test_filter_unindexed_default_ordering(large_tables):
+    DummyRateTypeFilter(order_by="-energy_type")
+
+
+def test_get_indexed_ordering_fields():
+    assert set(DummyRateTypeFilter.get_indexed_ordering_fields()) == {"id", "name"}
+
+
+def test_get_table_rows(mocker):
+    mocker.patch.object(ordering, "table_rows", {"rate_type": 42})
+
+    assert ordering.get_table_rows(RateType.__table__) == 42
+    assert ordering.get_table_rows(Client.__table__) == 0
+
+
+def test_filter_ordering_validation_without_queries(mocker):
+    mocker.patch.object(ordering.settings, "UNINDEXED_ORDERING_ROWS", 1_000)
+    connect = mocker.patch.object(ordering.engine, "connect")
+
+    DummyRateTypeFilter(order_by="energy_type")
+
+    connect.assert_not_called()
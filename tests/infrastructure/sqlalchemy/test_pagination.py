@@ -0,0 +1,101 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Query, Session
+
+from src.infrastructure.sqlalchemy.filters import FilterDepends
+from src.infrastructure.sqlalchemy.pagination import (
+    Explain,
+    get_primary_key,
+    page_ids_query,
+)
+from src.modules.commissions.models import Commission
+from src.modules.commissions.schemas import CommissionFilter
+from src.modules.rates.models import Rate
+from src.services.commissions import list_commissions
+
+
+def compile_sql(statement) -> str:
+    return " ".join(
+        str(
+            statement.compile(
+                dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+            )
+        ).split()
+    )
+
+
+def test_get_primary_key():
+    qs = Query(Commission).join(Commission.rates)
+
+    assert get_primary_key(qs) is Commission.__table__.c.id
+
+
+def test_explain():
+    qs = Query(Commission.id).filter(Commission.name == "Commission name")
+
+    assert compile_sql(Explain(qs.statement)) == (
+        "EXPLAIN (FORMAT JSON) SELECT commission.id FROM commission "
+        "WHERE commission.name = 'Commission name'"
+    )
+
+
+def test_page_ids_query():
+    qs = (
+        Query(Commission)
+        .join(Commission.rates)
+        .filter(Rate.name == "Rate name")
+        .order_by(Commission.name.desc())
+    )
+
+    ids_query = page_ids_query(
+        qs, [(Commission.name, True), (Commission.id, True)], 10, 20
+    )
+
+    assert compile_sql(ids_query.statement) == (
+        "SELECT commission.id FROM commission "
+        "JOIN commissions_rates AS commissions_rates_1 "
+        "ON commission.id = commissions_rates_1.commission_id "
+        "JOIN rate ON rate.id = commissions_rates_1.rate_id "
+        "WHERE rate.name = 'Rate name' GROUP BY commission.id "
+        "ORDER BY max(commission.name) DESC, max(commission.id) DESC "
+        "LIMIT 10 OFFSET 20"
+    )
+
+
+def test_page_ids_query_related_ordering():
+    commission_filter = CommissionFilter(order_by=["rate_type__name"])
+    qs = commission_filter.sort(commission_filter.filter(Query(Commission)))
+
+    ids_query = page_ids_query(qs, commission_filter.get_ordering(), 10, 0)
+
+    assert compile_sql(ids_query.statement) == (
+        "SELECT commission.id FROM commission "
+        "LEFT OUTER JOIN rate_type AS rate_type_1 "
+        "ON rate_type_1.id = commission.rate_type_id GROUP BY commission.id "
+        "ORDER BY min(rate_type_1.name) ASC, min(commission.id) ASC "
+        "LIMIT 10 OFFSET 0"
+    )
+
+
+def test_page_ids_query_filter_depends():
+    app = FastAPI()
+
+    @app.get("/commissions")
+    def commissions(
+        commission_filter: CommissionFilter = FilterDepends(CommissionFilter),
+    ) -> str:
+        qs = list_commissions(Session(), commission_filter)
+        return compile_sql(
+            page_ids_query(qs, commission_filter.get_ordering(), 10, 0).statement
+        )
+
+    response = TestClient(app).get(
+        "/commissions", params={"order_by": "rate_type__name"}
+    )
+
+    assert response.json().endswith(
+        "GROUP BY commission.id "
+        "ORDER BY min(rate_type_1.name) ASC, min(commission.id) ASC "
+        "LIMIT 10 OFFSET 0"
+    )
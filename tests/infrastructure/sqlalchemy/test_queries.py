@@ -0,0 +1,89 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from src.infrastructure.sqlalchemy.queries import count_queries, start_query_stats
+from utils.middleware import add_middlewares
+
+sqlite_engine = create_engine("sqlite://")
+
+
+def execute_queries(count: int) -> None:
+    with sqlite_engine.connect() as connection:
+        for _ in range(count):
+            connection.execute(text("SELECT 1"))
+
+
+def create_app() -> FastAPI:
+    app = FastAPI()
+    add_middlewares(app)
+
+    @app.get("/items/{item_id}")
+    def item_detail(item_id: int):
+        execute_queries(item_id)
+        return {"id": item_id}
+
+    @app.post("/items/{item_id}")
+    def item_update(item_id: int):
+        execute_queries(item_id)
+        return {"id": item_id}
+
+    return app
+
+
+def test_count_queries():
+    with count_queries() as stats:
+        execute_queries(2)
+
+    assert stats.count == 2
+    assert stats.duration > 0
+
+
+def test_query_stats_of_context():
+    stats = start_query_stats()
+
+    execute_queries(3)
+
+    assert stats.count == 3
+
+
+def test_query_stats_headers(mocker):
+    mocker.patch("utils.middleware.settings.QUERY_STATS_HEADERS", True)
+
+    response = TestClient(create_app()).get("/items/2")
+
+    assert response.headers["X-DB-Query-Count"] == "2"
+    assert float(response.headers["X-DB-Query-Time"]) >= 0
+
+
+def test_query_budget_exceeded_logged(mocker):
+    mocker.patch("utils.middleware.settings.QUERY_BUDGETS", {"GET /items/{item_id}": 1})
+    logger_mock = mocker.patch("utils.middleware.logger")
+
+    response = TestClient(create_app()).get("/items/2")
+
+    assert response.status_code == 200
+    logger_mock.warning.assert_called_once()
+    assert logger_mock.warning.call_args.args[1] == "GET /items/{item_id}"
+
+
+def test_query_budget_exceeded_fail(mocker):
+    mocker.patch("utils.middleware.settings.QUERY_BUDGET_DEFAULT", 1)
+    mocker.patch("utils.middleware.settings.QUERY_BUDGET_FAIL", True)
+    client = TestClient(create_app())
+
+    assert client.get("/items/1").status_code == 200
+    response = client.get("/items/2")
+    assert response.status_code == 500
+    assert response.json()["detail"][0]["code"] == "QUERY_BUDGET_EXCEEDED"
+
+
+def test_query_budget_exceeded_fail_write_logged(mocker):
+    mocker.patch("utils.middleware.settings.QUERY_BUDGET_DEFAULT", 1)
+    mocker.patch("utils.middleware.settings.QUERY_BUDGET_FAIL", True)
+    logger_mock = mocker.patch("utils.middleware.logger")
+
+    response = TestClient(create_app()).post("/items/2")
+
+    assert response.status_code == 200
+    logger_mock.warning.assert_called_once()
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+from src.infrastructure.sqlalchemy import replica
+from src.infrastructure.sqlalchemy.database import RoutingSession, engine
+
+
+def test_routing_session_reads_from_replica():
+    replica_engine = MagicMock()
+    session = RoutingSession(bind=engine)
+    assert session.get_bind() is engine
+
+    session.replica_bind = replica_engine
+
+    assert session.get_bind() is replica_engine
+
+
+def test_routing_session_flushes_to_primary():
+    session = RoutingSession(bind=engine)
+    session.replica_bind = MagicMock()
+    session._flushing = True
+
+    assert session.get_bind() is engine
+
+
+def test_use_replica(mocker):
+    replica_engine = mocker.patch.object(replica, "replica_engine", MagicMock())
+    session = RoutingSession(bind=engine)
+
+    assert replica.use_replica(session, 1).replica_bind is replica_engine
+
+
+def test_use_replica_recent_writer(mocker):
+    mocker.patch.object(replica, "replica_engine", MagicMock())
+    replica.recent_writers.clear()
+    session = RoutingSession(bind=engine)
+    replica.set_session_user(session, 1)
+    session.info["has_writes"] = True
+
+    replica.receive_after_commit(session)
+
+    assert replica.is_recent_writer(1)
+    assert replica.use_replica(RoutingSession(bind=engine), 1).replica_bind is None
+    assert replica.use_replica(RoutingSession(bind=engine), 2).replica_bind
+
+
+def test_read_only_session_is_not_a_writer():
+    replica.recent_writers.clear()
+    session = RoutingSession(bind=engine)
+    replica.set_session_user(session, 1)
+
+    replica.receive_after_commit(session)
+
+    assert not replica.is_recent_writer(1)
@@ -0,0 +1,175 @@
+from datetime import datetime
+
+import pytest
+
+from src.infrastructure.cache import catalogs, tokens
+from src.infrastructure.cache.catalogs import CatalogCache
+from src.infrastructure.cache.memory import TTLCache
+from src.modules.rates.models import EnergyType, RateType
+
+RATE_TYPE_ROW = (
+    1,
+    "Rate type",
+    EnergyType.electricity,
+    None,
+    None,
+    True,
+    False,
+    datetime(2023, 1, 1),
+    1,
+)
+
+
+def test_ttl_cache_get_set():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_ttl_cache_expired_entry(mocker):
+    time_mock = mocker.patch("src.infrastructure.cache.memory.time")
+    time_mock.monotonic.return_value = 100
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+
+    time_mock.monotonic.return_value = 161
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_disabled():
+    cache = TTLCache(max_size=0, ttl=60)
+    cache.set("a", 1)
+
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_delete_where():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set("a", {"id": 1})
+    cache.set("b", {"id": 2})
+
+    cache.delete_where(lambda value: value["id"] == 1)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == {"id": 2}
+
+
+def test_invalidate_users(mocker):
+    mocker.patch.object(tokens.settings, "TOKEN_CACHE_BROADCAST", True)
+    publish_mock = mocker.patch.object(tokens.broadcast, "publish")
+    tokens.token_cache.set("token-1", {"id": 1})
+    tokens.token_cache.set("token-2", {"id": 2})
+
+    tokens.invalidate_users(1)
+
+    assert tokens.token_cache.get("token-1") is None
+    assert tokens.token_cache.get("token-2") == {"id": 2}
+    publish_mock.assert_called_once_with("1")
+    tokens.token_cache.clear()
+
+
+def test_listen_invalidations(mocker):
+    listen_mock = mocker.patch.object(tokens.broadcast, "listen")
+    tokens.token_cache.set("token-3", {"id": 3})
+
+    tokens.listen_invalidations()
+    callback = listen_mock.call_args.args[0]
+    callback("3,4")
+
+    assert tokens.token_cache.get("token-3") is None
+
+
+def get_db_mock(mocker, row):
+    db = mocker.MagicMock()
+    db.query.return_value.filter.return_value.first.return_value = row
+    return db
+
+
+def test_catalog_cache_get(mocker):
+    cache = CatalogCache(RateType, 10, 60)
+    db = get_db_mock(mocker, RATE_TYPE_ROW)
+
+    rate_type = cache.get(db, 1, RateType.id == 1)
+
+    assert cache.get(db, 1, RateType.id == 1) is rate_type
+    assert rate_type.id == 1
+    assert rate_type.energy_type == EnergyType.electricity
+    assert db.query.call_count == 1
+
+
+def test_catalog_cache_get_immutable(mocker):
+    cache = CatalogCache(RateType, 10, 60)
+
+    rate_type = cache.get(get_db_mock(mocker, RATE_TYPE_ROW), 1, RateType.id == 1)
+
+    with pytest.raises(AttributeError):
+        rate_type.name = "Other rate type"
+
+
+def test_catalog_cache_get_not_found(mocker):
+    cache = CatalogCache(RateType, 10, 60)
+    db = get_db_mock(mocker, None)
+
+    assert cache.get(db, 1, RateType.id == 1) is None
+    assert cache.get(db, 1, RateType.id == 1) is None
+    assert db.query.call_count == 2
+
+
+def test_catalog_cache_invalidated_while_loading(mocker):
+    cache = CatalogCache(RateType, 10, 60)
+    db = mocker.MagicMock()
+
+    def first():
+        # A write is committed and invalidates the cache meanwhile
+        cache.invalidate()
+        return RATE_TYPE_ROW
+
+    db.query.return_value.filter.return_value.first.side_effect = first
+
+    assert cache.get(db, 1, RateType.id == 1).id == 1
+    assert cache.get(db, 1, RateType.id == 1).id == 1
+    assert db.query.call_count == 2
+
+
+def test_catalog_cache_invalidate(mocker):
+    mocker.patch.object(catalogs.settings, "CATALOG_CACHE_BROADCAST", True)
+    publish_mock = mocker.patch.object(catalogs.broadcast, "publish")
+    cache = CatalogCache(RateType, 10, 60)
+    db = get_db_mock(mocker, RATE_TYPE_ROW)
+    cache.get(db, 1, RateType.id == 1)
+
+    cache.invalidate()
+    cache.get(db, 1, RateType.id == 1)
+
+    assert db.query.call_count == 2
+    assert cache.version == 1
+    publish_mock.assert_called_once_with("rate_type")
+
+
+def test_listen_catalog_invalidations(mocker):
+    listen_mock = mocker.patch.object(catalogs.broadcast, "listen")
+    version = catalogs.marketer_cache.version
+
+    catalogs.listen_invalidations()
+    callback = listen_mock.call_args.args[0]
+    callback("marketer")
+    callback("unknown")
+
+    assert catalogs.marketer_cache.version == version + 1
@@ -0,0 +1,107 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+from src.infrastructure.compression import CompressionMiddleware, get_accepted_encodings
+
+ROWS = [f"{index};name {index};{index * 10}\n" for index in range(1000)]
+
+
+def create_app(**options) -> FastAPI:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/items")
+    def item_list(size: int = 100):
+        return [{"id": index, "name": f"name {index}"} for index in range(size)]
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse("text " * 1000)
+
+    @app.get("/export")
+    def export():
+        return StreamingResponse(iter(ROWS), media_type="text/csv")
+
+    return app
+
+
+def get(app: FastAPI, path: str, accept_encoding: str = "gzip"):
+    return TestClient(app).get(path, headers={"Accept-Encoding": accept_encoding})
+
+
+def test_get_accepted_encodings():
+    assert get_accepted_encodings("gzip, deflate, br;q=0.5") == {
+        "gzip",
+        "deflate",
+        "br",
+    }
+    assert get_accepted_encodings("gzip;q=0, br") == {"br"}
+    assert get_accepted_encodings("") == set()
+
+
+def test_compression_gzip():
+    response = get(create_app(), "/items")
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["Vary"] == "Accept-Encoding"
+    assert int(response.headers["Content-Length"]) < len(response.content)
+    assert len(response.json()) == 100
+
+
+def test_compression_minimum_size():
+    response = get(create_app(minimum_size=1024), "/items?size=2")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.json() == [{"id": 0, "name": "name 0"}, {"id": 1, "name": "name 1"}]
+
+
+def test_compression_content_type_not_allowed():
+    response = get(create_app(content_types=["application/json"]), "/text")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.text == "text " * 1000
+
+
+def test_compression_not_accepted():
+    response = get(create_app(), "/items", accept_encoding="identity")
+
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept-Encoding"
+
+
+def test_compression_brotli_not_installed(mocker):
+    mocker.patch("src.infrastructure.compression.brotli", None)
+
+    response = get(create_app(brotli_quality=4), "/items", accept_encoding="br, gzip")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+
+
+def test_compression_streaming():
+    client = TestClient(create_app())
+
+    with client.stream(
+        "GET", "/export", headers={"Accept-Encoding": "gzip"}
+    ) as response:
+        chunks = list(response.iter_raw())
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Content-Length" not in response.headers
+    assert gzip.decompress(b"".join(chunks)).decode() == "".join(ROWS)
+
+
+def test_compression_weak_etag():
+    app = create_app(content_types=["text/plain"])
+
+    @app.get("/file")
+    def file():
+        return PlainTextResponse("text " * 1000, headers={"ETag": '"abc"'})
+
+    response = get(app, "/file")
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.headers["ETag"] == 'W/"abc"'
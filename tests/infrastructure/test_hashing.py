@@ -0,0 +1,76 @@
+import threading
+import time
+
+import pytest
+
+from src.infrastructure import hashing
+from src.infrastructure.hashing import (
+    HashingExecutor,
+    HashingOverloaded,
+    hash_password,
+    verify_password,
+)
+
+
+def test_hashing_executor_process_pool():
+    executor = HashingExecutor(workers=1, max_pending=4, timeout=10, name="test")
+    try:
+        hashed_password = executor.run(hash_password, "Fakepassword1234", b"saltsalt")
+
+        assert executor.run(verify_password, "Fakepassword1234", hashed_password)
+        assert not executor.run(verify_password, "Another1234", hashed_password)
+        assert executor.pending == 0
+        assert hashing.latency.count(executor="test") == 3
+    finally:
+        executor.shutdown()
+
+
+def test_hashing_executor_admission_control():
+    executor = HashingExecutor(workers=0, max_pending=1, timeout=10, name="test_full")
+    started, release = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        release.wait(5)
+
+    thread = threading.Thread(target=executor.run, args=(slow_hash,))
+    thread.start()
+    started.wait(5)
+
+    with pytest.raises(HashingOverloaded):
+        executor.run(hash_password, "Fakepassword1234", b"saltsalt")
+    release.set()
+    thread.join()
+
+    assert hashing.rejected.get(executor="test_full") == 1
+    assert executor.pending == 0
+
+
+def test_hashing_executor_timeout():
+    executor = HashingExecutor(workers=1, max_pending=4, timeout=0.01, name="test_slow")
+    try:
+        with pytest.raises(HashingOverloaded):
+            executor.run(time.sleep, 1)
+    finally:
+        executor.shutdown()
+
+    assert executor.pending == 0
+
+
+def test_hashing_executor_timeout_keeps_slot():
+    executor = HashingExecutor(workers=1, max_pending=1, timeout=0.01, name="test_slot")
+    try:
+        with pytest.raises(HashingOverloaded):
+            executor.run(time.sleep, 0.5)
+
+        # Still hashing in the worker, no other call is admitted meanwhile
+        assert executor.pending == 1
+        with pytest.raises(HashingOverloaded):
+            executor.run(time.sleep, 0)
+
+        deadline = time.monotonic() + 5
+        while executor.pending and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert executor.pending == 0
+    finally:
+        executor.shutdown()
@@ -0,0 +1,49 @@
+from unittest.mock import MagicMock
+
+import pytest
+from sqlalchemy import exc
+
+from src.infrastructure.metrics import Registry
+from src.infrastructure.sqlalchemy import pool
+
+
+def test_registry_render():
+    registry = Registry()
+    counter = registry.counter("requests_total", "Requests.")
+    histogram = registry.histogram("latency_seconds", "Latency.", buckets=(0.1, 1))
+    registry.gauge("size", "Size.", lambda: {(("pool", "a"),): 3})
+    counter.inc(route="/a")
+    counter.inc(2, route="/a")
+    histogram.observe(0.1)
+    histogram.observe(5)
+
+    assert registry.render().splitlines() == [
+        "# HELP requests_total Requests.",
+        "# TYPE requests_total counter",
+        'requests_total{route="/a"} 3',
+        "# HELP latency_seconds Latency.",
+        "# TYPE latency_seconds histogram",
+        'latency_seconds_bucket{le="0.1"} 1',
+        'latency_seconds_bucket{le="1"} 1',
+        'latency_seconds_bucket{le="+Inf"} 2',
+        "latency_seconds_sum 5.1",
+        "latency_seconds_count 2",
+        "# HELP size Size.",
+        "# TYPE size gauge",
+        'size{pool="a"} 3',
+    ]
+
+
+def test_instrumented_pool_timeout():
+    queue_pool = pool.InstrumentedQueuePool(
+        MagicMock, pool_size=1, max_overflow=0, timeout=0.01
+    )
+    queue_pool.metrics_name = "test"
+    connection = queue_pool.connect()
+
+    with pytest.raises(exc.TimeoutError):
+        queue_pool.connect()
+    connection.close()
+
+    assert pool.timeouts.get(pool="test") == 1
+    assert pool.wait_time.count(pool="test") == 2
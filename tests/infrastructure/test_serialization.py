@@ -0,0 +1,61 @@
+import datetime
+import json
+from decimal import Decimal
+
+from fastapi.encoders import jsonable_encoder
+
+from src.infrastructure.serialization import ORJSONResponse, get_serializer
+from src.modules.marketers.models import Marketer
+from src.modules.rates.models import ClientType, EnergyType, PriceType, Rate, RateType
+from src.modules.rates.schemas import RateUpdateDetailListResponse
+
+
+def get_rate() -> Rate:
+    return Rate(
+        id=1,
+        name="Electricity rate",
+        price_type=PriceType.fixed_fixed,
+        client_types=[ClientType.particular, ClientType.company],
+        rate_type=RateType(id=2, name="Rate type", energy_type=EnergyType.electricity),
+        marketer=Marketer(id=3, name="Marketer"),
+        min_power=Decimal("10.50"),
+        energy_price_1=Decimal("17.190000"),
+        permanency=True,
+        length=12,
+        is_active=True,
+        create_at=datetime.datetime(2022, 1, 1, 16, 30),
+    )
+
+
+def test_get_serializer_cached():
+    assert get_serializer(RateUpdateDetailListResponse) is get_serializer(
+        RateUpdateDetailListResponse
+    )
+
+
+def test_serializer_decimal_as_string():
+    response = ORJSONResponse(get_serializer(RateUpdateDetailListResponse)(get_rate()))
+
+    data = json.loads(response.body)
+    assert data["min_power"] == "10.50"
+    assert data["energy_price_1"] == "17.190000"
+    assert data["max_power"] is None
+
+
+def test_serializer_same_as_pydantic():
+    rate = get_rate()
+
+    data = json.loads(
+        ORJSONResponse(get_serializer(RateUpdateDetailListResponse)(rate)).body
+    )
+
+    expected = jsonable_encoder(RateUpdateDetailListResponse.from_orm(rate))
+    expected["min_power"] = "10.50"
+    expected["energy_price_1"] = "17.190000"
+    assert data == expected
+    assert data["rate_type"] == {
+        "id": 2,
+        "name": "Rate type",
+        "energy_type": "electricity",
+    }
+    assert data["create_at"] == "2022-01-01T16:30:00"
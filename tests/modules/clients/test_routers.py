@@ -345,3 +345,17 @@ def test_clients_delete_clients_endpoint_ok(
 
     assert response.status_code == 200
     assert db_session.query(Client).count() == 0
+
+
+def test_client_cursor_list_endpoint_ok(
+    test_client: TestClient, token_create: Token, db_session: Session, client: Client
+):
+    response = test_client.get(
+        "/api/clients/cursor?size=1&order_by=-id",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert [item["id"] for item in response_data["items"]] == [1]
+    assert response_data["next_page"]
@@ -423,6 +423,46 @@ def test_commission_list_endpoint_several_rates_ok(
     assert len(response_data["items"]) == 2
 
 
+def test_commission_list_endpoint_order_by_rate_type_name_ok(
+    test_client: TestClient,
+    token_create: Token,
+    commission: Commission,
+    commission_fixed_base: Commission,
+):
+    response = test_client.get(
+        "/api/commissions?order_by=rate_type__name",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["total"] == 2
+    assert [item["id"] for item in response_data["items"]] == [1, 2]
+
+
+def test_commission_list_endpoint_order_by_rates_name_ok(
+    db_session: Session,
+    test_client: TestClient,
+    token_create: Token,
+    commission: Commission,
+    commission_fixed_base: Commission,
+    electricity_rate_2: Rate,
+):
+    commission.rates.append(electricity_rate_2)
+    db_session.add(commission)
+    db_session.commit()
+
+    response = test_client.get(
+        "/api/commissions?order_by=-rates__name&size=1",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["total"] == 2
+    assert [item["id"] for item in response_data["items"]] == [2]
+
+
 def test_commission_list_endpoint_filter_rate_type_energy_type_ok(
     db_session: Session,
     test_client: TestClient,
@@ -7,3 +7,22 @@ def test_read_main(test_client: TestClient):
     response_data = response.json()
     assert response_data["status"] == "OK"
     assert response_data["timestamp"]
+
+
+def test_metrics(test_client: TestClient, mocker):
+    mocker.patch("src.modules.healthcheck.routers.settings.METRICS_ENABLED", True)
+    test_client.get("/__status__/")
+
+    response = test_client.get("/__status__/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'db_pool_checked_out{pool="primary"}' in response.text
+
+
+def test_metrics_disabled(test_client: TestClient, mocker):
+    mocker.patch("src.modules.healthcheck.routers.settings.METRICS_ENABLED", False)
+
+    response = test_client.get("/__status__/metrics")
+
+    assert response.status_code == 404
@@ -135,6 +135,48 @@ def test_rate_type_list_endpoint_ok(
     assert response_data["size"] == 50
 
 
+def test_rate_type_list_endpoint_not_modified(
+    test_client: TestClient,
+    token_create: Token,
+    db_session: Session,
+    gas_rate_type: RateType,
+):
+    headers = {"Authorization": f"token {token_create.token}"}
+    response = test_client.get("/api/rate-types", headers=headers)
+
+    assert response.status_code == 200
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+
+    response = test_client.get(
+        "/api/rate-types", headers={**headers, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+
+def test_rate_type_list_endpoint_modified(
+    test_client: TestClient,
+    token_create: Token,
+    db_session: Session,
+    gas_rate_type: RateType,
+):
+    headers = {"Authorization": f"token {token_create.token}"}
+    etag = test_client.get("/api/rate-types", headers=headers).headers["ETag"]
+    gas_rate_type.name = "Modified gas rate type"
+    db_session.commit()
+
+    response = test_client.get(
+        "/api/rate-types", headers={**headers, "If-None-Match": etag}
+    )
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.json()["items"][0]["name"] == "Modified gas rate type"
+
+
 def test_rate_type_partial_update_endpoint_ok(
     test_client: TestClient,
     electricity_rate_type: RateType,
@@ -1287,6 +1329,33 @@ def test_rate_list_endpoint_ok(
     assert response_data["items"][0]["create_at"]
 
 
+def test_rate_list_endpoint_fast_json_ok(
+    mocker,
+    test_client: TestClient,
+    token_create: Token,
+    db_session: Session,
+    electricity_rate: Rate,
+    gas_rate_deleted: Rate,
+):
+    mocker.patch("src.services.common.settings.FAST_JSON_RESPONSES", True)
+
+    response = test_client.get(
+        "/api/rates",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["total"] == 1
+    assert response_data["page"] == 1
+    assert response_data["size"] == 50
+    assert response_data["pages"] == 1
+    assert response_data["items"][0]["id"] == 1
+    assert response_data["items"][0]["client_types"] == ["particular"]
+    assert response_data["items"][0]["min_power"] == "10.50"
+    assert response_data["items"][0]["rate_type"]["id"] == electricity_rate.rate_type_id
+
+
 def test_rate_list_endpoint_sort_by_ok(
     test_client: TestClient,
     token_create: Token,
@@ -312,6 +312,24 @@ def test_saving_studies_list_endpoint_ok(
     assert len(response_data["items"]) == 1
 
 
+def test_saving_studies_cursor_list_endpoint_ok(
+    test_client: TestClient,
+    token_create: Token,
+    db_session: Session,
+    saving_study: SavingStudy,
+    deleted_saving_study: SavingStudy,
+):
+    response = test_client.get(
+        "/api/studies/cursor",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert [item["id"] for item in response_data["items"]] == [saving_study.id]
+    assert response_data["next_page"] is None
+
+
 def test_saving_studies_list_endpoint_invalid_token(
     test_client: TestClient,
     token_create: Token,
@@ -692,6 +710,29 @@ def test_suggested_rates_list_endpoint_ok(
     assert response_data["items"][0]["saving_absolute"] is None
 
 
+def test_suggested_rates_cursor_list_endpoint_ok(
+    test_client: TestClient,
+    token_create: Token,
+    db_session: Session,
+    saving_study: SavingStudy,
+    suggested_rates: List[SuggestedRate],
+):
+    headers = {"Authorization": f"token {token_create.token}"}
+    url = f"/api/studies/{saving_study.id}/suggested-rates/cursor"
+
+    ids, cursor = [], None
+    for _ in range(2):
+        params = {"size": 2, "order_by": "-id"}
+        if cursor:
+            params["cursor"] = cursor
+        response = test_client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        ids.extend(item["id"] for item in response.json()["items"])
+        cursor = response.json()["next_page"]
+
+    assert ids == [4, 3, 2, 1]
+
+
 @pytest.mark.parametrize(
     "query_params",
     [
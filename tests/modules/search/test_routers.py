@@ -0,0 +1,84 @@
+from sqlalchemy.orm import Session
+from starlette.testclient import TestClient
+
+from src.modules.clients.models import Client, InvoiceNotificationType
+from src.modules.contacts.models import Contact
+from src.modules.rates.models import ClientType
+from src.modules.users.models import Token, User
+
+
+def test_search_endpoint_ok(
+    test_client: TestClient, token_create: Token, client: Client, contact: Contact
+):
+    response = test_client.get(
+        "/api/search?q=fiscal",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    rank = results[0].pop("rank")
+    assert isinstance(rank, float) and rank > 0
+    assert results == [
+        {
+            "entity_type": "client",
+            "entity_id": client.id,
+            "title": "Fiscal name",
+            "subtitle": "123456789",
+        }
+    ]
+
+
+def test_search_endpoint_identifier_ranks_above_name(
+    db_session: Session,
+    test_client: TestClient,
+    token_create: Token,
+    user_create: User,
+    client: Client,
+):
+    name_match = Client(
+        id=2,
+        user_id=user_create.id,
+        alias="123456789",
+        client_type=ClientType.company,
+        fiscal_name="Other fiscal name",
+        cif="987654321",
+        invoice_notification_type=InvoiceNotificationType.email,
+        invoice_email="other@test.com",
+        bank_account_holder="Bank account holder",
+        bank_account_number="Bank account number",
+        fiscal_address="fiscal address",
+    )
+    db_session.add(name_match)
+    db_session.commit()
+
+    response = test_client.get(
+        "/api/search?q=123456789",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    results = response.json()
+    assert [result["entity_id"] for result in results] == [client.id, name_match.id]
+    assert results[0]["rank"] > results[1]["rank"]
+
+
+def test_search_endpoint_entity_type(
+    test_client: TestClient, token_create: Token, client: Client, contact: Contact
+):
+    response = test_client.get(
+        "/api/search?q=test@test.com&entity_type=contact",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    assert [result["entity_id"] for result in response.json()] == [contact.id]
+
+
+def test_search_endpoint_query_too_short(test_client: TestClient, token_create: Token):
+    response = test_client.get(
+        "/api/search?q=a",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 422
@@ -0,0 +1,15 @@
+from fastapi.testclient import TestClient
+
+from src.modules.users.models import Token
+
+
+def test_supply_point_cursor_list_endpoint_empty(
+    test_client: TestClient, token_create: Token
+):
+    response = test_client.get(
+        "/api/supply_points/cursor",
+        headers={"Authorization": f"token {token_create.token}"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [], "previous_page": None, "next_page": None}
@@ -527,6 +527,26 @@ def test_user_detail_endpoint_does_not_exists(
     assert response_data["detail"][0]["code"] == "NOT_EXIST"
 
 
+def test_list_users_endpoint_num_queries(
+    test_client: TestClient,
+    user_create: User,
+    user_create2: User,
+    user_create3: User,
+    token_create: Token,
+    assert_num_queries,
+):
+    # Token lookup, page count and page items, whatever the number of users
+    with assert_num_queries(3):
+        response = test_client.get(
+            "/api/users/",
+            headers={"Authorization": f"token {token_create.token}"},
+        )
+
+    assert response.status_code == 200
+    assert len(response.json()["items"]) == 2
+    assert response.headers["X-DB-Query-Count"] == "3"
+
+
 def test_list_users_endpoint_ok(
     test_client: TestClient,
     user_create: User,
@@ -584,6 +604,43 @@ def test_users_list_endpoint_filter_responsible_first_name_ok(
     assert response_data["items"][0]["responsible"]["first_name"] == "Johnathan"
 
 
+def test_users_list_endpoint_fields_ok(
+    test_client: TestClient,
+    token_superadmin: Token,
+    db_session: Session,
+    user_create: User,
+    user_create2: User,
+):
+    user_create.responsible = user_create2
+
+    response = test_client.get(
+        "/api/users?fields=id,first_name,responsible&order_by=id",
+        headers={"Authorization": f"token {token_superadmin.token}"},
+    )
+
+    assert response.status_code == 200
+    response_data = response.json()
+    assert response_data["total"] == 2
+    assert response_data["page"] == 1
+    assert response_data["items"][0] == {
+        "id": 1,
+        "first_name": "John",
+        "responsible": {"id": 2, "first_name": "Johnathan", "last_name": "Smith"},
+    }
+
+
+def test_users_list_endpoint_fields_not_valid(
+    test_client: TestClient, token_superadmin: Token
+):
+    response = test_client.get(
+        "/api/users?fields=id,hashed_password",
+        headers={"Authorization": f"token {token_superadmin.token}"},
+    )
+
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["code"] == "INVALID_FIELDS"
+
+
 def test_users_list_endpoint_filter_create_at_like_ok(
     test_client: TestClient,
     token_superadmin: Token,
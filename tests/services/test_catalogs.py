@@ -0,0 +1,112 @@
+from datetime import datetime
+from types import SimpleNamespace
+
+from fastapi import Request
+from sqlalchemy.orm import Session
+
+from src.infrastructure.sqlalchemy.catalogs import get_catalog_versions
+from src.modules.rates.models import Rate, RateType
+from src.services.catalogs import get_cache_headers, is_not_modified
+
+
+def get_request(**headers) -> Request:
+    return Request(
+        scope={
+            "type": "http",
+            "headers": [
+                (name.replace("_", "-").encode(), value.encode())
+                for name, value in headers.items()
+            ],
+        }
+    )
+
+
+def get_headers(db: Session):
+    return get_cache_headers(get_catalog_versions(db, ["rate", "rate_type"]))
+
+
+def test_get_cache_headers(db_session: Session, electricity_rate: Rate):
+    headers = get_headers(db_session)
+
+    assert headers["ETag"].startswith('W/"')
+    assert headers["Cache-Control"] == "private, no-cache"
+
+
+def test_get_cache_headers_last_modified():
+    versions = [
+        SimpleNamespace(name="rate", version=2, modified_at=datetime(2026, 1, 2, 3, 4)),
+        SimpleNamespace(name="rate_type", version=1, modified_at=datetime(2026, 1, 1)),
+    ]
+
+    headers = get_cache_headers(versions)
+
+    assert headers["Last-Modified"] == "Fri, 02 Jan 2026 03:04:00 GMT"
+
+
+def test_get_cache_headers_modified_this_second():
+    versions = [
+        SimpleNamespace(name="rate", version=2, modified_at=datetime.utcnow()),
+        SimpleNamespace(name="rate_type", version=1, modified_at=datetime(2026, 1, 1)),
+    ]
+
+    headers = get_cache_headers(versions)
+
+    assert "Last-Modified" not in headers
+    assert headers["ETag"]
+
+
+def test_get_cache_headers_version_changed(
+    db_session: Session, electricity_rate_type: RateType
+):
+    headers = get_headers(db_session)
+    electricity_rate_type.max_power = 30
+    db_session.commit()
+
+    assert get_headers(db_session)["ETag"] != headers["ETag"]
+
+
+def test_get_cache_headers_other_version_changed(
+    db_session: Session, electricity_rate_type: RateType
+):
+    headers = get_cache_headers(get_catalog_versions(db_session, ["marketer"]))
+    electricity_rate_type.max_power = 30
+    db_session.commit()
+
+    assert (
+        get_cache_headers(get_catalog_versions(db_session, ["marketer"]))["ETag"]
+        == headers["ETag"]
+    )
+
+
+def test_is_not_modified_etag():
+    headers = {"ETag": 'W/"abc"', "Last-Modified": "Fri, 02 Jan 2026 03:04:05 GMT"}
+
+    assert is_not_modified(get_request(if_none_match='W/"abc"'), headers)
+    assert is_not_modified(get_request(if_none_match='"xyz", "abc"'), headers)
+    assert is_not_modified(get_request(if_none_match="*"), headers)
+    assert not is_not_modified(get_request(if_none_match='W/"xyz"'), headers)
+    assert not is_not_modified(get_request(), headers)
+
+
+def test_is_not_modified_etag_before_date():
+    headers = {"ETag": 'W/"abc"', "Last-Modified": "Fri, 02 Jan 2026 03:04:05 GMT"}
+
+    request = get_request(
+        if_none_match='W/"xyz"', if_modified_since="Fri, 02 Jan 2026 03:04:05 GMT"
+    )
+
+    assert not is_not_modified(request, headers)
+
+
+def test_is_not_modified_date():
+    headers = {"ETag": 'W/"abc"', "Last-Modified": "Fri, 02 Jan 2026 03:04:05 GMT"}
+    now = datetime.utcnow().strftime("%a, %d %b %Y %H:%M:%S GMT")
+
+    assert is_not_modified(get_request(if_modified_since=now), headers)
+    assert is_not_modified(
+        get_request(if_modified_since="Fri, 02 Jan 2026 03:04:05 GMT"), headers
+    )
+    assert not is_not_modified(
+        get_request(if_modified_since="Fri, 02 Jan 2026 03:04:04 GMT"), headers
+    )
+    assert not is_not_modified(get_request(if_modified_since="yesterday"), headers)
@@ -1,15 +1,20 @@
 import pytest
 from fastapi import HTTPException
+from fastapi_pagination import Params
+from fastapi_pagination.ext.sqlalchemy import paginate
+from sqlalchemy.exc import MissingGreenlet
 from sqlalchemy.orm import Session
 
 from src.modules.clients.models import Client, InvoiceNotificationType
-from src.modules.clients.schemas import ClientCreateRequest
+from src.modules.clients.schemas import ClientCreateRequest, ClientFilter
 from src.modules.contacts.schemas import ContactInlineCreateRequest
 from src.modules.rates.models import ClientType
 from src.modules.users.models import User
 from src.services.clients import (  # create_update_client_address,
     client_create,
     get_client,
+    get_client_async,
+    list_client_async,
 )
 
 
@@ -87,6 +92,41 @@ def test_get_client_not_exist(db_session: Session, client: Client):
     assert exc.value.detail == "client_not_exist"
 
 
+@pytest.mark.asyncio
+async def test_get_client_async_ok(async_db_session, client: Client):
+    assert (await get_client_async(async_db_session, client.id)).id == client.id
+
+
+@pytest.mark.asyncio
+async def test_get_client_async_not_exist(async_db_session, client: Client):
+    with pytest.raises(HTTPException) as exc:
+        await get_client_async(async_db_session, 1234)
+
+    assert exc.value.detail == "client_not_exist"
+
+
+@pytest.mark.asyncio
+async def test_list_client_async(async_db_session, client: Client):
+    page = await paginate(
+        async_db_session,
+        list_client_async(ClientFilter(is_active=True)),
+        Params(page=1, size=10),
+    )
+
+    assert page.total == 1
+    assert [item.id for item in page.items] == [client.id]
+    assert page.items[0].user.id == client.user_id
+
+
+@pytest.mark.asyncio
+async def test_get_client_async_lazy_load_raises(async_db_session, client: Client):
+    client_async = await get_client_async(async_db_session, client.id)
+
+    # Not eager loaded, asyncpg can't load it lazily
+    with pytest.raises(MissingGreenlet):
+        client_async.user
+
+
 #
 #
 # def test_get_client_deleted(db_session: Session, client_deleted: Client):
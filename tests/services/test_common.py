@@ -1,20 +1,32 @@
+import json
+import threading
+from types import SimpleNamespace
+
 import pytest
 from fastapi import HTTPException, Request
 from fastapi_pagination import Params
+from fastapi_pagination.cursor import CursorParams
+from pydantic import BaseModel
 from sqlalchemy import false
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 
 from src.infrastructure.sqlalchemy.commissions import get_commission_queryset
 from src.modules.commissions.models import Commission
 from src.modules.commissions.schemas import CommissionFilter, commission_export_headers
 from src.modules.rates.models import Rate
 from src.modules.rates.schemas import rate_export_headers
+from src.modules.users.models import User
+from src.modules.users.schemas import UserFilter
 from src.services.common import (
-    generate_csv_file,
+    create_page_response,
+    csv_response,
     get_current_user,
+    paginate_keyset,
     paginate_queryset_with_n_to_many,
+    stream_csv,
     update_from_dict,
 )
+from src.services.users import logout_user
 
 
 @pytest.mark.asyncio
@@ -50,6 +62,53 @@ async def test_get_current_user_error_token_not_exists(db_session, token_create)
     assert exc.value.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_get_current_user_cached(db_session, token_create, mocker):
+    request = Request(scope={"type": "http"})
+    request._headers = {"Authorization": f"token {token_create.token}"}
+    await get_current_user(request, db_session)
+    get_user_by_mock = mocker.patch("src.services.common.get_user_by")
+
+    user = await get_current_user(request, db_session)
+
+    assert user == token_create.user
+    get_user_by_mock.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_query_out_of_event_loop(
+    db_session, token_create, mocker
+):
+    request = Request(scope={"type": "http"})
+    request._headers = {"Authorization": f"token {token_create.token}"}
+    query_threads = []
+
+    def get_user_by(*args):
+        query_threads.append(threading.get_ident())
+        return token_create.user
+
+    mocker.patch("src.services.common.get_user_by", side_effect=get_user_by)
+
+    user = await get_current_user(request, db_session)
+
+    assert user == token_create.user
+    assert query_threads != [threading.get_ident()]
+
+
+@pytest.mark.asyncio
+async def test_get_current_user_cache_invalidated_on_logout(db_session, token_create):
+    request = Request(scope={"type": "http"})
+    request._headers = {"Authorization": f"token {token_create.token}"}
+    user = await get_current_user(request, db_session)
+
+    logout_user(db_session, user)
+
+    with pytest.raises(HTTPException) as exc:
+        await get_current_user(request, db_session)
+
+    assert exc.value.detail == "invalid_credentials"
+
+
 def test_update_from_dict(user_create):
     user = update_from_dict(user_create, {"first_name": "Another name"})
 
@@ -65,55 +124,98 @@ def test_update_from_dict_key_not_in_fields(user_create):
     assert hasattr(user, "test_field")
 
 
-def test_generate_csv_file_ok(
+def test_stream_csv_ok(
+    db_session: Session,
+    commission: Commission,
+    commission_fixed_base: Commission,
+):
+    qs = db_session.query(Commission).order_by(Commission.id)
+
+    lines = "".join(stream_csv(commission_export_headers, qs)).split("\r\n")
+
+    assert lines[0] == (
+        "Id;Name;Range type;Minimum consumption;Maximum consumption;"
+        "Minimum power;Maximum power;Percentage Test commission;"
+        "Rate type segmentation;Test commission;Rates;Rate type;Date"
+    )
+    assert lines[1].startswith(
+        "1;Commission name;consumption;3.50;11.50;;;;True;12.00;"
+        "Electricity rate;Electricity rate type;"
+    )
+    assert lines[2].startswith("2;Commission fixed base;;;;;;12;;;Gas rate name;;")
+    assert lines[3] == ""
+
+
+def test_stream_csv_chunks(
     db_session: Session,
     electricity_rate: Rate,
     gas_rate: Rate,
+    mocker,
 ):
-    rates = db_session.query(Rate).order_by(Rate.id).all()
-    file_name = generate_csv_file("test_rates", rate_export_headers, rates)
-    with open(file_name, "r") as f:
-        assert f.readline() == (
-            "Name;Price type;Client types;Rate type;energy type;Minimum power;Maximum power;"
-            "Minimum consumption;Maximum consumption;Energy price 1;Energy price 2;"
-            "Energy price 3;Energy price 4;Energy price 5;Energy price 6;Power price 1;"
-            "Power price 2;Power price 3;Power price 4;Power price 5;Power price 6;"
-            "Fixed term price;Permanency;Length;Is full renewable;Compensation surplus;"
-            "Compensation surplus value;Status;Date\n"
-        )
-        assert f.readline().startswith(
-            "Electricity rate;fixed_fixed;particular;Electricity rate type;electricity;10.50;"
-            "23.39;12.50;23.39;17.190000;5.900000;87.730000;2.430000;12.230000;9.550000;19.170000;9.500000;"
-            "73.870000;43.200000;23.120000;55.900000;;True;12;True;True;28.320000;True;"
-        )
-        assert f.readline().startswith(
-            "Gas rate name;fixed_base;particular;Gas rate type;gas;;;;;17.190000;;;;;;;;;;;;;"
-            "False;24;;;;True;"
-        )
+    mocker.patch("src.services.common.settings.EXPORT_YIELD_PER", 1)
+    mocker.patch("src.services.common.settings.EXPORT_CHUNK_SIZE", 1)
+    qs = db_session.query(Rate).order_by(Rate.id)
+
+    chunks = list(stream_csv(rate_export_headers, qs))
+
+    # A chunk per row, the headers are sent with the first one
+    assert len(chunks) == 2
+    assert chunks[0].startswith("Name;Price type;")
+    assert "\r\nElectricity rate;" in chunks[0]
+    assert chunks[1].startswith("Gas rate name;")
 
 
-def test_generate_csv_file_list_of_objects_ok(
+def test_stream_csv_rates_ok(
     db_session: Session,
-    commission: Commission,
-    commission_fixed_base: Commission,
+    electricity_rate: Rate,
+    gas_rate: Rate,
 ):
-    commissions = db_session.query(Commission).all()
-    filename = generate_csv_file(
-        "test_commissions", commission_export_headers, commissions
+    qs = db_session.query(Rate).order_by(Rate.id)
+
+    lines = "".join(stream_csv(rate_export_headers, qs)).split("\r\n")
+
+    assert lines[0] == (
+        "Name;Price type;Client types;Rate type;energy type;Minimum power;Maximum power;"
+        "Minimum consumption;Maximum consumption;Energy price 1;Energy price 2;"
+        "Energy price 3;Energy price 4;Energy price 5;Energy price 6;Power price 1;"
+        "Power price 2;Power price 3;Power price 4;Power price 5;Power price 6;"
+        "Fixed term price;Permanency;Length;Is full renewable;Compensation surplus;"
+        "Compensation surplus value;Status;Date"
+    )
+    assert lines[1].startswith(
+        "Electricity rate;fixed_fixed;particular;Electricity rate type;electricity;10.50;"
+        "23.39;12.50;23.39;17.190000;5.900000;87.730000;2.430000;12.230000;9.550000;19.170000;9.500000;"
+        "73.870000;43.200000;23.120000;55.900000;;True;12;True;True;28.320000;True;"
+    )
+    assert lines[2].startswith(
+        "Gas rate name;fixed_base;particular;Gas rate type;gas;;;;;17.190000;;;;;;;;;;;;;"
+        "False;24;;;;True;"
+    )
+
+
+def test_stream_csv_relationships_eager_loaded(
+    db_session: Session,
+    electricity_rate: Rate,
+    gas_rate: Rate,
+    assert_num_queries,
+):
+    # Not loaded yet, a lazy load would query the rate types
+    db_session.expunge_all()
+    qs = db_session.query(Rate).order_by(Rate.id)
+
+    with assert_num_queries(1):
+        list(stream_csv(rate_export_headers, qs))
+
+
+def test_csv_response(db_session: Session, electricity_rate: Rate):
+    response = csv_response(
+        "rates", rate_export_headers, db_session.query(Rate).order_by(Rate.id)
+    )
+
+    assert response.media_type == "text/csv"
+    assert response.headers["Content-Disposition"] == (
+        'attachment; filename="rates.csv"'
     )
-    with open(filename, "r") as f:
-        assert f.readline() == (
-            "Id;Name;Range type;Minimum consumption;Maximum consumption;"
-            "Minimum power;Maximum power;Percentage Test commission;"
-            "Rate type segmentation;Test commission;Rates;Rate type;Date\n"
-        )
-        assert f.readline().startswith(
-            "1;Commission name;consumption;3.50;11.50;;;;True;12.00;"
-            "Electricity rate;Electricity rate type;"
-        )
-        assert f.readline().startswith(
-            "2;Commission fixed base;;;;;;12;;;Gas rate name;;"
-        )
 
 
 def test_paginate_queryset_with_n_to_many_ok(
@@ -131,10 +233,117 @@ def test_paginate_queryset_with_n_to_many_ok(
     )
 
     paginated_result = paginate_queryset_with_n_to_many(
-        qs, params=Params(page=1, size=20)
+        qs, commission_filter.get_ordering(), params=Params(page=1, size=20)
     )
 
     assert len(qs.all()) == 2
     assert qs.count() == 2
     assert paginated_result.total == 2
     assert len(paginated_result.items) == 2
+
+
+def test_paginate_queryset_with_n_to_many_page(
+    db_session: Session,
+    commission: Commission,
+    commission_fixed_base: Commission,
+    electricity_rate_2: Rate,
+):
+    commission.rates.append(electricity_rate_2)
+    db_session.add(commission)
+
+    commission_filter = CommissionFilter(order_by=["id"])
+    qs = commission_filter.sort(
+        commission_filter.filter(
+            get_commission_queryset(db_session, None, Commission.is_deleted == false())
+        )
+    )
+
+    paginated_result = paginate_queryset_with_n_to_many(
+        qs,
+        commission_filter.get_ordering(),
+        Params(page=1, size=1),
+        selectinload(Commission.rates),
+    )
+
+    assert paginated_result.total == 2
+    assert paginated_result.items == [commission]
+
+
+def test_paginate_queryset_with_n_to_many_estimated_total(
+    mocker,
+    db_session: Session,
+    commission: Commission,
+):
+    mocker.patch("src.services.common.settings.PAGINATION_COUNT_ESTIMATE_THRESHOLD", 0)
+    estimate_count = mocker.patch(
+        "src.services.common.estimate_count", return_value=1_000_000
+    )
+    count_distinct = mocker.patch("src.services.common.count_distinct")
+
+    paginated_result = paginate_queryset_with_n_to_many(
+        get_commission_queryset(db_session, None),
+        [(Commission.id, False)],
+        Params(page=1, size=20),
+    )
+
+    assert paginated_result.total == 1_000_000
+    estimate_count.assert_called_once()
+    count_distinct.assert_not_called()
+
+
+class ItemResponse(BaseModel):
+    id: int
+    name: str
+
+    class Config:
+        orm_mode = True
+
+
+@pytest.mark.parametrize("fast_json_responses", [False, True])
+def test_create_page_response(mocker, fast_json_responses: bool):
+    mocker.patch(
+        "src.services.common.settings.FAST_JSON_RESPONSES", fast_json_responses
+    )
+    items = [SimpleNamespace(id=3, name="Item 3"), SimpleNamespace(id=4, name="Item 4")]
+
+    response = create_page_response(items, Params(page=2, size=2), 5, ItemResponse)
+
+    assert json.loads(response.body) == {
+        "items": [{"id": 3, "name": "Item 3"}, {"id": 4, "name": "Item 4"}],
+        "total": 5,
+        "page": 2,
+        "size": 2,
+        "pages": 3,
+    }
+
+
+def test_paginate_keyset_ok(
+    db_session: Session,
+    user_create: User,
+    user_create2: User,
+    user_create3: User,
+):
+    user_filter = UserFilter(order_by=["first_name"])
+    qs = user_filter.sort(db_session.query(User))
+
+    items, cursor = [], None
+    for _ in range(3):
+        page = paginate_keyset(qs, user_filter, CursorParams(cursor=cursor, size=1))
+        items.extend(page.items)
+        cursor = page.next_page
+    last_page = paginate_keyset(qs, user_filter, CursorParams(cursor=cursor, size=1))
+
+    assert items == db_session.query(User).order_by(User.first_name, User.id).all()
+    assert last_page.items == []
+    assert last_page.next_page is None
+
+
+def test_paginate_keyset_invalid_cursor(db_session: Session):
+    user_filter = UserFilter()
+
+    with pytest.raises(HTTPException) as exc:
+        paginate_keyset(
+            db_session.query(User), user_filter, CursorParams(cursor="Zm9v", size=1)
+        )
+
+    assert exc.value.detail == "invalid_cursor"
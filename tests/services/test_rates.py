@@ -6,6 +6,7 @@ from pydantic import ValidationError
 from sqlalchemy import false
 from sqlalchemy.orm import Session
 
+from src.infrastructure.sqlalchemy.queries import count_queries
 from src.modules.commissions.models import Commission
 from src.modules.costs.models import OtherCost
 from src.modules.margins.models import Margin
@@ -27,6 +28,7 @@ from src.services.rates import (
     get_rate,
     get_rate_type,
     get_rate_type_power_ranges,
+    get_rate_type_snapshot,
     get_validated_rates,
     list_rate_types,
     rate_create,
@@ -99,6 +101,41 @@ def test_rate_type_partial_update_ok(
     assert rate_type.is_deleted is True
 
 
+def test_get_rate_type_snapshot_cached(
+    db_session: Session, electricity_rate_type: RateType
+) -> None:
+    rate_type = get_rate_type_snapshot(db_session, 1)
+
+    with count_queries() as stats:
+        assert get_rate_type_snapshot(db_session, 1) is rate_type
+    assert stats.count == 0
+    assert rate_type.energy_type == "electricity"
+
+
+def test_get_rate_type_snapshot_invalidated(
+    db_session: Session, electricity_rate_type: RateType
+) -> None:
+    get_rate_type_snapshot(db_session, 1)
+
+    rate_type_partial_update(
+        db_session, 1, RateTypeUpdatePartialRequest(max_power=25.15, min_power=15.3)
+    )
+
+    assert get_rate_type_snapshot(db_session, 1).max_power == Decimal("25.15")
+
+
+def test_get_rate_type_snapshot_deleted(
+    db_session: Session, electricity_rate_type: RateType
+) -> None:
+    get_rate_type_snapshot(db_session, 1)
+
+    delete_rate_types(db_session, RateDeleteRequest(ids=[1]))
+
+    with pytest.raises(HTTPException) as exc:
+        get_rate_type_snapshot(db_session, 1)
+    assert exc.value.detail == "rate_type_not_exist"
+
+
 def test_rate_type_partial_update_gas_ok(
     db_session: Session, gas_rate_type: RateType
 ) -> None:
@@ -0,0 +1,47 @@
+from sqlalchemy.orm import Session
+
+from src.modules.clients.models import Client
+from src.modules.contacts.models import Contact
+from src.modules.saving_studies.models import SavingStudy
+from src.modules.search.models import SearchEntityType
+from src.services.search import build_tsquery, search
+
+
+def test_build_tsquery():
+    assert build_tsquery("José  test@test.com") == "'jose':* & 'test@test.com':*"
+
+
+def test_build_tsquery_operators():
+    assert build_tsquery("a' | b:* & !(c)") == "'a':* & 'b':* & 'c':*"
+
+
+def test_build_tsquery_empty():
+    assert build_tsquery(" '&| ") is None
+
+
+def test_search_by_phone(db_session: Session, contact: Contact):
+    results = search(db_session, "666 666", None, 20)
+
+    assert [(result.entity_type, result.entity_id) for result in results] == [
+        (SearchEntityType.contact, contact.id)
+    ]
+
+
+def test_search_by_entity_type(
+    db_session: Session, client: Client, saving_study: SavingStudy
+):
+    client.cif = "12345678A"
+    db_session.commit()
+
+    results = search(db_session, "12345678a", [SearchEntityType.saving_study], 20)
+
+    assert [(result.entity_type, result.entity_id) for result in results] == [
+        (SearchEntityType.saving_study, saving_study.id)
+    ]
+
+
+def test_search_deleted_saving_study(db_session: Session, saving_study: SavingStudy):
+    saving_study.is_deleted = True
+    db_session.commit()
+
+    assert search(db_session, "ES0021000000000000AA", None, 20) == []
@@ -6,6 +6,7 @@ from starlette.background import BackgroundTasks
 from starlette.exceptions import HTTPException
 
 from src.infrastructure.email.email_config import EmailMessageSchema
+from src.infrastructure.hashing import HashingOverloaded
 from src.modules.users.models import Token, User
 from src.modules.users.schemas import (
     ResetPasswordRequest,
@@ -46,6 +47,20 @@ def test_validate_password_false(hashed_password_example: str):
     assert not validate_password("Anotherfakepassword1234", hashed_password_example)
 
 
+def test_validate_password_overloaded(
+    mocker: MockFixture, hashed_password_example: str
+):
+    mocker.patch(
+        "src.services.users.hashing_executor.run", side_effect=HashingOverloaded()
+    )
+
+    with pytest.raises(HTTPException) as exc:
+        validate_password("Fakepassword1234", hashed_password_example)
+
+    assert exc.value.status_code == 503
+    assert exc.value.detail == "server_busy"
+
+
 def test_get_or_create_user_token(db_session: Session, user_create: User):
     token = get_or_create_user_token(db_session, user_create)
     assert token
@@ -0,0 +1,126 @@
+from datetime import datetime, timedelta
+
+from src.sips.cache import SIPSCache
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import SIPSTypes
+
+
+class DummyCache:
+    def __init__(self, records: dict):
+        self.records = records
+        self.stored = {}
+
+    def get(self, sips_type: SIPSTypes, cups: list) -> dict:
+        return {cup: self.records[cup] for cup in cups if cup in self.records}
+
+    def set(self, sips_type: SIPSTypes, records_by_cups: dict):
+        self.stored.update(records_by_cups)
+
+
+def test_reader_read_only_fetches_missing_cups(mocker):
+    request_mock = mocker.patch("src.sips.reader.requests")
+    request_mock.get.return_value.status_code = 200
+    request_mock.get.return_value.text = """cups,a\n2,fetched"""
+    cache = DummyCache({"1": [{"cups": "1", "a": "cached"}]})
+    reader = PsElectricityReader()
+    reader.set_credentials("a", "b")
+    reader.set_cache(cache)
+
+    result = reader.get(["1", "2", "3"])
+
+    assert request_mock.get.call_args.kwargs["params"] == {"cups": "2,3"}
+    assert result == {
+        "1": {"cups": "1", "a": "cached"},
+        "2": {"cups": "2", "a": "fetched"},
+    }
+    assert cache.stored == {"2": [{"cups": "2", "a": "fetched"}], "3": []}
+
+
+def test_reader_read_force_refresh(mocker):
+    request_mock = mocker.patch("src.sips.reader.requests")
+    request_mock.get.return_value.status_code = 200
+    request_mock.get.return_value.text = """cups,a\n1,fetched"""
+    cache = DummyCache({"1": [{"cups": "1", "a": "cached"}]})
+    reader = PsElectricityReader()
+    reader.set_credentials("a", "b")
+    reader.set_cache(cache)
+
+    result = reader.get(["1"], force_refresh=True)
+
+    assert result == {"1": {"cups": "1", "a": "fetched"}}
+    assert cache.stored == {"1": [{"cups": "1", "a": "fetched"}]}
+
+
+def test_reader_read_all_cached_does_not_fetch(mocker):
+    request_mock = mocker.patch("src.sips.reader.requests")
+    reader = PsElectricityReader()
+    reader.set_cache(DummyCache({"1": [{"cups": "1", "a": "cached"}]}))
+
+    result = reader.get(["1"])
+
+    assert result == {"1": {"cups": "1", "a": "cached"}}
+    request_mock.get.assert_not_called()
+
+
+def test_sips_cache_get_records_hit_ratio(mocker):
+    entry = mocker.Mock(
+        id=1, cups="1", records=[{"cups": "1"}], fetched_at=datetime.utcnow()
+    )
+    get_entries_mock = mocker.patch(
+        "src.sips.cache.get_sips_cache_entries", return_value=[entry]
+    )
+    increment_mock = mocker.patch("src.sips.cache.increment_sips_cache_hits")
+    mocker.patch.object(SIPSCache, "hits", 0)
+    mocker.patch.object(SIPSCache, "misses", 0)
+    cache = SIPSCache(db=None, ttl=60)
+
+    result = cache.get(SIPSTypes.PS_ELECTRICIDAD, ["1", "2"])
+
+    assert result == {"1": [{"cups": "1"}]}
+    assert get_entries_mock.call_args.args[3] <= datetime.utcnow()
+    increment_mock.assert_called_once_with([1])
+    assert SIPSCache.hits == 1
+    assert SIPSCache.misses == 1
+    assert SIPSCache.hit_ratio() == 0.5
+
+
+def test_sips_cache_get_empty_records_shorter_ttl(mocker):
+    now = datetime.utcnow()
+    entries = [
+        mocker.Mock(id=1, cups="1", records=[], fetched_at=now),
+        mocker.Mock(id=2, cups="2", records=[], fetched_at=now - timedelta(hours=2)),
+        mocker.Mock(
+            id=3, cups="3", records=[{"cups": "3"}], fetched_at=now - timedelta(hours=2)
+        ),
+    ]
+    mocker.patch("src.sips.cache.get_sips_cache_entries", return_value=entries)
+    increment_mock = mocker.patch("src.sips.cache.increment_sips_cache_hits")
+    mocker.patch("src.sips.cache.settings.SIPS_CACHE_EMPTY_TTL", 3600)
+    cache = SIPSCache(db=None, ttl=86400)
+
+    result = cache.get(SIPSTypes.PS_ELECTRICIDAD, ["1", "2", "3"])
+
+    assert result == {"1": [], "3": [{"cups": "3"}]}
+    increment_mock.assert_called_once_with([1, 3])
+
+
+def test_sips_cache_set_empty_does_not_write(mocker):
+    upsert_mock = mocker.patch("src.sips.cache.upsert_sips_cache_entries")
+    cache = SIPSCache(db=None, ttl=60)
+
+    cache.set(SIPSTypes.PS_ELECTRICIDAD, {})
+
+    upsert_mock.assert_not_called()
+
+
+def test_sips_cache_set_writes_on_its_own_connection(mocker):
+    engine_mock = mocker.patch("src.infrastructure.sqlalchemy.sips.engine")
+    db = mocker.Mock()
+    cache = SIPSCache(db=db, ttl=60)
+
+    cache.set(SIPSTypes.PS_ELECTRICIDAD, {"1": [{"cups": "1"}]})
+
+    connection = engine_mock.begin.return_value.__enter__.return_value
+    connection.execute.assert_called_once()
+    db.execute.assert_not_called()
+    db.commit.assert_not_called()
@@ -53,3 +53,33 @@ ES0022000007481662PW1P,2020-05-31,2020-06-16,003,66000,127000,5000,0,0,0,15000,2
     assert result.cups == "ES0022000007481662PW1P"
     assert result.start_date == date.fromisoformat("2020-05-31")
     assert result.end_date == date.fromisoformat("2020-06-16")
+
+
+def test_consumption_electricity_reader_get_monthly(mocker):
+    request_mock = mocker.patch("src.sips.reader.requests")
+    request_mock.get.return_value.status_code = 200
+    request_mock.get.return_value.text = (
+        "cups,fechaInicioMesConsumo,fechaFinMesConsumo,codigoTarifaATR,"
+        "consumoEnergiaActivaEnWhP1,consumoEnergiaActivaEnWhP2,consumoEnergiaActivaEnWhP3,"
+        "consumoEnergiaActivaEnWhP4,consumoEnergiaActivaEnWhP5,consumoEnergiaActivaEnWhP6,"
+        "consumoEnergíaReactivaEnVArhP1,consumoEnergíaReactivaEnVArhP2,consumoEnergíaReactivaEnVArhP3,"
+        "consumoEnergíaReactivaEnVArhP4,consumoEnergíaReactivaEnVArhP5,consumoEnergíaReactivaEnVArhP6,"
+        "potenciaDemandadaEnWP1,potenciaDemandadaEnWP2,potenciaDemandadaEnWP3,potenciaDemandadaEnWP4,"
+        "potenciaDemandadaEnWP5,potenciaDemandadaEnWP6,codigoDHEquipoDeMedida,codigoTipoLectura\n"
+        "ES0022000007481662PW1P,2020-05-31,2020-06-16,003,66000,127000,5000,,0,0,"
+        "15000,28000,1000,0,0,0,10,10,10,10,10,10,,\n"
+    )
+    reader = ConsumptionElectricityReader()
+    reader.set_credentials("a", "b")
+
+    result = reader.get_monthly(["ES0022000007481662PW1P", "ES0022000007481662PW1Q"])
+
+    assert result["ES0022000007481662PW1Q"] == []
+    month = result["ES0022000007481662PW1P"][0]
+    assert month.start_date == date.fromisoformat("2020-05-31")
+    assert month.end_date == date.fromisoformat("2020-06-16")
+    assert month.rate_code == "003"
+    assert month.active_energy_p2 == 127000
+    assert month.active_energy_p4 == 0
+    assert month.reactive_energy_p1 == 15000
+    assert month.demanded_power_p6 == 10
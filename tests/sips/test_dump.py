@@ -0,0 +1,90 @@
+from datetime import date
+from io import StringIO
+
+from src.services.sips import get_sips_reader
+from src.sips.dump import UNDATED_RECORD_DATE, SIPSDumpImporter, SIPSDumpStore
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import SIPSTypes
+
+CONSUMPTION_CSV = """cups,fechaInicioMesConsumo,fechaFinMesConsumo,consumoEnergiaActivaEnWhP1
+ES0001,2023-01-01,2023-01-31,1000
+ES0001,2023-02-01,2023-02-28,2000
+ES0002,2023-02-01,,3000
+,2023-02-01,2023-02-28,4000
+"""
+
+
+def test_dump_importer_import_file_in_chunks(mocker):
+    copied_chunks = []
+    mocker.patch("src.sips.dump.create_sips_dump_stage")
+    mocker.patch(
+        "src.sips.dump.copy_sips_dump_stage",
+        side_effect=lambda db, buffer: copied_chunks.append(buffer.read()),
+    )
+    mocker.patch("src.sips.dump.merge_sips_dump_stage", return_value=2)
+    importer = SIPSDumpImporter(None, SIPSTypes.CONSUMOS_ELECTRICIDAD, chunk_size=2)
+
+    imported = importer.import_file(StringIO(CONSUMPTION_CSV))
+
+    assert imported == 4
+    assert len(copied_chunks) == 2
+    assert copied_chunks[0].startswith("CONSUMOS_ELECTRICIDAD,ES0001,2023-01-31,")
+    assert copied_chunks[1].startswith("CONSUMOS_ELECTRICIDAD,ES0002,1970-01-01,")
+
+
+def test_dump_importer_import_file_since(mocker):
+    copied_chunks = []
+    mocker.patch("src.sips.dump.create_sips_dump_stage")
+    mocker.patch(
+        "src.sips.dump.copy_sips_dump_stage",
+        side_effect=lambda db, buffer: copied_chunks.append(buffer.read()),
+    )
+    mocker.patch("src.sips.dump.merge_sips_dump_stage", return_value=2)
+    importer = SIPSDumpImporter(None, SIPSTypes.CONSUMOS_ELECTRICIDAD)
+
+    importer.import_file(StringIO(CONSUMPTION_CSV), since=date(2023, 2, 1))
+
+    rows = copied_chunks[0].splitlines()
+    assert len(rows) == 2
+    assert "2023-01-31" not in copied_chunks[0]
+
+
+def test_dump_importer_get_record_date_invalid():
+    importer = SIPSDumpImporter(None, SIPSTypes.PS_ELECTRICIDAD)
+
+    assert importer.get_record_date({"fechaUltimaLectura": "-"}) == UNDATED_RECORD_DATE
+
+
+def test_dump_store_get(mocker):
+    get_records_mock = mocker.patch(
+        "src.sips.dump.get_sips_dump_records",
+        return_value=[mocker.Mock(cups="ES0001", data={"cups": "ES0001"})],
+    )
+
+    result = SIPSDumpStore(None).get(SIPSTypes.PS_ELECTRICIDAD, ["ES0001", "ES0002"])
+
+    assert result == {"ES0001": [{"cups": "ES0001"}]}
+    assert get_records_mock.call_args.kwargs == {"latest_only": True}
+
+
+def test_reader_read_offline_from_dump(mocker):
+    request_mock = mocker.patch("src.sips.reader.requests")
+    dump_store = mocker.Mock()
+    dump_store.get.return_value = {"1": [{"cups": "1", "a": "dump"}]}
+    reader = PsElectricityReader()
+    reader.set_dump_store(dump_store, offline=True)
+
+    result = reader.get(["1", "2"], force_refresh=True)
+
+    assert result == {"1": {"cups": "1", "a": "dump"}}
+    request_mock.get.assert_not_called()
+
+
+def test_get_sips_reader_offline_without_dump_enabled(mocker):
+    mocker.patch("src.services.sips.settings.SIPS_DUMP_ENABLED", False)
+    mocker.patch("src.services.sips.settings.SIPS_OFFLINE", True)
+
+    reader = get_sips_reader(None, PsElectricityReader)
+
+    assert isinstance(reader.dump_store, SIPSDumpStore)
+    assert reader.offline
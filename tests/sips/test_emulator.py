@@ -0,0 +1,64 @@
+import csv
+from io import StringIO
+
+from starlette.testclient import TestClient
+
+from src.sips.emulator import SIPSFixtures, create_app
+
+URL = "/verticales/v1/SIPS/consulta/v1/{}.csv"
+
+
+def read_csv(text: str):
+    return list(csv.DictReader(StringIO(text)))
+
+
+def test_sips_emulator_generates_rows():
+    client = TestClient(create_app(SIPSFixtures(months=6)))
+
+    response = client.get(
+        URL.format("SIPS2_CONSUMOS_ELECTRICIDAD"),
+        params={"cups": "ES0001000000000001AB,ES0001000000000002AB"},
+    )
+
+    assert response.status_code == 200
+    rows = read_csv(response.text)
+    assert len(rows) == 12
+    assert {row["cups"] for row in rows} == {
+        "ES0001000000000001AB",
+        "ES0001000000000002AB",
+    }
+
+
+def test_sips_emulator_rows_are_deterministic():
+    client = TestClient(create_app())
+    params = {"cups": "ES0001000000000001AB"}
+
+    first = client.get(URL.format("SIPS2_PS_ELECTRICIDAD"), params=params)
+    second = client.get(URL.format("SIPS2_PS_ELECTRICIDAD"), params=params)
+
+    assert first.text == second.text
+    assert len(read_csv(first.text)) == 1
+
+
+def test_sips_emulator_recorded_fixtures(tmp_path):
+    (tmp_path / "SIPS2_PS_GAS.csv").write_text("cups,codigoPresion\nES0001GAS,01\n")
+    client = TestClient(create_app(SIPSFixtures(tmp_path, generate=False)))
+
+    response = client.get(
+        URL.format("SIPS2_PS_GAS"), params={"cups": "ES0001GAS,ES0002GAS"}
+    )
+
+    rows = read_csv(response.text)
+    assert [(row["cups"], row["codigoPresion"]) for row in rows] == [
+        ("ES0001GAS", "01")
+    ]
+
+
+def test_sips_emulator_errors():
+    client = TestClient(create_app(error_rate=1))
+
+    assert (
+        client.get(URL.format("SIPS2_PS_GAS"), params={"cups": "a"}).status_code == 500
+    )
+    assert client.get(URL.format("SIPS2_PS_GAS")).status_code == 400
+    assert client.get(URL.format("UNKNOWN"), params={"cups": "a"}).status_code == 404
@@ -0,0 +1,158 @@
+from types import SimpleNamespace
+
+from src.modules.supply_points.models import CounterType
+from src.sips.ps_electricity import PsElectricityReader
+from src.sips.reader import ReaderException
+from src.sips.refresh import SupplyPointRefresher, get_technical_data
+
+
+def supply_point(id, cups, max_available_power=None, counter_type=None):
+    return SimpleNamespace(
+        id=id,
+        cups=cups,
+        max_available_power=max_available_power,
+        counter_type=counter_type,
+    )
+
+
+def test_get_technical_data():
+    data = get_technical_data(
+        {
+            "potenciaMaximaAPMW": "",
+            "potenciaMaximaBIEW": "5750",
+            "codigoTelegestion": "01",
+        }
+    )
+
+    assert data == {
+        "max_available_power": 5750,
+        "counter_type": CounterType.telematic,
+    }
+
+
+def test_get_technical_data_unknown_codes():
+    data = get_technical_data({"potenciaMaximaAPMW": "0", "codigoTelegestion": "99"})
+
+    assert data == {}
+
+
+def test_supply_point_refresher_get_changes():
+    supply_points = [
+        supply_point(1, "ES0001", 5750, CounterType.telematic),
+        supply_point(2, "ES0002", 3450, CounterType.telematic),
+        supply_point(3, "ES0003"),
+    ]
+    rows = {
+        "ES0001": {"potenciaMaximaAPMW": "5750"},
+        "ES0002": {"potenciaMaximaAPMW": "5750"},
+    }
+
+    changes = SupplyPointRefresher.get_changes(supply_points, rows)
+
+    assert changes == [{"id": 2, "max_available_power": 5750}]
+
+
+def test_supply_point_refresher_run(mocker, tmp_path):
+    batches = [
+        [supply_point(1, "ES0001"), supply_point(2, "ES0002")],
+        [supply_point(5, "ES0005")],
+        [],
+    ]
+    get_batch_mock = mocker.patch(
+        "src.sips.refresh.get_supply_points_batch", side_effect=batches
+    )
+    get_by_ids_mock = mocker.patch(
+        "src.sips.refresh.get_supply_points_by_ids",
+        return_value=[supply_point(5, "ES0005")],
+    )
+    update_mock = mocker.patch("src.sips.refresh.bulk_update_supply_points")
+    reader = PsElectricityReader()
+    reader.set_credentials("a", "b")
+
+    def fetch(sips_type, cups):
+        if cups == ["ES0005"]:
+            raise ReaderException(code=500, message="Invalid status response")
+        return [{"cups": cup, "codigoTelegestion": "03"} for cup in cups]
+
+    mocker.patch.object(reader, "fetch", side_effect=fetch)
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text('{"last_id": 0, "processed": 0, "updated": 0, "failed": 0}')
+
+    refresher = SupplyPointRefresher(
+        None, reader, batch_size=2, request_size=1, workers=2, checkpoint=checkpoint
+    )
+    refresher.load_checkpoint()
+    stats = refresher.run()
+
+    assert stats == {
+        "last_id": 5,
+        "processed": 3,
+        "updated": 2,
+        "failed": 1,
+        "failed_ids": [5],
+    }
+    assert [call.args[1] for call in get_batch_mock.call_args_list] == [0, 2, 5]
+    get_by_ids_mock.assert_called_once_with(None, [5])
+    update_mock.assert_any_call(
+        None,
+        [
+            {"id": 1, "counter_type": CounterType.normal},
+            {"id": 2, "counter_type": CounterType.normal},
+        ],
+    )
+    assert not checkpoint.exists()
+
+
+def test_supply_point_refresher_resumes_from_checkpoint(mocker, tmp_path):
+    get_batch_mock = mocker.patch(
+        "src.sips.refresh.get_supply_points_batch", return_value=[]
+    )
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text('{"last_id": 42, "processed": 42, "updated": 3, "failed": 0}')
+
+    refresher = SupplyPointRefresher(None, PsElectricityReader(), checkpoint=checkpoint)
+    refresher.load_checkpoint()
+    stats = refresher.run()
+
+    assert get_batch_mock.call_args.args[1] == 42
+    assert stats["processed"] == 42
+
+
+def test_supply_point_refresher_retries_failed_ids_of_checkpoint(mocker, tmp_path):
+    mocker.patch("src.sips.refresh.get_supply_points_batch", return_value=[])
+    get_by_ids_mock = mocker.patch(
+        "src.sips.refresh.get_supply_points_by_ids",
+        return_value=[supply_point(7, "ES0007"), supply_point(9, "ES0009")],
+    )
+    update_mock = mocker.patch("src.sips.refresh.bulk_update_supply_points")
+    reader = PsElectricityReader()
+    reader.set_credentials("a", "b")
+    mocker.patch.object(
+        reader,
+        "fetch",
+        side_effect=lambda sips_type, cups: [
+            {"cups": cup, "codigoTelegestion": "01"} for cup in cups
+        ],
+    )
+    checkpoint = tmp_path / "checkpoint.json"
+    checkpoint.write_text(
+        '{"last_id": 42, "processed": 42, "updated": 3, "failed": 2, '
+        '"failed_ids": [7, 9]}'
+    )
+
+    refresher = SupplyPointRefresher(None, reader, checkpoint=checkpoint)
+    refresher.load_checkpoint()
+    stats = refresher.run()
+
+    get_by_ids_mock.assert_called_once_with(None, [7, 9])
+    update_mock.assert_called_once_with(
+        None,
+        [
+            {"id": 7, "counter_type": CounterType.telematic},
+            {"id": 9, "counter_type": CounterType.telematic},
+        ],
+    )
+    assert stats["updated"] == 5
+    assert stats["failed"] == 0
+    assert stats["failed_ids"] == []
+    assert not checkpoint.exists()
@@ -1,7 +1,30 @@
-from fastapi import Request
+import logging
 
+from fastapi import HTTPException, Request, status
+from starlette.routing import Match
+
+from config.settings import settings
+from src.infrastructure.compression import CompressionMiddleware
+from src.infrastructure.sqlalchemy.queries import start_query_stats
+from src.services.exceptions import custom_exception
 from utils.i18n import active_translation
 
+logger = logging.getLogger(__name__)
+
+# Methods QUERY_BUDGET_FAIL answers with a 500, the rest are only logged
+SAFE_METHODS = ("GET", "HEAD")
+
+
+def get_endpoint_name(request: Request) -> str:
+    """
+    Method and path template of the route of the request, e.g. GET /api/clients/{id}
+    """
+    for route in request.app.router.routes:
+        match, _ = route.matches(request.scope)
+        if match == Match.FULL:
+            return f"{request.method} {route.path}"
+    return f"{request.method} {request.url.path}"
+
 
 def add_middlewares(app):
     @app.middleware("http")
@@ -9,3 +32,50 @@ def add_middlewares(app):
         active_translation(request.headers.get("accept-language"))
         response = await call_next(request)
         return response
+
+    @app.middleware("http")
+    async def cache_headers(request: Request, call_next):
+        response = await call_next(request)
+        headers = getattr(request.state, "cache_headers", None)
+        if headers and response.status_code == status.HTTP_200_OK:
+            response.headers.update(headers)
+        return response
+
+    @app.middleware("http")
+    async def count_queries(request: Request, call_next):
+        stats = start_query_stats()
+        response = await call_next(request)
+
+        if settings.QUERY_STATS_HEADERS:
+            response.headers["X-DB-Query-Count"] = str(stats.count)
+            response.headers["X-DB-Query-Time"] = f"{stats.duration * 1000:.1f}"
+
+        endpoint = get_endpoint_name(request)
+        budget = settings.QUERY_BUDGETS.get(endpoint, settings.QUERY_BUDGET_DEFAULT)
+        if budget is not None and stats.count > budget:
+            logger.warning(
+                "[%s] %s queries executed, the budget is %s (%.1f ms)",
+                endpoint,
+                stats.count,
+                budget,
+                stats.duration * 1000,
+            )
+            # Writes have been committed by now, failing them would make clients
+            # retry what succeeded, so they are only logged
+            if settings.QUERY_BUDGET_FAIL and request.method in SAFE_METHODS:
+                return custom_exception(
+                    HTTPException(
+                        status.HTTP_500_INTERNAL_SERVER_ERROR, "query_budget_exceeded"
+                    )
+                )
+        return response
+
+    # Added last so it wraps the others, which see the responses uncompressed
+    if settings.COMPRESSION_ENABLED:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.COMPRESSION_MINIMUM_SIZE,
+            content_types=settings.COMPRESSION_CONTENT_TYPES,
+            gzip_level=settings.COMPRESSION_GZIP_LEVEL,
+            brotli_quality=settings.COMPRESSION_BROTLI_QUALITY,
+        )